@@ -1,3 +1,6 @@
 from __future__ import absolute_import
-from .assertpy import assert_that, assert_warn, soft_assertions, fail, soft_fail, add_extension, remove_extension, WarningLoggingAdapter, __version__
+from .assertpy import (assert_that, assert_warn, soft_assertions, fail, soft_fail, add_extension, remove_extension,
+                       set_message_limits, WarningLoggingAdapter, __version__)
 from .file import contents_of
+from .stream import stream
+from .snapshot import add_snapshot_type, remove_snapshot_type, flush_snapshots
@@ -34,6 +34,7 @@ import contextlib
 import inspect
 import logging
 import sys
+import threading
 import types
 from .base import BaseMixin
 from .collection import CollectionMixin
@@ -44,11 +45,16 @@ from .dynamic import DynamicMixin
 from .extracting import ExtractingMixin
 from .exception import ExceptionMixin
 from .file import FileMixin
-from .helpers import HelpersMixin
+from .helpers import HelpersMixin, _formatter
 from .numeric import NumericMixin
 from .snapshot import SnapshotMixin
 from .string import StringMixin
 
+try:
+    from contextvars import ContextVar
+except ImportError:
+    ContextVar = None
+
 __version__ = '1.1'
 
 __tracebackhide__ = True  # clean tracebacks via py.test integration
@@ -69,15 +75,81 @@ ASSERTPY_FILES = [os.path.join('assertpy', file) for file in [
     'helpers.py',
     'numeric.py',
     'snapshot.py',
+    'stream.py',
     'string.py'
 ]]
 
+
 # soft assertions
-_soft_ctx = 0
-_soft_err = []
+class _ThreadLocalVar(object):
+    """Fallback for ``contextvars.ContextVar`` on older pythons, isolates state per thread only."""
+
+    def __init__(self, name, default=None):
+        self._local = threading.local()
+        self._default = default
+
+    def get(self):
+        return getattr(self._local, 'value', self._default)
+
+    def set(self, value):
+        token = self.get()
+        self._local.value = value
+        return token
+
+    def reset(self, token):
+        self._local.value = token
+
+
+if ContextVar is not None:
+    _soft_state = ContextVar('assertpy_soft_state', default=None)
+else:
+    _soft_state = _ThreadLocalVar('assertpy_soft_state', default=None)
+
+
+class _Awaitable(object):
+    """Trivial awaitable that completes immediately, used by ``async with soft_assertions()``."""
+
+    def __await__(self):
+        return iter(())
+
+
+class _SoftAssertions(object):
+    """Soft assertion context, see :meth:`soft_assertions`."""
+
+    __slots__ = ('errors', 'parent', 'open', '_token')
+
+    def __enter__(self):
+        self.parent = _soft_state.get()
+        self.errors = []
+        self.open = True
+        self._token = _soft_state.set(self)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _soft_state.reset(self._token)
+        self.open = False
+
+        if self.errors and self.parent is not None and self.parent.open:
+            # nested ctx, so defer to the outermost ctx (even if exiting with an error the caller may catch)
+            self.parent.errors.extend(self.errors)
+            return False
+
+        if exc_type is not None or not self.errors:
+            return False
+
+        out = 'soft assertion failures:'
+        for i, msg in enumerate(self.errors):
+            out += '\n%d. %s' % (i+1, msg)
+        raise AssertionError(out)
+
+    def __aenter__(self):
+        self.__enter__()
+        return _Awaitable()
+
+    def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.__exit__(exc_type, exc_val, exc_tb)
+        return _Awaitable()
 
 
-@contextlib.contextmanager
 def soft_assertions():
     """Create a soft assertion context.
 
@@ -113,28 +185,19 @@ def soft_assertions():
         failure with :meth:`fail` will similarly halt execution immediately.  If you need more
         forgiving behavior, use :meth:`soft_fail` to add a failure message without halting test
         execution.
-    """
-    global _soft_ctx
-    global _soft_err
 
-    # init ctx
-    if _soft_ctx == 0:
-        _soft_err = []
-    _soft_ctx += 1
+    The soft assertion context is isolated per thread and per ``asyncio`` task (via ``contextvars``),
+    so validations can safely run in parallel.  Inside a coroutine, use the ``async with`` form::
 
-    try:
-        yield
-    finally:
-        # reset ctx
-        _soft_ctx -= 1
+        async def test_something():
+            async with soft_assertions():
+                assert_that(await fetch('foo')).is_length(4)
+                assert_that(await fetch('bar')).is_empty()
 
-    if _soft_err and _soft_ctx == 0:
-        out = 'soft assertion failures:'
-        for i, msg in enumerate(_soft_err):
-            out += '\n%d. %s' % (i+1, msg)
-        # reset msg, then raise
-        _soft_err = []
-        raise AssertionError(out)
+    Nested contexts (in the same thread or task) defer to the outermost context, which raises all
+    collected failures at once.
+    """
+    return _SoftAssertions()
 
 
 # factory methods
@@ -159,8 +222,7 @@ def assert_that(val, description=''):
                 assert_that('foobar').is_length(6).starts_with('foo').ends_with('bar')
                 assert_that(['a', 'b', 'c']).contains('a').does_not_contain('x')
     """
-    global _soft_ctx
-    if _soft_ctx:
+    if _soft_state.get() is not None:
         return _builder(val, description, 'soft')
     return _builder(val, description)
 
@@ -266,14 +328,55 @@ def soft_fail(msg=''):
             3. Expected <foo> to be equal to <bar>, but was not.
 
     """
-    global _soft_ctx
-    if _soft_ctx:
-        global _soft_err
-        _soft_err.append('Fail: %s!' % msg if msg else 'Fail!')
+    state = _soft_state.get()
+    if state is not None:
+        state.errors.append('Fail: %s!' % msg if msg else 'Fail!')
         return
     fail(msg)
 
 
+def set_message_limits(max_length=None, max_items=None, max_depth=None, full=None):
+    """Set the limits used to format values in assertion failure messages.
+
+    Failure messages include the actual value (and often the expected value), so a failing
+    assertion on a huge string or collection could spend a lot of time and memory building a
+    message nobody reads.  Instead, values are abbreviated with ``...``, in the style of ``reprlib``.
+    Small values are formatted exactly as ``str()`` would.  Formatting only happens when an
+    assertion fails.
+
+    Args:
+        max_length (int, optional): the max length of a formatted value.  Defaults to ``None`` (aka unchanged),
+            initially ``4096``
+        max_items (int, optional): the max number of items formatted per collection.  Defaults to ``None``
+            (aka unchanged), initially ``100``
+        max_depth (int, optional): the max depth of nested collections formatted.  Defaults to ``None``
+            (aka unchanged), initially ``6``
+        full (bool, optional): if ``True``, ignore all limits and format values in full.  Defaults to
+            ``None`` (aka unchanged), initially ``False``
+
+    Examples:
+        Usage::
+
+            from assertpy import assert_that, set_message_limits
+
+            set_message_limits(max_items=3)
+            assert_that(list(range(1000000))).contains(-1)  # fails
+            # Expected <[0, 1, 2, ...]> to contain item <-1>, but did not.
+
+            # turn full output back on
+            set_message_limits(full=True)
+    """
+    for name, limit in [('max_length', max_length), ('max_items', max_items), ('max_depth', max_depth)]:
+        if limit is not None:
+            if type(limit) is not int:
+                raise TypeError('given %s arg must be an int' % name)
+            if limit < 0:
+                raise ValueError('given %s arg must be a positive int' % name)
+            setattr(_formatter, name, limit)
+    if full is not None:
+        _formatter.full = bool(full)
+
+
 # assertion extensions
 _extensions = {}
 
@@ -305,10 +408,15 @@ def add_extension(func):
             def test_6():
                 assert_that(6).is_5()  # fails
                 # 6 is NOT 5!
+
+    Note:
+        The builder uses ``__slots__``, so custom assertions cannot store arbitrary attributes on
+        ``self``.  Chain to a new builder with :meth:`~AssertionBuilder.builder` instead.
     """
     if not callable(func):
         raise TypeError('func must be callable')
     _extensions[func.__name__] = func
+    _compile_extensions()
 
 
 def remove_extension(func):
@@ -328,17 +436,31 @@ def remove_extension(func):
         raise TypeError('func must be callable')
     if func.__name__ in _extensions:
         del _extensions[func.__name__]
+        _compile_extensions()
 
 
-def _builder(val, description='', kind=None, expected=None, logger=None):
-    """Internal helper to build a new :class:`AssertionBuilder` instance and glue on any extension methods."""
-    ab = AssertionBuilder(val, description, kind, expected, logger)
+def _compile_extensions():
+    """Internal helper to compile the registered extensions into a generated :class:`AssertionBuilder`
+    subclass.  Only called when the registry changes, so building an assertion costs the same no matter
+    how many extensions are registered."""
+    global _builder_class
     if _extensions:
-        # glue extension method onto new builder instance
+        methods = {}
         for name, func in _extensions.items():
-            meth = types.MethodType(func, ab)
-            setattr(ab, name, meth)
-    return ab
+            if isinstance(func, types.FunctionType):
+                methods[name] = func
+            else:
+                # other callables (partials, callable objects, etc.) do not bind to the instance, so wrap them
+                methods[name] = (lambda f: lambda self, *args, **kwargs: f(self, *args, **kwargs))(func)
+        methods['__slots__'] = ()
+        _builder_class = type('AssertionBuilder', (AssertionBuilder,), methods)
+    else:
+        _builder_class = AssertionBuilder
+
+
+def _builder(val, description='', kind=None, expected=None, logger=None):
+    """Internal helper to build a new :class:`AssertionBuilder` instance, with any extension methods."""
+    return _builder_class(val, description, kind, expected, logger)
 
 
 # warnings
@@ -404,6 +526,8 @@ class AssertionBuilder(
         logger (Logger, optional): the logger for warning messages.  Defaults to ``None``
     """
 
+    __slots__ = ('val', 'description', 'kind', 'expected', 'logger', '_stat', '_lstat')
+
     def __init__(self, val, description='', kind=None, expected=None, logger=None):
         """Never call this constructor directly."""
         self.val = val
@@ -411,6 +535,9 @@ class AssertionBuilder(
         self.kind = kind
         self.expected = expected
         self.logger = logger if logger else _default_logger
+        # cached stat results of val, see FileMixin
+        self._stat = None
+        self._lstat = None
 
     def builder(self, val, description='', kind=None, expected=None, logger=None):
         """Helper to build a new :class:`AssertionBuilder` instance. Use this only if not chaining to ``self``.
@@ -426,6 +553,30 @@ class AssertionBuilder(
         """
         return _builder(val, description, kind, expected, logger)
 
+    def reset(self, val):
+        """Re-point this builder at the given val, without allocating a new :class:`AssertionBuilder`.
+
+        The description, kind, expected exception, and logger are kept, but any cached file stat
+        is cleared.  Useful when asserting on many values in a tight loop.
+
+        Args:
+            val: the new value to be tested (aka the actual value)
+
+        Examples:
+            Usage::
+
+                ab = assert_that(None)
+                for record in records:
+                    ab.reset(record).is_not_none().contains_key('id')
+
+        Returns:
+            AssertionBuilder: returns this instance to chain to the next assertion
+        """
+        self.val = val
+        self._stat = None
+        self._lstat = None
+        return self
+
     def error(self, msg):
         """Helper to raise an ``AssertionError`` with the given message.
 
@@ -455,8 +606,12 @@ class AssertionBuilder(
             self.logger.warning(out)
             return self
         elif self.kind == 'soft':
-            global _soft_err
-            _soft_err.append(out)
-            return self
-        else:
-            raise AssertionError(out)
+            state = _soft_state.get()
+            if state is not None:
+                state.errors.append(out)
+                return self
+        raise AssertionError(out)
+
+
+# extension methods are compiled into a subclass of the builder, see _compile_extensions()
+_builder_class = AssertionBuilder
@@ -26,12 +26,17 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+from .stream import Stream
+from .helpers import _column_values
+
 __tracebackhide__ = True
 
 
 class BaseMixin(object):
     """Base mixin."""
 
+    __slots__ = ()
+
     def described_as(self, description):
         """Describes the assertion.  On failure, the description is included in the error message.
 
@@ -122,8 +127,9 @@ class BaseMixin(object):
             if self._dict_not_equal(self.val, other, ignore=kwargs.get('ignore'), include=kwargs.get('include')):
                 self._dict_err(self.val, other, ignore=kwargs.get('ignore'), include=kwargs.get('include'))
         else:
-            if self.val != other:
-                return self.error('Expected <%s> to be equal to <%s>, but was not.' % (self.val, other))
+            # numeric columns (see extracting) compare as lists
+            if _column_values(self.val) != _column_values(other):
+                return self.error('Expected <%s> to be equal to <%s>, but was not.' % (self._fmt_val(self.val), self._fmt_val(other)))
         return self
 
     def is_not_equal_to(self, other):
@@ -152,8 +158,8 @@ class BaseMixin(object):
         Raises:
             AssertionError: if actual **is** equal to expected
         """
-        if self.val == other:
-            return self.error('Expected <%s> to be not equal to <%s>, but was.' % (self.val, other))
+        if _column_values(self.val) == _column_values(other):
+            return self.error('Expected <%s> to be not equal to <%s>, but was.' % (self._fmt_val(self.val), self._fmt_val(other)))
         return self
 
     def is_same_as(self, other):
@@ -195,7 +201,7 @@ class BaseMixin(object):
             AssertionError: if actual is **not** identical to expected
         """
         if self.val is not other:
-            return self.error('Expected <%s> to be identical to <%s>, but was not.' % (self.val, other))
+            return self.error('Expected <%s> to be identical to <%s>, but was not.' % (self._fmt_val(self.val), self._fmt_val(other)))
         return self
 
     def is_not_same_as(self, other):
@@ -226,7 +232,7 @@ class BaseMixin(object):
             AssertionError: if actual **is** identical to expected
         """
         if self.val is other:
-            return self.error('Expected <%s> to be not identical to <%s>, but was.' % (self.val, other))
+            return self.error('Expected <%s> to be not identical to <%s>, but was.' % (self._fmt_val(self.val), self._fmt_val(other)))
         return self
 
     def is_true(self):
@@ -251,7 +257,7 @@ class BaseMixin(object):
             AssertionError: if val **is** false
         """
         if not self.val:
-            return self.error('Expected <%s> to be <True>, but was not.' % self.val)
+            return self.error('Expected <%s> to be <True>, but was not.' % self._fmt_val(self.val))
         return self
 
     def is_false(self):
@@ -276,7 +282,7 @@ class BaseMixin(object):
             AssertionError: if val **is** true
         """
         if self.val:
-            return self.error('Expected <%s> to be <False>, but was not.' % self.val)
+            return self.error('Expected <%s> to be <False>, but was not.' % self._fmt_val(self.val))
         return self
 
     def is_none(self):
@@ -295,7 +301,7 @@ class BaseMixin(object):
             AssertionError: if val is **not** none
         """
         if self.val is not None:
-            return self.error('Expected <%s> to be <None>, but was not.' % self.val)
+            return self.error('Expected <%s> to be <None>, but was not.' % self._fmt_val(self.val))
         return self
 
     def is_not_none(self):
@@ -353,7 +359,7 @@ class BaseMixin(object):
             raise TypeError('given arg must be a type')
         if type(self.val) is not some_type:
             t = self._type(self.val)
-            return self.error('Expected <%s:%s> to be of type <%s>, but was not.' % (self.val, t, some_type.__name__))
+            return self.error('Expected <%s:%s> to be of type <%s>, but was not.' % (self._fmt_val(self.val), t, some_type.__name__))
         return self
 
     def is_instance_of(self, some_class):
@@ -390,7 +396,7 @@ class BaseMixin(object):
         try:
             if not isinstance(self.val, some_class):
                 t = self._type(self.val)
-                return self.error('Expected <%s:%s> to be instance of class <%s>, but was not.' % (self.val, t, some_class.__name__))
+                return self.error('Expected <%s:%s> to be instance of class <%s>, but was not.' % (self._fmt_val(self.val), t, some_class.__name__))
         except TypeError:
             raise TypeError('given arg must be a class')
         return self
@@ -422,6 +428,13 @@ class BaseMixin(object):
             raise TypeError('given arg must be an int')
         if length < 0:
             raise ValueError('given arg must be a positive int')
+        if isinstance(self.val, Stream):
+            actual = 0
+            for _ in self.val:
+                actual += 1
+            if actual != length:
+                return self.error('Expected <%s> to be of length <%d>, but was <%d>.' % (self._fmt_val(self.val), length, actual))
+            return self
         if len(self.val) != length:
-            return self.error('Expected <%s> to be of length <%d>, but was <%d>.' % (self.val, length, len(self.val)))
+            return self.error('Expected <%s> to be of length <%d>, but was <%d>.' % (self._fmt_val(self.val), length, len(self.val)))
         return self
@@ -29,6 +29,8 @@
 import sys
 import collections
 
+from .helpers import _is_column, _column_unsorted
+
 if sys.version_info[0] == 3:
     Iterable = collections.abc.Iterable
 else:
@@ -37,9 +39,15 @@ else:
 __tracebackhide__ = True
 
 
+def _identity(x):
+    return x
+
+
 class CollectionMixin(object):
     """Collection assertions mixin."""
 
+    __slots__ = ()
+
     def is_iterable(self):
         """Asserts that val is iterable collection.
 
@@ -130,7 +138,7 @@ class CollectionMixin(object):
                     missing.append({i: self.val[i]})  # bad val
             if missing:
                 return self.error('Expected <%s> to be subset of %s, but %s %s missing.' % (
-                    self.val, self._fmt_items(superdict), self._fmt_items(missing), 'was' if len(missing) == 1 else 'were'))
+                    self._fmt_val(self.val), self._fmt_items(superdict), self._fmt_items(missing), 'was' if len(missing) == 1 else 'were'))
         else:
             # flatten supersets
             superset = set()
@@ -146,16 +154,20 @@ class CollectionMixin(object):
                     missing.append(i)
             if missing:
                 return self.error('Expected <%s> to be subset of %s, but %s %s missing.' % (
-                    self.val, self._fmt_items(superset), self._fmt_items(missing), 'was' if len(missing) == 1 else 'were'))
+                    self._fmt_val(self.val), self._fmt_items(superset), self._fmt_items(missing), 'was' if len(missing) == 1 else 'were'))
 
         return self
 
-    def is_sorted(self, key=lambda x: x, reverse=False):
+    def is_sorted(self, key=None, reverse=False):
         """Asserts that val is iterable and is sorted.
 
+        If val is a numeric column (an ``array.array`` or numpy ``ndarray``, see
+        :meth:`~assertpy.extracting.ExtractingMixin.extracting` with ``columnar=True``) and no key is given,
+        the check is vectorized.
+
         Args:
             key (function): the one-arg function to extract the sort comparison key.  Defaults to
-                ``lambda x: x`` to just compare items directly.
+                ``None`` to just compare items directly.
             reverse (bool): if ``True``, then comparison key is reversed.  Defaults to ``False``.
 
         Examples:
@@ -183,14 +195,25 @@ class CollectionMixin(object):
         if not isinstance(self.val, Iterable):
             raise TypeError('val is not iterable')
 
+        if key is None:
+            if _is_column(self.val):
+                i = _column_unsorted(self.val, reverse)
+                if i is not None:
+                    return self.error('Expected <%s> to be sorted%s, but subset %s at index %s is not.' % (
+                        self._fmt_val(self.val), ' reverse' if reverse else '', self._fmt_items([self.val[i], self.val[i+1]]), i))
+                return self
+            key = _identity
+
         for i, x in enumerate(self.val):
             if i > 0:
                 if reverse:
                     if key(x) > key(prev):
-                        return self.error('Expected <%s> to be sorted reverse, but subset %s at index %s is not.' % (self.val, self._fmt_items([prev, x]), i-1))
+                        return self.error('Expected <%s> to be sorted reverse, but subset %s at index %s is not.' % (
+                            self._fmt_val(self.val), self._fmt_items([prev, x]), i-1))
                 else:
                     if key(x) < key(prev):
-                        return self.error('Expected <%s> to be sorted, but subset %s at index %s is not.' % (self.val, self._fmt_items([prev, x]), i-1))
+                        return self.error('Expected <%s> to be sorted, but subset %s at index %s is not.' % (
+                            self._fmt_val(self.val), self._fmt_items([prev, x]), i-1))
             prev = x
 
         return self
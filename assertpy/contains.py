@@ -26,6 +26,7 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import re
 import sys
 
 if sys.version_info[0] == 3:
@@ -35,12 +36,84 @@ else:
     str_types = (basestring,)
     xrange = xrange
 
+from .stream import Stream
+
 __tracebackhide__ = True
 
 
+def _kmp_search(iterable, pattern):
+    """Helper to search for the given pattern (a sequence) in the given iterable, using Knuth-Morris-Pratt.
+    Linear time, and consumes the iterable in a single streaming pass (no ``len()`` or ``[]`` needed)."""
+    m = len(pattern)
+    table = [0] * m
+    k = 0
+    for i in xrange(1, m):
+        while k > 0 and pattern[i] != pattern[k]:
+            k = table[k-1]
+        if pattern[i] == pattern[k]:
+            k += 1
+        table[i] = k
+
+    k = 0
+    for x in iterable:
+        while k > 0 and x != pattern[k]:
+            k = table[k-1]
+        if x == pattern[k]:
+            k += 1
+            if k == m:
+                return True
+    return False
+
+
+def _stream_missing(iterable, items):
+    """Helper to find which of the given items are missing from the given iterable, in a single streaming pass
+    that stops early once all items are found.  Returns the indexes of the missing items."""
+    pending = list(xrange(len(items)))
+    try:
+        index = set(items)
+    except TypeError:
+        index = None
+    for x in iterable:
+        if index is not None:
+            try:
+                if x not in index:
+                    continue
+            except TypeError:
+                pass
+        pending = [j for j in pending if items[j] != x]
+        if not pending:
+            break
+    return pending
+
+
+def _native_search(val, items):
+    """Helper to search for the given items in the given string, bytes, or memoryview using native
+    substring search.  Returns ``None`` if val is not one of those, or items are not single elements."""
+    if isinstance(val, str_types):
+        if all(isinstance(i, str_types) and len(i) == 1 for i in items):
+            return val.find(val[:0].join(items)) >= 0
+    elif isinstance(val, (bytes, bytearray, memoryview)):
+        if isinstance(val, memoryview) and (val.itemsize != 1 or val.ndim != 1 or val.format not in ('B', 'b', 'c')):
+            # elements are not single bytes, so the raw buffer can't be searched
+            return None
+        low = -128 if isinstance(val, memoryview) and val.format == 'b' else 0
+        if all(type(i) is int and low <= i < low + 256 for i in items):
+            pattern = bytes(bytearray(i & 0xff for i in items))
+            if isinstance(val, memoryview):
+                try:
+                    # regex search works directly on the buffer, without copying it
+                    return re.search(re.escape(pattern), val) is not None
+                except (TypeError, ValueError):
+                    return None
+            return val.find(pattern) >= 0
+    return None
+
+
 class ContainsMixin(object):
     """Containment assertions mixin."""
 
+    __slots__ = ()
+
     def contains(self, *items):
         """Asserts that val contains the given item or items.
 
@@ -78,20 +151,27 @@ class ContainsMixin(object):
         elif len(items) == 1:
             if items[0] not in self.val:
                 if self._check_dict_like(self.val, return_as_bool=True):
-                    return self.error('Expected <%s> to contain key <%s>, but did not.' % (self.val, items[0]))
+                    return self.error('Expected <%s> to contain key <%s>, but did not.' % (self._fmt_val(self.val), self._fmt_val(items[0])))
                 else:
-                    return self.error('Expected <%s> to contain item <%s>, but did not.' % (self.val, items[0]))
+                    return self.error('Expected <%s> to contain item <%s>, but did not.' % (self._fmt_val(self.val), self._fmt_val(items[0])))
         else:
-            missing = []
-            for i in items:
-                if i not in self.val:
-                    missing.append(i)
+            if isinstance(self.val, Stream):
+                missing = [items[j] for j in _stream_missing(self.val, items)]
+            else:
+                # index list-like val once, instead of scanning it for each item
+                index = self._hash_index(self.val, items)
+                container = self.val if index is None else index
+                missing = []
+                for i in items:
+                    if i not in container:
+                        missing.append(i)
             if missing:
                 if self._check_dict_like(self.val, return_as_bool=True):
                     return self.error('Expected <%s> to contain keys %s, but did not contain key%s %s.' % (
-                        self.val, self._fmt_items(items), '' if len(missing) == 0 else 's', self._fmt_items(missing)))
+                        self._fmt_val(self.val), self._fmt_items(items), '' if len(missing) == 0 else 's', self._fmt_items(missing)))
                 else:
-                    return self.error('Expected <%s> to contain items %s, but did not contain %s.' % (self.val, self._fmt_items(items), self._fmt_items(missing)))
+                    return self.error('Expected <%s> to contain items %s, but did not contain %s.' % (
+                        self._fmt_val(self.val), self._fmt_items(items), self._fmt_items(missing)))
         return self
 
     def does_not_contain(self, *items):
@@ -126,14 +206,21 @@ class ContainsMixin(object):
             raise ValueError('one or more args must be given')
         elif len(items) == 1:
             if items[0] in self.val:
-                return self.error('Expected <%s> to not contain item <%s>, but did.' % (self.val, items[0]))
+                return self.error('Expected <%s> to not contain item <%s>, but did.' % (self._fmt_val(self.val), self._fmt_val(items[0])))
         else:
-            found = []
-            for i in items:
-                if i in self.val:
-                    found.append(i)
+            if isinstance(self.val, Stream):
+                missing = set(_stream_missing(self.val, items))
+                found = [i for j, i in enumerate(items) if j not in missing]
+            else:
+                index = self._hash_index(self.val, items)
+                container = self.val if index is None else index
+                found = []
+                for i in items:
+                    if i in container:
+                        found.append(i)
             if found:
-                return self.error('Expected <%s> to not contain items %s, but did contain %s.' % (self.val, self._fmt_items(items), self._fmt_items(found)))
+                return self.error('Expected <%s> to not contain items %s, but did contain %s.' % (
+                    self._fmt_val(self.val), self._fmt_items(items), self._fmt_items(found)))
         return self
 
     def contains_only(self, *items):
@@ -162,25 +249,33 @@ class ContainsMixin(object):
         if len(items) == 0:
             raise ValueError('one or more args must be given')
         else:
+            # index list-like val and items once, instead of scanning them for each item
+            index = self._hash_index(self.val, items)
+            allowed = items if index is None else set(items)
             extra = []
             for i in self.val:
-                if i not in items:
+                if i not in allowed:
                     extra.append(i)
             if extra:
-                return self.error('Expected <%s> to contain only %s, but did contain %s.' % (self.val, self._fmt_items(items), self._fmt_items(extra)))
+                return self.error('Expected <%s> to contain only %s, but did contain %s.' % (
+                    self._fmt_val(self.val), self._fmt_items(items), self._fmt_items(extra)))
 
+            container = self.val if index is None else index
             missing = []
             for i in items:
-                if i not in self.val:
+                if i not in container:
                     missing.append(i)
             if missing:
-                return self.error('Expected <%s> to contain only %s, but did not contain %s.' % (self.val, self._fmt_items(items), self._fmt_items(missing)))
+                return self.error('Expected <%s> to contain only %s, but did not contain %s.' % (
+                    self._fmt_val(self.val), self._fmt_items(items), self._fmt_items(missing)))
         return self
 
     def contains_sequence(self, *items):
         """Asserts that val contains the given ordered sequence of items.
 
-        Checks if the collection contains the given sequence of items using ``in`` operator.
+        Checks if the collection contains the given sequence of items in linear time.  Strings, bytes,
+        and memoryviews use native substring search.  Any other iterable, including iterators and
+        generators, is consumed in a single streaming pass (via Knuth-Morris-Pratt).
 
         Args:
             *items: the sequence of items expected to be contained
@@ -192,6 +287,8 @@ class ContainsMixin(object):
                 assert_that('foo').contains_sequence('o', 'o')
                 assert_that(['a', 'b', 'c']).contains_sequence('b', 'c')
                 assert_that((1, 2, 3)).contains_sequence(1, 2)
+                assert_that(b'foo').contains_sequence(ord('o'), ord('o'))
+                assert_that(iter([1, 2, 3])).contains_sequence(2, 3)
 
         Returns:
             AssertionBuilder: returns this instance to chain to the next assertion
@@ -202,16 +299,16 @@ class ContainsMixin(object):
         if len(items) == 0:
             raise ValueError('one or more args must be given')
         else:
-            try:
-                for i in xrange(len(self.val) - len(items) + 1):
-                    for j in xrange(len(items)):
-                        if self.val[i+j] != items[j]:
-                            break
-                    else:
-                        return self
-            except TypeError:
-                raise TypeError('val is not iterable')
-        return self.error('Expected <%s> to contain sequence %s, but did not.' % (self.val, self._fmt_items(items)))
+            found = _native_search(self.val, items)
+            if found is None:
+                try:
+                    it = iter(self.val)
+                except TypeError:
+                    raise TypeError('val is not iterable')
+                found = _kmp_search(it, items)
+            if found:
+                return self
+        return self.error('Expected <%s> to contain sequence %s, but did not.' % (self._fmt_val(self.val), self._fmt_items(items)))
 
     def contains_duplicates(self):
         """Asserts that val is iterable and *does* contain duplicates.
@@ -229,12 +326,19 @@ class ContainsMixin(object):
         Raises:
             AssertionError: if val does **not** contain any duplicates
         """
-        try:
-            if len(self.val) != len(set(self.val)):
-                return self
-        except TypeError:
-            raise TypeError('val is not iterable')
-        return self.error('Expected <%s> to contain duplicates, but did not.' % self.val)
+        if isinstance(self.val, Stream):
+            seen = set()
+            for x in self.val:
+                if x in seen:
+                    return self
+                seen.add(x)
+        else:
+            try:
+                if len(self.val) != len(set(self.val)):
+                    return self
+            except TypeError:
+                raise TypeError('val is not iterable')
+        return self.error('Expected <%s> to contain duplicates, but did not.' % self._fmt_val(self.val))
 
     def does_not_contain_duplicates(self):
         """Asserts that val is iterable and *does not* contain any duplicates.
@@ -252,12 +356,19 @@ class ContainsMixin(object):
         Raises:
             AssertionError: if val **does** contain duplicates
         """
+        if isinstance(self.val, Stream):
+            seen = set()
+            for x in self.val:
+                if x in seen:
+                    return self.error('Expected <%s> to not contain duplicates, but did.' % self._fmt_val(self.val))
+                seen.add(x)
+            return self
         try:
             if len(self.val) == len(set(self.val)):
                 return self
         except TypeError:
             raise TypeError('val is not iterable')
-        return self.error('Expected <%s> to not contain duplicates, but did.' % self.val)
+        return self.error('Expected <%s> to not contain duplicates, but did.' % self._fmt_val(self.val))
 
     def is_empty(self):
         """Asserts that val is empty.
@@ -277,11 +388,15 @@ class ContainsMixin(object):
         Raises:
             AssertionError: if val is **not** empty
         """
+        if isinstance(self.val, Stream):
+            for _ in self.val:
+                return self.error('Expected <%s> to be empty, but was not.' % self._fmt_val(self.val))
+            return self
         if len(self.val) != 0:
             if isinstance(self.val, str_types):
-                return self.error('Expected <%s> to be empty string, but was not.' % self.val)
+                return self.error('Expected <%s> to be empty string, but was not.' % self._fmt_val(self.val))
             else:
-                return self.error('Expected <%s> to be empty, but was not.' % self.val)
+                return self.error('Expected <%s> to be empty, but was not.' % self._fmt_val(self.val))
         return self
 
     def is_not_empty(self):
@@ -302,6 +417,10 @@ class ContainsMixin(object):
         Raises:
             AssertionError: if val **is** empty
         """
+        if isinstance(self.val, Stream):
+            for _ in self.val:
+                return self
+            return self.error('Expected not empty, but was empty.')
         if len(self.val) == 0:
             if isinstance(self.val, str_types):
                 return self.error('Expected not empty string, but was empty.')
@@ -333,7 +452,7 @@ class ContainsMixin(object):
             for i in items:
                 if self.val == i:
                     return self
-        return self.error('Expected <%s> to be in %s, but was not.' % (self.val, self._fmt_items(items)))
+        return self.error('Expected <%s> to be in %s, but was not.' % (self._fmt_val(self.val), self._fmt_items(items)))
 
     def is_not_in(self, *items):
         """Asserts that val is not equal to one of the given items.
@@ -358,5 +477,5 @@ class ContainsMixin(object):
         else:
             for i in items:
                 if self.val == i:
-                    return self.error('Expected <%s> to not be in %s, but was.' % (self.val, self._fmt_items(items)))
+                    return self.error('Expected <%s> to not be in %s, but was.' % (self._fmt_val(self.val), self._fmt_items(items)))
         return self
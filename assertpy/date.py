@@ -34,6 +34,8 @@ __tracebackhide__ = True
 class DateMixin(object):
     """Date and time assertions mixin."""
 
+    __slots__ = ()
+
     def is_before(self, other):
         """Asserts that val is a date and is before other date.
 
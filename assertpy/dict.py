@@ -32,6 +32,8 @@ __tracebackhide__ = True
 class DictMixin(object):
     """Dict assertions mixin."""
 
+    __slots__ = ()
+
     def contains_key(self, *keys):
         """Asserts the val is a dict and contains the given key or keys.  Alias for :meth:`~assertpy.contains.ContainsMixin.contains`.
 
@@ -106,7 +108,8 @@ class DictMixin(object):
             if v not in self.val.values():
                 missing.append(v)
         if missing:
-            return self.error('Expected <%s> to contain values %s, but did not contain %s.' % (self.val, self._fmt_items(values), self._fmt_items(missing)))
+            return self.error('Expected <%s> to contain values %s, but did not contain %s.' % (
+                self._fmt_val(self.val), self._fmt_items(values), self._fmt_items(missing)))
         return self
 
     def does_not_contain_value(self, *values):
@@ -138,7 +141,8 @@ class DictMixin(object):
                 if v in self.val.values():
                     found.append(v)
             if found:
-                return self.error('Expected <%s> to not contain values %s, but did contain %s.' % (self.val, self._fmt_items(values), self._fmt_items(found)))
+                return self.error('Expected <%s> to not contain values %s, but did contain %s.' % (
+                    self._fmt_val(self.val), self._fmt_items(values), self._fmt_items(found)))
         return self
 
     def contains_entry(self, *args, **kwargs):
@@ -189,7 +193,8 @@ class DictMixin(object):
             elif self.val[k] != e[k]:
                 missing.append(e)  # bad val
         if missing:
-            return self.error('Expected <%s> to contain entries %s, but did not contain %s.' % (self.val, self._fmt_items(entries), self._fmt_items(missing)))
+            return self.error('Expected <%s> to contain entries %s, but did not contain %s.' % (
+                self._fmt_val(self.val), self._fmt_items(entries), self._fmt_items(missing)))
         return self
 
     def does_not_contain_entry(self, *args, **kwargs):
@@ -232,5 +237,6 @@ class DictMixin(object):
             if k in self.val and e[k] == self.val[k]:
                 found.append(e)
         if found:
-            return self.error('Expected <%s> to not contain entries %s, but did contain %s.' % (self.val, self._fmt_items(entries), self._fmt_items(found)))
+            return self.error('Expected <%s> to not contain entries %s, but did contain %s.' % (
+                self._fmt_val(self.val), self._fmt_items(entries), self._fmt_items(found)))
         return self
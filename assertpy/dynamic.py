@@ -71,47 +71,85 @@ class DynamicMixin(object):
         assert_that(fred).has_shoe_size(12)
     """
 
+    __slots__ = ()
+
     def __getattr__(self, attr):
         """Asserts that val has attribute attr and that its value is equal to other via a dynamic
         assertion of the form ``has_<attr>()``."""
         if not attr.startswith('has_'):
             raise AttributeError('assertpy has no assertion <%s()>' % attr)
 
-        attr_name = attr[4:]
-        err_msg = False
-        is_namedtuple = isinstance(self.val, tuple) and hasattr(self.val, '_fields')
-        is_dict = isinstance(self.val, Iterable) and hasattr(self.val, '__getitem__')
+        try:
+            wrapper = _wrappers[attr]
+        except KeyError:
+            if len(_wrappers) >= _MAX_CACHED:
+                _wrappers.clear()
+            wrapper = _wrappers[attr] = _make_wrapper(attr)
+        return wrapper.__get__(self, type(self))
+
+
+# the strategy of dynamic assertions, a tuple of (get a key instead of an attribute, val is dict-like), keyed by
+# (val type, name)
+_strategies = {}
+
+# the generated dynamic assertion functions, keyed by assertion name
+_wrappers = {}
+_MAX_CACHED = 1024
+
+
+def _strategy(val, attr_name):
+    """Helper to get (and cache) the strategy for the given val type and name: a tuple of True if val is
+    dict-like (but not a namedtuple) so the name is a key, otherwise False so the name is an attribute, and
+    True if val is dict-like (including a namedtuple)."""
+    key = (type(val), attr_name)
+    try:
+        return _strategies[key]
+    except KeyError:
+        pass
+    cls = type(val)
+    is_namedtuple = issubclass(cls, tuple) and hasattr(cls, '_fields')
+    is_dict = issubclass(cls, Iterable) and hasattr(cls, '__getitem__')
+    if len(_strategies) >= _MAX_CACHED:
+        _strategies.clear()
+    strategy = _strategies[key] = (is_dict and not is_namedtuple, is_dict)
+    return strategy
+
+
+def _make_wrapper(attr):
+    """Helper to generate the dynamic assertion function for the given ``has_<name>`` assertion, once per name."""
+    attr_name = attr[4:]
+
+    def _wrapper(self, *args, **kwargs):
+        is_key, is_dict = _strategy(self.val, attr_name)
 
         if not hasattr(self.val, attr_name):
-            if is_dict and not is_namedtuple:
+            if is_key:
                 if attr_name not in self.val:
-                    err_msg = 'Expected key <%s>, but val has no key <%s>.' % (attr_name, attr_name)
-            else:
-                err_msg = 'Expected attribute <%s>, but val has no attribute <%s>.' % (attr_name, attr_name)
-
-        def _wrapper(*args, **kwargs):
-            if err_msg:
-                return self.error(err_msg)  # ok to raise AssertionError now that we are inside wrapper
+                    return self.error('Expected key <%s>, but val has no key <%s>.' % (attr_name, attr_name))
             else:
-                if len(args) != 1:
-                    raise TypeError('assertion <%s()> takes exactly 1 argument (%d given)' % (attr, len(args)))
-
-                if is_dict and not is_namedtuple:
-                    val_attr = self.val[attr_name]
-                else:
-                    val_attr = getattr(self.val, attr_name)
-
-                if callable(val_attr):
-                    try:
-                        actual = val_attr()
-                    except TypeError:
-                        raise TypeError('val does not have zero-arg method <%s()>' % attr_name)
-                else:
-                    actual = val_attr
-
-                expected = args[0]
-                if actual != expected:
-                    return self.error('Expected <%s> to be equal to <%s> on %s <%s>, but was not.' % (actual, expected, 'key' if is_dict else 'attribute', attr_name))
-            return self
-
-        return _wrapper
+                return self.error('Expected attribute <%s>, but val has no attribute <%s>.' % (attr_name, attr_name))
+
+        if len(args) != 1:
+            raise TypeError('assertion <%s()> takes exactly 1 argument (%d given)' % (attr, len(args)))
+
+        if is_key:
+            val_attr = self.val[attr_name]
+        else:
+            val_attr = getattr(self.val, attr_name)
+
+        if callable(val_attr):
+            try:
+                actual = val_attr()
+            except TypeError:
+                raise TypeError('val does not have zero-arg method <%s()>' % attr_name)
+        else:
+            actual = val_attr
+
+        expected = args[0]
+        if actual != expected:
+            return self.error('Expected <%s> to be equal to <%s> on %s <%s>, but was not.' % (
+                self._fmt_val(actual), self._fmt_val(expected), 'key' if is_dict else 'attribute', attr_name))
+        return self
+
+    _wrapper.__name__ = attr
+    return _wrapper
@@ -40,6 +40,8 @@ __tracebackhide__ = True
 class ExceptionMixin(object):
     """Expected exception mixin."""
 
+    __slots__ = ()
+
     def raises(self, ex):
         """Asserts that val is callable and set the expected exception.
 
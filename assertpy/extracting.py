@@ -26,18 +26,423 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import re
 import sys
+import types
+import numbers
+import operator
 import collections
 
+try:
+    from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+except ImportError:  # pragma: no cover
+    ThreadPoolExecutor = ProcessPoolExecutor = None
+
+from .stream import stream
+from .helpers import _to_column
+
 if sys.version_info[0] == 3:
     str_types = (str,)
+    range_type = range
     Iterable = collections.abc.Iterable
 else:
     str_types = (basestring,)
+    range_type = xrange
     Iterable = collections.Iterable
+    from itertools import ifilter as filter
+
+_Pattern = type(re.compile(''))
 
 __tracebackhide__ = True
 
+# compiled accessors, keyed by (item type, names, name types, missing policy), see _accessor()
+_accessors = {}
+_MAX_ACCESSORS = 1024
+
+# fewer items than this are extracted serially, even if workers are given
+_PARALLEL_MIN_ITEMS = 100
+
+# returned by accessors (under the skip and none missing policies) for a missing key or attribute
+_MISSING = object()
+
+
+def _is_dict_like(x):
+    """Helper to check if the given item is dict-like, same as ``_check_dict_like(x, check_values=False)``."""
+    return isinstance(x, Iterable) and callable(getattr(x, 'keys', None)) and hasattr(x, '__getitem__')
+
+
+def _is_namedtuple(x):
+    """Helper to check if the given item is a namedtuple."""
+    return isinstance(x, tuple) and hasattr(x, '_fields')
+
+
+def _is_method(x, name):
+    """Helper to check if the given name is a plain method of the given item's class (not shadowed by the instance)."""
+    return isinstance(getattr(type(x), name, None), types.FunctionType) and name not in getattr(x, '__dict__', ())
+
+
+def _split_path(x, name):
+    """Helper to split the given name into its path segments, or return ``None`` if name is not a path.
+
+    A name is a path if it is a tuple, or a string containing dots (unless the item has that literal key
+    or attribute).  Use a 1-tuple to get a key containing dots as-is.
+    """
+    if isinstance(name, tuple):
+        return name
+    if isinstance(name, str_types) and '.' in name and (_is_dict_like(x) or not hasattr(x, name)):
+        return tuple(name.split('.'))
+    return None
+
+
+def _checked_item(name):
+    """Helper to build a dict-like item getter that raises ``ValueError`` if the key is missing."""
+    def get(x):
+        if name in x:
+            return x[name]
+        raise ValueError('item keys %s did not contain key <%s>' % (list(x.keys()), name))
+    return get
+
+
+def _checked_items(getter, names):
+    """Helper to wrap the given dict-like itemgetter to raise ``ValueError`` if any key is missing."""
+    def get(x):
+        try:
+            return getter(x)
+        except KeyError:
+            for name in names:
+                if name not in x:
+                    raise ValueError('item keys %s did not contain key <%s>' % (list(x.keys()), name))
+            raise
+    return get
+
+
+def _soft_item(name):
+    """Helper to build a dict-like item getter that returns ``_MISSING`` if the key is missing."""
+    def get(x):
+        return x[name] if name in x else _MISSING
+    return get
+
+
+def _soft_index(name):
+    """Helper to build an iterable item getter that returns ``_MISSING`` if the index is out of range."""
+    def get(x):
+        try:
+            return x[name]
+        except (IndexError, KeyError):
+            return _MISSING
+    return get
+
+
+def _missing_field(name):
+    """Helper to build a namedtuple getter for a missing field that always raises ``ValueError``."""
+    def get(x):
+        raise ValueError('item attributes %s did no contain attribute <%s>' % (x._fields, name))
+    return get
+
+
+def _method_caller(name):
+    """Helper to build a getter that calls the given zero-arg method, unless the method is shadowed by an
+    instance attribute (then it's fetched like any other attribute)."""
+    call = operator.methodcaller(name)
+    shadowed = _attr_or_call(name)
+
+    def get(x):
+        if name in getattr(x, '__dict__', ()):
+            return shadowed(x)
+        try:
+            return call(x)
+        except TypeError:
+            raise ValueError('item method <%s()> exists, but is not zero-arg method' % name)
+    return get
+
+
+def _attrs_or_calls(getter, getters):
+    """Helper to wrap the given attrgetter to fall back to the given per-name getters if any attribute
+    is missing or callable, so those are handled (or reported) one by one."""
+    if len(getters) == 1:
+        def get(x):
+            try:
+                v = getter(x)
+            except AttributeError:
+                return getters[0](x)
+            return getters[0](x) if callable(v) else v
+    else:
+        def get(x):
+            try:
+                vals = getter(x)
+            except AttributeError:
+                return tuple([g(x) for g in getters])
+            return tuple([g(x) for g in getters]) if any(map(callable, vals)) else vals
+    return get
+
+
+def _attr_or_call(name, soft=False):
+    """Helper to build a getter for the given attribute or property, that calls it if callable."""
+    def get(x):
+        attr = getattr(x, name, _MISSING)
+        if attr is _MISSING:
+            if soft:
+                return _MISSING
+            raise ValueError('item does not have property or zero-arg method <%s>' % name)
+        if callable(attr):
+            try:
+                return attr()
+            except TypeError:
+                raise ValueError('item method <%s()> exists, but is not zero-arg method' % name)
+        return attr
+    return get
+
+
+def _path_getter(name, segments, soft):
+    """Helper to build a getter that follows the given path segments, compiling the getter for each
+    segment once per (depth, type)."""
+    steps = {}
+    dotted = not isinstance(name, tuple)
+
+    def get(x):
+        v = x
+        for depth, seg in enumerate(segments):
+            key = (depth, type(v))
+            step = steps.get(key)
+            if step is None:
+                step = steps[key] = _compile_name(v, seg, soft, dotted)
+            v = step(v)
+            if v is _MISSING:
+                return _MISSING
+        return v
+    if isinstance(name, tuple) and len(name) > 1:
+        return get
+
+    def get_literal_or_path(x):
+        # an existing literal key with dots wins over the path
+        return x[name] if _is_dict_like(x) and name in x else get(x)
+    return get_literal_or_path
+
+
+def _compile_name(x, name, soft, dotted=False):
+    """Helper to compile a getter for a single name (not a path) on the type of the given item.  If soft,
+    the getter returns ``_MISSING`` for a missing key or attribute, instead of raising ``ValueError``.
+    If dotted, the name is a segment of a dotted path, where digits index into iterables."""
+    if _is_dict_like(x):
+        return _soft_item(name) if soft else _checked_item(name)
+    elif _is_namedtuple(x) and type(name) is str:
+        if name in x._fields:
+            return operator.attrgetter(name)
+        return (lambda v: _MISSING) if soft else _missing_field(name)
+    elif isinstance(x, Iterable):
+        if not hasattr(x, '__getitem__'):
+            raise TypeError('item <%s> does not have [] accessor' % type(x).__name__)
+        if dotted and name.lstrip('-').isdigit():
+            name = int(name)
+        return _soft_index(name) if soft else operator.itemgetter(name)
+    elif type(name) is str and _is_method(x, name):
+        return _method_caller(name)
+    return _attr_or_call(name, soft)
+
+
+def _compile(x, names, missing):
+    """Helper to compile the accessor for the type of the given item and the given names, see :func:`_accessor`."""
+    paths = [_split_path(x, name) for name in names]
+    soft = missing != 'raise'
+
+    if not soft and all(p is None for p in paths):
+        # fast paths, fetch all names in one call
+        if _is_dict_like(x):
+            if not hasattr(type(x), '__missing__'):
+                return _checked_items(operator.itemgetter(*names), names)
+        elif _is_namedtuple(x) and all(type(n) is str for n in names):
+            if all(n in x._fields for n in names):
+                return operator.attrgetter(*names)
+        elif isinstance(x, Iterable):
+            if not hasattr(x, '__getitem__'):
+                raise TypeError('item <%s> does not have [] accessor' % type(x).__name__)
+            return operator.itemgetter(*names)
+        elif all(type(n) is str and not _is_method(x, n) for n in names):
+            # plain attributes and properties (but still called if callable)
+            return _attrs_or_calls(operator.attrgetter(*names), [_attr_or_call(n) for n in names])
+
+    getters = [_compile_name(x, name, soft) if path is None else _path_getter(name, path, soft)
+               for name, path in zip(names, paths)]
+
+    if len(getters) == 1:
+        g = getters[0]
+        if missing == 'none':
+            def accessor(x):
+                v = g(x)
+                return None if v is _MISSING else v
+            return accessor
+        return g
+
+    if missing == 'none':
+        def accessor(x):
+            return tuple([None if v is _MISSING else v for v in [g(x) for g in getters]])
+    elif missing == 'skip':
+        def accessor(x):
+            row = tuple([g(x) for g in getters])
+            return _MISSING if any(v is _MISSING for v in row) else row
+    else:
+        def accessor(x):
+            return tuple([g(x) for g in getters])
+    return accessor
+
+
+def _accessor(x, names, missing='raise'):
+    """Helper to get the accessor for the type of the given item and the given names, compiled once
+    and cached.  The accessor returns the extracted value (or tuple of values if multiple names).
+
+    The type probing (dict-like, namedtuple, iterable, or object) is done once per type, not per item.
+    """
+    try:
+        key = (type(x), names, tuple([type(n) for n in names]), missing)
+        return _accessors[key]
+    except TypeError:
+        key = None  # unhashable names, so compile but don't cache
+    except KeyError:
+        pass
+
+    accessor = _compile(x, names, missing)
+    if key is not None:
+        if len(_accessors) >= _MAX_ACCESSORS:
+            _accessors.clear()
+        _accessors[key] = accessor
+    return accessor
+
+
+def _extract_rows(rows, names, missing='raise'):
+    """Helper to lazily extract the given names from each row, looking up the accessor only when the row type changes.
+    Rows with a missing key or attribute are dropped if the missing policy is skip."""
+    last_type = accessor = None
+    for x in rows:
+        if type(x) is not last_type:
+            last_type = type(x)
+            accessor = _accessor(x, names, missing)
+        v = accessor(x)
+        if v is not _MISSING:
+            yield v
+
+
+def _extract_chunk(args):
+    """Helper to extract the given names from a chunk of rows, where any exception is re-raised with the
+    index of the failing item appended to its message.  Must be module-level, so it can be pickled for a
+    process executor."""
+    rows, names, missing, start = args
+    out = []
+    last_type = accessor = None
+    for i, x in enumerate(rows):
+        try:
+            if type(x) is not last_type:
+                last_type = type(x)
+                accessor = _accessor(x, names, missing)
+            v = accessor(x)
+        except Exception as ex:
+            ex.args = ('%s (at item index <%d>)' % (ex, start + i),)
+            raise
+        if v is not _MISSING:
+            out.append(v)
+    return out
+
+
+def _extract_parallel(rows, names, missing, workers, executor):
+    """Helper to extract the given names from the given rows, split into chunks and extracted by the given
+    number of thread or process workers, in order.  Falls back to serial for small inputs."""
+    if len(rows) < _PARALLEL_MIN_ITEMS or workers == 1 or ThreadPoolExecutor is None:
+        return _extract_chunk((rows, names, missing, 0))
+    size = max(1, -(-len(rows) // (workers * 4)))
+    chunks = [(rows[i:i+size], names, missing, i) for i in range(0, len(rows), size)]
+    pool = ThreadPoolExecutor if executor == 'thread' else ProcessPoolExecutor
+    with pool(max_workers=workers) as ex:
+        return [v for chunk in ex.map(_extract_chunk, chunks) for v in chunk]
+
+
+def _matcher(expected):
+    """Helper to compile a filter dict value into a one-arg match function, or return ``None`` if it is
+    matched by plain equality.  A set, range, or compiled regex matches by membership or search (besides
+    equality, so a set-valued item still matches an equal set)."""
+    if isinstance(expected, (set, frozenset)):
+        def match(v):
+            try:
+                return v in expected or v == expected
+            except TypeError:
+                # unhashable value, so match members by equality
+                return v == expected or any(v == e for e in expected)
+        return match
+    if isinstance(expected, range_type):
+        if not hasattr(expected, 'step'):
+            # py2 xrange has no start, stop and step
+            def match(v):
+                return v == expected or (isinstance(v, numbers.Real) and v in expected)
+            return match
+        start, stop, step = expected.start, expected.stop, expected.step
+
+        def match(v):
+            if not isinstance(v, numbers.Real):
+                return v == expected
+            # like v in expected, but without scanning the range when v is not an int (e.g. 36.0)
+            in_bounds = start <= v < stop if step > 0 else stop < v <= start
+            return in_bounds and (v - start) % step == 0
+        return match
+    if isinstance(expected, _Pattern):
+        def match(v):
+            return v == expected or (isinstance(v, type(expected.pattern)) and expected.search(v) is not None)
+        return match
+    return None
+
+
+def _equal_to(expected):
+    """Helper to build a one-arg match function for plain equality."""
+    def match(v):
+        return not v != expected
+    return match
+
+
+def _compile_filter(spec):
+    """Helper to compile the given filter (a name, a dict-like of names to values, or a function) once into a
+    single predicate, where the names are fetched with cached accessors (see :func:`_accessor`)."""
+    if callable(spec) and not _is_dict_like(spec) and not isinstance(spec, str_types):
+        return spec
+    if isinstance(spec, str_types):
+        names, test = (spec,), bool
+    elif _is_dict_like(spec):
+        names = tuple([k for k in spec if isinstance(k, str_types)])
+        if not names:
+            return lambda x: True
+        expected = [spec[k] for k in names]
+        ops = [_matcher(e) for e in expected]
+        simple = all(op is None for op in ops)
+        matchers = [_equal_to(e) if op is None else op for op, e in zip(ops, expected)]
+        if len(names) == 1:
+            test = matchers[0]
+        elif simple:
+            expected = tuple(expected)
+
+            def test(vals):
+                return not vals != expected
+        else:
+            def test(vals):
+                for m, v in zip(matchers, vals):
+                    if not m(v):
+                        return False
+                return True
+    else:
+        return lambda x: False
+
+    state = [None, None]  # last item type, and its accessor
+
+    def predicate(x):
+        if type(x) is not state[0]:
+            state[0], state[1] = type(x), _accessor(x, names)
+        try:
+            return test(state[1](x))
+        except ValueError:
+            if len(names) == 1:
+                raise
+            # a missing name, so check name by name like before to only raise if not filtered out already
+            for name, m in zip(names, matchers):
+                if not m(_accessor(x, (name,))(x)):
+                    return False
+            return True
+    return predicate
+
 
 class ExtractingMixin(object):
     """Collection flattening mixin.
@@ -72,6 +477,26 @@ class ExtractingMixin(object):
 
         assert_that(people).extracting('first_name').contains('Alice', 'Bob')
 
+    **Nested Paths**
+
+    A name can be a dotted path to reach into nested items (dict-like, namedtuple, iterable, or
+    object), where digits index into iterables.  Or a tuple path, where a 1-tuple gets a key
+    containing dots as-is::
+
+        orders = [
+            {'user': {'name': 'Alice', 'address': {'city': 'Austin'}}, 'items': [{'sku': 'A1'}]},
+            {'user': {'name': 'Bob', 'address': {'city': 'Boston'}}, 'items': [{'sku': 'B2'}]}
+        ]
+
+        assert_that(orders).extracting('user.address.city').is_equal_to(['Austin', 'Boston'])
+        assert_that(orders).extracting(('user', 'name'), 'items.0.sku').contains(('Alice', 'A1'))
+
+    By default, a missing key or attribute raises ``ValueError``, but the *missing* policy can
+    instead extract ``None`` or skip the item::
+
+        assert_that(orders).extracting('user.phone', missing='none').is_equal_to([None, None])
+        assert_that(orders).extracting('user.phone', missing='skip').is_empty()
+
     **Filtering**
 
     The ``extracting()`` helper can include a *filter* to keep only those items for which the given
@@ -92,6 +517,15 @@ class ExtractingMixin(object):
         assert_that(users).extracting('user', filter={'active': False}).is_equal_to(['Bob'])
         assert_that(users).extracting('user', filter={'age': 36, 'active': True}).is_equal_to(['Alice'])
 
+    Besides equality, a *filter* value that is a ``set`` (or ``frozenset``) or a ``range`` matches by
+    membership, and a compiled regex matches by search::
+
+        assert_that(users).extracting('user', filter={'user': {'Alice', 'Bob'}}).is_equal_to(['Alice', 'Bob'])
+        assert_that(users).extracting('user', filter={'age': range(18, 65)}).is_equal_to(['Alice', 'Bob'])
+        assert_that(users).extracting('user', filter={'user': re.compile('^[AB]')}).is_equal_to(['Alice', 'Bob'])
+
+    The *filter* is compiled just once into a single predicate, so filtering millions of items is cheap.
+
     Or a *filter* can be any function (including an in-line ``lambda``) that accepts as its single
     argument each item in the collection, and the extracted items are kept if the function
     evaluates to ``True``::
@@ -121,17 +555,30 @@ class ExtractingMixin(object):
         assert_that(users).extracting('user', sort=lambda x: -x['age']).is_equal_to(['Bob', 'Alice', 'Charlie'])
     """
 
+    __slots__ = ()
+
     def extracting(self, *names, **kwargs):
         """Asserts that val is iterable, then extracts the named attributes, properties, or
         zero-arg methods into a list (or list of tuples if multiple names are given).
 
         Args:
-            *names: the attribute to be extracted (or property or zero-arg method)
+            *names: the attribute to be extracted (or property or zero-arg method), or a dotted or tuple path
             **kwargs: see below
 
         Keyword Args:
             filter: extract only those items where filter is truthy
             sort: order the extracted items by the sort key
+            missing: the policy for a missing key or attribute, one of ``raise`` (raise ``ValueError``),
+                ``none`` (extract ``None``), or ``skip`` (skip the item).  Defaults to ``raise``
+            workers: extract in parallel with the given number of workers, see below.  Defaults to ``None``
+                (aka serial)
+            executor: the kind of parallel workers, one of ``thread`` or ``process``.  Defaults to ``thread``
+            columnar: if ``True``, extract into one compact column per name (a tuple of columns if multiple
+                names), where a column of ints or floats is a numpy ``ndarray`` (if numpy is installed) or an
+                ``array.array``, so follow-up numeric and sorting assertions are vectorized (and equality
+                assertions compare a column as a list).  Defaults to ``False``
+            lazy: if ``True``, extract items on demand into a single-pass stream (see
+                :meth:`~assertpy.stream.stream`), so the next assertion can stop early.  Defaults to ``False``
 
         Examples:
             Usage::
@@ -161,8 +608,24 @@ class ExtractingMixin(object):
 
                 assert_that(users).extracting('user', sort='age').is_equal_to(['Charlie', 'Alice', 'Bob'])
 
+            Parallel, for expensive zero-arg methods (where a ``process`` executor needs picklable items)::
+
+                assert_that(orders).extracting('compute_total', workers=8, executor='process').does_not_contain(0)
+
+            In parallel, the extracted items keep their order, and an exception raised by any item is
+            re-raised with the item index (in the filtered and sorted items) appended to its message.
+            Fewer than 100 items are always extracted serially.
+
+            Columnar, to run numeric assertions on a compact column::
+
+                assert_that(orders).extracting('total', columnar=True).is_positive().is_sorted()
+
+            Lazy, where ``contains()`` stops at the first match::
+
+                assert_that(huge_users).extracting('user', lazy=True).contains('Alice')
+
         Returns:
-            AssertionBuilder: returns a new instance (now with the extracted list as the val) to chain to the next assertion
+            AssertionBuilder: returns a new instance (now with the extracted list, or stream if lazy, as the val) to chain to the next assertion
         """
         if not isinstance(self.val, Iterable):
             raise TypeError('val is not iterable')
@@ -170,47 +633,23 @@ class ExtractingMixin(object):
             raise TypeError('val must not be string')
         if len(names) == 0:
             raise ValueError('one or more name args must be given')
+        missing = kwargs.get('missing', 'raise')
+        if missing not in ('raise', 'skip', 'none'):
+            raise ValueError('missing arg must be one of raise, skip, or none')
+        workers = kwargs.get('workers')
+        if workers is not None:
+            if type(workers) is not int:
+                raise TypeError('given workers arg must be an int')
+            if workers <= 0:
+                raise ValueError('given workers arg must be a positive int')
+        if kwargs.get('lazy') and kwargs.get('columnar'):
+            raise ValueError('lazy and columnar args cannot both be given')
+        executor = kwargs.get('executor', 'thread')
+        if executor not in ('thread', 'process'):
+            raise ValueError('executor arg must be one of thread or process')
 
         def _extract(x, name):
-            if self._check_dict_like(x, check_values=False, return_as_bool=True):
-                if name in x:
-                    return x[name]
-                else:
-                    raise ValueError('item keys %s did not contain key <%s>' % (list(x.keys()), name))
-            elif isinstance(x, tuple) and hasattr(x, '_fields') and type(name) is str:
-                if name in x._fields:
-                    return getattr(x, name)
-                else: #val has no attribute <foo>
-                    raise ValueError('item attributes %s did no contain attribute <%s>' % (x._fields, name))
-            elif isinstance(x, Iterable): # FIXME, this does __getitem__, but doesn't check for it...
-                self._check_iterable(x, name='item')
-                return x[name]
-            elif hasattr(x, name):
-                attr = getattr(x, name)
-                if callable(attr):
-                    try:
-                        return attr()
-                    except TypeError:
-                        raise ValueError('item method <%s()> exists, but is not zero-arg method' % name)
-                else:
-                    return attr
-            else:
-                raise ValueError('item does not have property or zero-arg method <%s>' % name)
-
-        def _filter(x):
-            if 'filter' in kwargs:
-                if isinstance(kwargs['filter'], str_types):
-                    return bool(_extract(x, kwargs['filter']))
-                elif self._check_dict_like(kwargs['filter'], check_values=False, return_as_bool=True):
-                    for k in kwargs['filter']:
-                        if isinstance(k, str_types):
-                            if _extract(x, k) != kwargs['filter'][k]:
-                                return False
-                    return True
-                elif callable(kwargs['filter']):
-                    return kwargs['filter'](x)
-                return False
-            return True
+            return _accessor(x, (name,))(x)
 
         def _sort(x):
             if 'sort' in kwargs:
@@ -226,11 +665,29 @@ class ExtractingMixin(object):
                     return kwargs['sort'](x)
             return 0
 
-        extracted = []
-        for i in sorted(self.val, key=lambda x: _sort(x)):
-            if _filter(i):
-                items = [_extract(i, name) for name in names]
-                extracted.append(tuple(items) if len(items) > 1 else items[0])
+        # lazy pipeline: filter first (so filtered out items are never sorted or extracted), then
+        # sort only if asked (a stable sort on a constant key would just copy val), then extract
+        rows = self.val
+        if 'filter' in kwargs:
+            rows = filter(_compile_filter(kwargs['filter']), rows)
+        if 'sort' in kwargs:
+            rows = sorted(rows, key=_sort)
+        if workers is not None:
+            extracted = _extract_parallel(list(rows), names, missing, workers, executor)
+        else:
+            extracted = _extract_rows(rows, names, missing)
+
+        if kwargs.get('columnar'):
+            # chain on with _extracted_ column (or tuple of columns, one per name)
+            if len(names) == 1:
+                return self.builder(_to_column(list(extracted)), self.description, self.kind)
+            rows = list(extracted)
+            columns = zip(*rows) if rows else [()] * len(names)
+            return self.builder(tuple([_to_column(list(c)) for c in columns]), self.description, self.kind)
+
+        if kwargs.get('lazy'):
+            # chain on with _extracted_ stream, items are extracted on demand by the next assertion
+            return self.builder(stream(extracted), self.description, self.kind)
 
         # chain on with _extracted_ list (don't chain to self!)
-        return self.builder(extracted, self.description, self.kind)
+        return self.builder(list(extracted), self.description, self.kind)
@@ -27,15 +27,204 @@
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import os
+import re
 import sys
+import mmap
+import stat
+import time
+import hashlib
+import calendar
+import datetime
+import contextlib
+import collections
+import multiprocessing
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:  # pragma: no cover
+    ThreadPoolExecutor = None
 
 if sys.version_info[0] == 3:
     str_types = (str,)
+    xrange = range
+    Iterable = collections.abc.Iterable
 else:
     str_types = (basestring,)
+    xrange = xrange
+    Iterable = collections.Iterable
 
 __tracebackhide__ = True
 
+_CHUNK_SIZE = 1024 * 1024
+_CONTEXT_SIZE = 120
+# directories with fewer queried paths than this are stat'ed path by path, not scanned
+_SCAN_MIN_PATHS = 4
+# a name missing from a scan may still exist under a different case
+_CASE_INSENSITIVE = sys.platform in ('win32', 'darwin')
+
+
+@contextlib.contextmanager
+def _mapped(path):
+    """Helper to memory-map the given file read-only, yields the map (or empty bytes for an empty file)."""
+    with open(path, 'rb') as fp:
+        if os.fstat(fp.fileno()).st_size == 0:
+            # mmap cannot map an empty file
+            yield b''
+            return
+        mm = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield mm
+        finally:
+            mm.close()
+
+
+def _to_bytes(item, name):
+    """Helper to convert the given str (as utf-8) or bytes item to bytes."""
+    if isinstance(item, bytes):
+        return item
+    if isinstance(item, str_types):
+        return item.encode('utf-8')
+    raise TypeError('given %s arg must be a string or bytes' % name)
+
+
+def _context(mm, start, end):
+    """Helper to decode only the line around the given matched region of the given map (bounded)."""
+    lo = max(start - _CONTEXT_SIZE, 0)
+    nl = mm.rfind(b'\n', lo, start)
+    lo = nl + 1 if nl >= 0 else lo
+    hi = min(end + _CONTEXT_SIZE, len(mm), lo + 4 * _CONTEXT_SIZE)
+    nl = mm.find(b'\n', end, hi)
+    hi = nl if nl >= 0 else hi
+    return mm[lo:hi].decode('utf-8', 'replace')
+
+
+def _first_diff(a, b):
+    """Helper to find the offset of the first differing byte in the given chunks, via binary search on memoryviews."""
+    a, b = memoryview(a), memoryview(b)
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if a[lo:mid+1] == b[lo:mid+1]:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def _walk_tree(root):
+    """Helper to walk the given directory tree, returns a dict of relative path (with ``/`` separators) to stat result
+    for every non-directory entry.  Symlinks are never followed, so they get the stat result of the link itself."""
+    tree = {}
+    if hasattr(os, 'scandir'):
+        stack = [('', root)]
+        while stack:
+            rel, path = stack.pop()
+            for entry in os.scandir(path):
+                name = rel + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((name + '/', entry.path))
+                else:
+                    tree[name] = entry.stat(follow_symlinks=False)
+    else:  # pragma: no cover
+        for dirpath, dirnames, filenames in os.walk(root):
+            rel = os.path.relpath(dirpath, root).replace(os.sep, '/')
+            rel = '' if rel == '.' else rel + '/'
+            for f in filenames + [d for d in dirnames if os.path.islink(os.path.join(dirpath, d))]:
+                tree[rel + f] = os.lstat(os.path.join(dirpath, f))
+    return tree
+
+
+def _same_link(st, other_st, path, other_path):
+    """Helper to compare the given tree entries, if either is a symlink: returns True if both are symlinks to the
+    same target, False if not, or None if neither is a symlink."""
+    is_link, other_is_link = stat.S_ISLNK(st.st_mode), stat.S_ISLNK(other_st.st_mode)
+    if not is_link and not other_is_link:
+        return None
+    return is_link and other_is_link and os.readlink(path) == os.readlink(other_path)
+
+
+def _path_kind(st):
+    """Helper to convert the given stat result to a kind, one of ``file``, ``dir``, ``other``, or ``None`` if not found."""
+    if st is False:
+        return None
+    return 'file' if stat.S_ISREG(st.st_mode) else 'dir' if stat.S_ISDIR(st.st_mode) else 'other'
+
+
+def _scan_paths(paths):
+    """Helper to find the kind of every given path, returns a list of kinds (see :func:`_path_kind`) in the same order.
+
+    Paths are grouped by parent directory, and each group is answered by a single ``os.scandir()`` of
+    the parent, rather than a stat per path.
+    """
+    kinds = [None] * len(paths)
+    groups = {}
+    for i, path in enumerate(paths):
+        parent, name = os.path.split(path)
+        if not name or name in ('.', '..') or not hasattr(os, 'scandir'):
+            kinds[i] = _path_kind(_stat_or_false(os.stat, path))
+        else:
+            groups.setdefault(parent or '.', []).append((i, name))
+
+    for parent, members in groups.items():
+        entries = None
+        if len(members) >= _SCAN_MIN_PATHS:
+            try:
+                entries = dict((e.name, e) for e in os.scandir(parent))
+            except (OSError, ValueError):
+                entries = {} if not os.path.isdir(parent) else None
+        for i, name in members:
+            if entries is None or (name not in entries and _CASE_INSENSITIVE):
+                kinds[i] = _path_kind(_stat_or_false(os.stat, paths[i]))
+            elif name in entries:
+                entry = entries[name]
+                if entry.is_symlink():
+                    kinds[i] = _path_kind(_stat_or_false(os.stat, paths[i]))
+                else:
+                    kinds[i] = 'file' if entry.is_file() else 'dir' if entry.is_dir() else 'other'
+    return kinds
+
+
+def _cpu_count():
+    """Helper to get the number of cpus, or 1 if unknown (``os.cpu_count()`` is py3 only)."""
+    try:
+        return multiprocessing.cpu_count()
+    except NotImplementedError:
+        return 1
+
+
+def _hash_file(path):
+    """Helper to compute the sha256 hex digest of the given file, read in fixed-size chunks."""
+    h = hashlib.sha256()
+    with open(path, 'rb') as fp:
+        for chunk in iter(lambda: fp.read(_CHUNK_SIZE), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _stat_or_false(func, path):
+    """Helper to stat the given path with the given stat function, returns ``False`` if the path is not found."""
+    try:
+        return func(path)
+    except (OSError, ValueError):
+        return False
+
+
+def _timestamp(when, name):
+    """Helper to convert the given path, datetime, or epoch seconds to epoch seconds."""
+    if isinstance(when, str_types):
+        st = _stat_or_false(os.stat, when)
+        if st is False:
+            raise ValueError('given %s arg <%s> was not found' % (name, when))
+        return st.st_mtime
+    if isinstance(when, datetime.datetime):
+        if when.utcoffset() is not None:
+            return calendar.timegm(when.utctimetuple()) + when.microsecond / 1000000.0
+        # naive datetimes are local time, same as datetime.fromtimestamp()
+        return time.mktime(when.timetuple()) + when.microsecond / 1000000.0
+    if type(when) in (int, float):
+        return when
+    raise TypeError('given %s arg must be a path, datetime, or epoch seconds' % name)
+
 
 def contents_of(file, encoding='utf-8'):
     """Helper to read the contents of the given file or path into a string with the given encoding.
@@ -91,6 +280,44 @@ def contents_of(file, encoding='utf-8'):
 class FileMixin(object):
     """File assertions mixin."""
 
+    __slots__ = ()
+
+    def _stat_val(self):
+        """Helper to stat val, returns the cached ``os.stat()`` result, or ``False`` if val is not found."""
+        if not isinstance(self.val, str_types):
+            raise TypeError('val is not a path')
+        if self._stat is None:
+            self._stat = _stat_or_false(os.stat, self.val)
+        return self._stat
+
+    def _lstat_val(self):
+        """Helper to lstat val, returns the cached ``os.lstat()`` result, or ``False`` if val is not found."""
+        if not isinstance(self.val, str_types):
+            raise TypeError('val is not a path')
+        if self._lstat is None:
+            self._lstat = _stat_or_false(os.lstat, self.val)
+        return self._lstat
+
+    def refresh_stat(self):
+        """Clears the cached stat result of val, so the next file assertion stats val again.
+
+        All file assertions on a builder share a single ``os.stat()`` result, taken by the first file
+        assertion in the chain.  Call this if the file is modified mid-chain.
+
+        Examples:
+            Usage::
+
+                ab = assert_that('out.log').is_file().has_size(0)
+                run_job()
+                ab.refresh_stat().has_size(1024)
+
+        Returns:
+            AssertionBuilder: returns this instance to chain to the next assertion
+        """
+        self._stat = None
+        self._lstat = None
+        return self
+
     def exists(self):
         """Asserts that val is a path and that it exists.
 
@@ -106,10 +333,8 @@ class FileMixin(object):
         Raises:
             AssertionError: if val does **not** exist
         """
-        if not isinstance(self.val, str_types):
-            raise TypeError('val is not a path')
-        if not os.path.exists(self.val):
-            return self.error('Expected <%s> to exist, but was not found.' % self.val)
+        if self._stat_val() is False:
+            return self.error('Expected <%s> to exist, but was not found.' % self._fmt_val(self.val))
         return self
 
     def does_not_exist(self):
@@ -127,10 +352,8 @@ class FileMixin(object):
         Raises:
             AssertionError: if val **does** exist
         """
-        if not isinstance(self.val, str_types):
-            raise TypeError('val is not a path')
-        if os.path.exists(self.val):
-            return self.error('Expected <%s> to not exist, but was found.' % self.val)
+        if self._stat_val() is not False:
+            return self.error('Expected <%s> to not exist, but was found.' % self._fmt_val(self.val))
         return self
 
     def is_file(self):
@@ -148,8 +371,9 @@ class FileMixin(object):
             AssertionError: if val does **not** exist, or is **not** a file
         """
         self.exists()
-        if not os.path.isfile(self.val):
-            return self.error('Expected <%s> to be a file, but was not.' % self.val)
+        st = self._stat_val()
+        if st is False or not stat.S_ISREG(st.st_mode):
+            return self.error('Expected <%s> to be a file, but was not.' % self._fmt_val(self.val))
         return self
 
     def is_directory(self):
@@ -167,8 +391,9 @@ class FileMixin(object):
             AssertionError: if val does **not** exist, or is **not** a directory
         """
         self.exists()
-        if not os.path.isdir(self.val):
-            return self.error('Expected <%s> to be a directory, but was not.' % self.val)
+        st = self._stat_val()
+        if st is False or not stat.S_ISDIR(st.st_mode):
+            return self.error('Expected <%s> to be a directory, but was not.' % self._fmt_val(self.val))
         return self
 
     def is_named(self, filename):
@@ -223,3 +448,583 @@ class FileMixin(object):
         if not val_abspath.startswith(parent_abspath):
             return self.error('Expected file <%s> to be a child of <%s>, but was not.' % (val_abspath, parent_abspath))
         return self
+
+    def is_older_than(self, other):
+        """Asserts that val is an existing path and that it was last modified before other.
+
+        Args:
+            other: the path to compare the modification time to, or a ``datetime``, or epoch seconds
+
+        Examples:
+            Usage::
+
+                assert_that('build/app.o').is_older_than('build/app')
+                assert_that('build/app').is_older_than(datetime.datetime.now())
+
+        Returns:
+            AssertionBuilder: returns this instance to chain to the next assertion
+
+        Raises:
+            AssertionError: if val does **not** exist, or was **not** modified before other
+        """
+        when = _timestamp(other, 'other')
+        self.exists()
+        st = self._stat_val()
+        if st is False or not st.st_mtime < when:
+            return self.error('Expected <%s> to be older than <%s>, but was not.' % (self._fmt_val(self.val), other))
+        return self
+
+    def is_newer_than(self, other):
+        """Asserts that val is an existing path and that it was last modified after other.
+
+        Args:
+            other: the path to compare the modification time to, or a ``datetime``, or epoch seconds
+
+        Examples:
+            Usage::
+
+                assert_that('build/app').is_newer_than('src/app.c')
+                assert_that('build/app').is_newer_than(datetime.datetime(2020, 1, 1))
+
+        Returns:
+            AssertionBuilder: returns this instance to chain to the next assertion
+
+        Raises:
+            AssertionError: if val does **not** exist, or was **not** modified after other
+        """
+        when = _timestamp(other, 'other')
+        self.exists()
+        st = self._stat_val()
+        if st is False or not st.st_mtime > when:
+            return self.error('Expected <%s> to be newer than <%s>, but was not.' % (self._fmt_val(self.val), other))
+        return self
+
+    def has_mode(self, mode):
+        """Asserts that val is an existing path and that it has the given permission bits.
+
+        Only the permission bits (as returned by ``stat.S_IMODE()``) are compared.  If val is not a
+        path, falls back to the dynamic assertion on the ``mode`` attribute or key (see
+        :class:`~assertpy.dynamic.DynamicMixin`).
+
+        Args:
+            mode (int): the expected permission bits, like ``0o644``
+
+        Examples:
+            Usage::
+
+                assert_that('deploy.sh').has_mode(0o755)
+
+        Returns:
+            AssertionBuilder: returns this instance to chain to the next assertion
+
+        Raises:
+            AssertionError: if val does **not** exist, or does **not** have the given mode
+        """
+        if not isinstance(self.val, str_types):
+            return self.__getattr__('has_mode')(mode)
+        if type(mode) is not int:
+            raise TypeError('given arg must be an int')
+        self.exists()
+        st = self._stat_val()
+        actual = stat.S_IMODE(st.st_mode) if st else 0
+        if actual != mode:
+            return self.error('Expected <%s> to have mode <0o%03o>, but was <0o%03o>.' % (self._fmt_val(self.val), mode, actual))
+        return self
+
+    def is_symlink(self):
+        """Asserts that val is a path and that it is a symbolic link.
+
+        The link itself is checked (via ``os.lstat()``), so a dangling link passes.
+
+        Examples:
+            Usage::
+
+                assert_that('current').is_symlink()
+
+        Returns:
+            AssertionBuilder: returns this instance to chain to the next assertion
+
+        Raises:
+            AssertionError: if val is **not** a symbolic link
+        """
+        st = self._lstat_val()
+        if st is False:
+            return self.error('Expected <%s> to be a symlink, but was not found.' % self._fmt_val(self.val))
+        if not stat.S_ISLNK(st.st_mode):
+            return self.error('Expected <%s> to be a symlink, but was not.' % self._fmt_val(self.val))
+        return self
+
+    def is_executable(self):
+        """Asserts that val is an existing path to a file and that file is executable.
+
+        A file is executable if any of its user, group, or other execute permission bits are set.
+
+        Examples:
+            Usage::
+
+                assert_that('deploy.sh').is_executable()
+
+        Returns:
+            AssertionBuilder: returns this instance to chain to the next assertion
+
+        Raises:
+            AssertionError: if val does **not** exist, or is **not** a file, or is **not** executable
+        """
+        self.is_file()
+        st = self._stat_val()
+        if st is False or not st.st_mode & (stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH):
+            return self.error('Expected <%s> to be executable, but was not.' % self._fmt_val(self.val))
+        return self
+
+    def file_contains(self, *items):
+        """Asserts that val is an existing path to a file and that file contains the given item or items.
+
+        The file is memory-mapped and searched as bytes, so even multi-GB files are never read into
+        memory.  String items are encoded as ``utf-8``, bytes items are searched as is.
+
+        Args:
+            *items: the item or items expected to be contained
+
+        Examples:
+            Usage::
+
+                assert_that('server.log').file_contains('ERROR 42')
+                assert_that('server.log').file_contains('started', 'stopped')
+                assert_that('image.png').file_contains(b'IEND')
+
+        Returns:
+            AssertionBuilder: returns this instance to chain to the next assertion
+
+        Raises:
+            AssertionError: if val does **not** exist, or is **not** a file, or does **not** contain the item or items
+        """
+        if len(items) == 0:
+            raise ValueError('one or more args must be given')
+        patterns = [_to_bytes(i, 'item') for i in items]
+        self.is_file()
+
+        with _mapped(self.val) as mm:
+            missing = [i for i, p in zip(items, patterns) if mm.find(p) < 0]
+        if missing:
+            if len(items) == 1:
+                return self.error('Expected file <%s> to contain item <%s>, but did not.' % (self._fmt_val(self.val), self._fmt_val(items[0])))
+            return self.error('Expected file <%s> to contain items %s, but did not contain %s.' % (
+                self._fmt_val(self.val), self._fmt_items(items), self._fmt_items(missing)))
+        return self
+
+    def file_does_not_contain(self, *items):
+        """Asserts that val is an existing path to a file and that file does not contain the given item or items.
+
+        The file is memory-mapped and searched as bytes.  On failure, only the line around the first
+        match is decoded for the error message.
+
+        Args:
+            *items: the item or items expected to be excluded
+
+        Examples:
+            Usage::
+
+                assert_that('server.log').file_does_not_contain('Traceback')
+
+        Returns:
+            AssertionBuilder: returns this instance to chain to the next assertion
+
+        Raises:
+            AssertionError: if val does **not** exist, or is **not** a file, or **does** contain the item or items
+        """
+        if len(items) == 0:
+            raise ValueError('one or more args must be given')
+        patterns = [_to_bytes(i, 'item') for i in items]
+        self.is_file()
+
+        with _mapped(self.val) as mm:
+            for i, p in zip(items, patterns):
+                pos = mm.find(p)
+                if pos >= 0:
+                    return self.error('Expected file <%s> to not contain item <%s>, but did at offset <%d> in <%s>.' % (
+                        self._fmt_val(self.val), self._fmt_val(i), pos, _context(mm, pos, pos + len(p))))
+        return self
+
+    def file_matches(self, pattern):
+        """Asserts that val is an existing path to a file and that the file contents match the given regex pattern.
+
+        The file is memory-mapped and the regex runs directly on the bytes, so a string pattern is
+        encoded as ``utf-8`` and compiled as a bytes pattern (so ``\\w`` and friends match ASCII only).
+        Partial matches are allowed, like :meth:`~assertpy.string.StringMixin.matches`.
+
+        Args:
+            pattern (str): the regular expression pattern, as raw string (aka prefixed with ``r``)
+
+        Examples:
+            Usage::
+
+                assert_that('server.log').file_matches(r'ERROR \\d+')
+                assert_that('server.log').file_matches(r'(?m)^started$')
+
+        Returns:
+            AssertionBuilder: returns this instance to chain to the next assertion
+
+        Raises:
+            AssertionError: if val does **not** exist, or is **not** a file, or does **not** match the pattern
+        """
+        regex = self._file_regex(pattern)
+        self.is_file()
+
+        with _mapped(self.val) as mm:
+            if regex.search(mm) is None:
+                return self.error('Expected file <%s> to match pattern <%s>, but did not.' % (self._fmt_val(self.val), pattern))
+        return self
+
+    def file_does_not_match(self, pattern):
+        """Asserts that val is an existing path to a file and that the file contents do not match the given regex pattern.
+
+        On failure, only the matched region is decoded for the error message.
+
+        Args:
+            pattern (str): the regular expression pattern, as raw string (aka prefixed with ``r``)
+
+        Examples:
+            Usage::
+
+                assert_that('server.log').file_does_not_match(r'ERROR \\d+')
+
+        Returns:
+            AssertionBuilder: returns this instance to chain to the next assertion
+
+        Raises:
+            AssertionError: if val does **not** exist, or is **not** a file, or **does** match the pattern
+        """
+        regex = self._file_regex(pattern)
+        self.is_file()
+
+        with _mapped(self.val) as mm:
+            m = regex.search(mm)
+            if m is not None:
+                return self.error('Expected file <%s> to not match pattern <%s>, but did at offset <%d> in <%s>.' % (
+                    self._fmt_val(self.val), pattern, m.start(), _context(mm, m.start(), m.end())))
+        return self
+
+    def file_line_count(self, count):
+        """Asserts that val is an existing path to a file and that file has the given number of lines.
+
+        Lines are counted like ``str.splitlines()`` on ``\\n`` line endings (so a missing final newline
+        still counts the last line).  The file is memory-mapped and scanned in fixed-size chunks.
+
+        Args:
+            count (int): the expected number of lines
+
+        Examples:
+            Usage::
+
+                assert_that('server.log').file_line_count(1000000)
+
+        Returns:
+            AssertionBuilder: returns this instance to chain to the next assertion
+
+        Raises:
+            AssertionError: if val does **not** exist, or is **not** a file, or does **not** have the given number of lines
+        """
+        if type(count) is not int:
+            raise TypeError('given arg must be an int')
+        if count < 0:
+            raise ValueError('given arg must be a positive int')
+        self.is_file()
+
+        with _mapped(self.val) as mm:
+            size = len(mm)
+            lines = 0
+            for i in xrange(0, size, _CHUNK_SIZE):
+                lines += mm[i:i+_CHUNK_SIZE].count(b'\n')
+            if size > 0 and mm[size-1:size] != b'\n':
+                lines += 1
+        if lines != count:
+            return self.error('Expected file <%s> to have <%d> lines, but had <%d>.' % (self._fmt_val(self.val), count, lines))
+        return self
+
+    def _paths_val(self):
+        """Helper to check that val is an iterable of paths, returns the paths as a list."""
+        if isinstance(self.val, str_types) or not isinstance(self.val, Iterable):
+            raise TypeError('val is not an iterable of paths')
+        paths = list(self.val)
+        for p in paths:
+            if not isinstance(p, str_types):
+                raise TypeError('val must contain only paths, but found <%s>' % type(p).__name__)
+        return paths
+
+    def all_exist(self):
+        """Asserts that val is an iterable of paths and that every path exists.
+
+        Paths are grouped by parent directory, and each directory is scanned once with
+        ``os.scandir()``, instead of a stat per path.  Every missing path is reported in a single
+        failure.
+
+        Examples:
+            Usage::
+
+                assert_that(['foo.txt', 'bar.txt', 'mydir']).all_exist()
+
+        Returns:
+            AssertionBuilder: returns this instance to chain to the next assertion
+
+        Raises:
+            AssertionError: if **any** path does **not** exist
+        """
+        paths = self._paths_val()
+        missing = [p for p, kind in zip(paths, _scan_paths(paths)) if kind is None]
+        if missing:
+            return self.error('Expected all <%d> paths to exist, but <%d> were not found %s.' % (
+                len(paths), len(missing), self._fmt_items(missing)))
+        return self
+
+    def all_are_files(self):
+        """Asserts that val is an iterable of paths and that every path is an existing file.
+
+        Uses the same directory scan as :meth:`all_exist`.
+
+        Examples:
+            Usage::
+
+                assert_that(['foo.txt', 'bar.txt']).all_are_files()
+
+        Returns:
+            AssertionBuilder: returns this instance to chain to the next assertion
+
+        Raises:
+            AssertionError: if **any** path does **not** exist, or is **not** a file
+        """
+        paths = self._paths_val()
+        not_files = [p for p, kind in zip(paths, _scan_paths(paths)) if kind != 'file']
+        if not_files:
+            return self.error('Expected all <%d> paths to be files, but <%d> were not %s.' % (
+                len(paths), len(not_files), self._fmt_items(not_files)))
+        return self
+
+    def none_exist(self):
+        """Asserts that val is an iterable of paths and that no path exists.
+
+        Uses the same directory scan as :meth:`all_exist`.
+
+        Examples:
+            Usage::
+
+                assert_that(['missing.txt', 'missing_dir']).none_exist()
+
+        Returns:
+            AssertionBuilder: returns this instance to chain to the next assertion
+
+        Raises:
+            AssertionError: if **any** path **does** exist
+        """
+        paths = self._paths_val()
+        found = [p for p, kind in zip(paths, _scan_paths(paths)) if kind is not None]
+        if found:
+            return self.error('Expected none of <%d> paths to exist, but <%d> were found %s.' % (
+                len(paths), len(found), self._fmt_items(found)))
+        return self
+
+    def has_size(self, size):
+        """Asserts that val is an existing path to a file and that file has the given size in bytes.
+
+        If val is not a path, falls back to the dynamic assertion on the ``size`` attribute or key
+        (see :class:`~assertpy.dynamic.DynamicMixin`).
+
+        Args:
+            size (int): the expected size in bytes
+
+        Examples:
+            Usage::
+
+                assert_that('artifact.tar.gz').has_size(1048576)
+
+        Returns:
+            AssertionBuilder: returns this instance to chain to the next assertion
+
+        Raises:
+            AssertionError: if val does **not** exist, or is **not** a file, or does **not** have the given size
+        """
+        if not isinstance(self.val, str_types):
+            return self.__getattr__('has_size')(size)
+        if type(size) is not int:
+            raise TypeError('given arg must be an int')
+        if size < 0:
+            raise ValueError('given arg must be a positive int')
+        self.is_file()
+
+        st = self._stat_val()
+        actual = st.st_size if st else 0
+        if actual != size:
+            return self.error('Expected file <%s> to have size <%d>, but was <%d>.' % (self._fmt_val(self.val), size, actual))
+        return self
+
+    def has_digest(self, algorithm, hexdigest=None):
+        """Asserts that val is an existing path to a file and that file has the given hash digest.
+
+        The file is streamed through the hash in fixed-size chunks, so it is never read into memory.
+        If val is not a path, falls back to the dynamic assertion on the ``digest`` attribute or key
+        (see :class:`~assertpy.dynamic.DynamicMixin`).
+
+        Args:
+            algorithm (str): the hash algorithm name, any name supported by ``hashlib.new()``, like ``sha256`` or ``md5``
+            hexdigest (str): the expected digest as hex string (case-insensitive)
+
+        Examples:
+            Usage::
+
+                assert_that('artifact.tar.gz').has_digest('sha256', '9f86d081884c7d659a2feaa0c55ad015...')
+
+        Returns:
+            AssertionBuilder: returns this instance to chain to the next assertion
+
+        Raises:
+            AssertionError: if val does **not** exist, or is **not** a file, or does **not** have the given digest
+        """
+        if not isinstance(self.val, str_types) and hexdigest is None:
+            return self.__getattr__('has_digest')(algorithm)
+        if not isinstance(algorithm, str_types):
+            raise TypeError('given algorithm arg must be a string')
+        if not isinstance(hexdigest, str_types):
+            raise TypeError('given hexdigest arg must be a string')
+        try:
+            h = hashlib.new(algorithm)
+        except ValueError:
+            raise ValueError('given algorithm arg <%s> is not supported' % algorithm)
+        self.is_file()
+
+        with open(self.val, 'rb') as fp:
+            for chunk in iter(lambda: fp.read(_CHUNK_SIZE), b''):
+                h.update(chunk)
+        actual = h.hexdigest()
+        if actual != hexdigest.lower():
+            return self.error('Expected file <%s> to have %s digest <%s>, but was <%s>.' % (
+                self._fmt_val(self.val), algorithm, hexdigest.lower(), actual))
+        return self
+
+    def has_same_content_as(self, other):
+        """Asserts that val is an existing path to a file and that file has the same content as the other file.
+
+        Sizes are compared first, and only same-size files are compared in fixed-size chunks, so
+        neither file is ever read into memory.  On failure, the first differing byte offset is reported.
+
+        Args:
+            other: the path to the expected file
+
+        Examples:
+            Usage::
+
+                assert_that('build/artifact.bin').has_same_content_as('golden/artifact.bin')
+
+        Returns:
+            AssertionBuilder: returns this instance to chain to the next assertion
+
+        Raises:
+            AssertionError: if val does **not** exist, or is **not** a file, or does **not** have the same content as other
+        """
+        if not isinstance(other, str_types):
+            raise TypeError('given other arg must be a path')
+        self.is_file()
+        if not os.path.isfile(other):
+            raise ValueError('given other arg <%s> is not a file' % other)
+
+        st = self._stat_val()
+        size, other_size = st.st_size if st else 0, os.path.getsize(other)
+        if size != other_size:
+            return self.error('Expected file <%s> to have same content as <%s>, but size <%d> was not equal to <%d>.' % (
+                self._fmt_val(self.val), other, size, other_size))
+
+        with open(self.val, 'rb') as fp, open(other, 'rb') as other_fp:
+            offset = 0
+            while True:
+                chunk, other_chunk = fp.read(_CHUNK_SIZE), other_fp.read(_CHUNK_SIZE)
+                if chunk != other_chunk:
+                    return self.error('Expected file <%s> to have same content as <%s>, but first differed at byte offset <%d>.' % (
+                        self._fmt_val(self.val), other, offset + _first_diff(chunk, other_chunk)))
+                if not chunk:
+                    break
+                offset += len(chunk)
+        return self
+
+    def has_same_tree_as(self, other, compare='size', workers=None):
+        """Asserts that val is an existing path to a directory and that directory has the same tree as the other directory.
+
+        Both trees are walked with ``os.scandir``, and every file (or other non-directory entry) is matched by its
+        relative path.  Symlinks are never followed: matched symlinks are compared by their target path, and other
+        matched files are compared by the given ``compare`` mode:
+
+        * ``size`` - files must have the same size (the default)
+        * ``mtime`` - files must have the same size and the same modification time
+        * ``hash`` - files must have the same size and the same sha256 digest, where files are hashed in a
+          thread pool of ``workers`` threads
+
+        Args:
+            other: the path to the expected (aka golden) directory
+            compare (str): the compare mode, one of ``size``, ``mtime``, or ``hash``
+            workers (int): the number of hashing threads, defaults to the machine cpu count
+
+        Examples:
+            Usage::
+
+                assert_that('build/dist').has_same_tree_as('golden/dist')
+                assert_that('build/dist').has_same_tree_as('golden/dist', compare='hash')
+
+        Returns:
+            AssertionBuilder: returns this instance to chain to the next assertion
+
+        Raises:
+            AssertionError: if val does **not** exist, or is **not** a directory, or does **not** have the same tree
+                as other, where the failure lists the added, removed, and changed relative paths
+        """
+        if not isinstance(other, str_types):
+            raise TypeError('given other arg must be a path')
+        if compare not in ('size', 'mtime', 'hash'):
+            raise ValueError('given compare arg must be one of size, mtime, or hash')
+        if workers is not None:
+            if type(workers) is not int:
+                raise TypeError('given workers arg must be an int')
+            if workers <= 0:
+                raise ValueError('given workers arg must be a positive int')
+        self.is_directory()
+        if not os.path.isdir(other):
+            raise ValueError('given other arg <%s> is not a directory' % other)
+
+        tree, other_tree = _walk_tree(self.val), _walk_tree(other)
+        added = sorted(set(tree) - set(other_tree))
+        removed = sorted(set(other_tree) - set(tree))
+        changed = []
+        candidates = []
+        for name in sorted(set(tree) & set(other_tree)):
+            st, other_st = tree[name], other_tree[name]
+            same_link = _same_link(st, other_st, os.path.join(self.val, name), os.path.join(other, name))
+            if same_link is not None:
+                if not same_link:
+                    changed.append(name)
+            elif st.st_size != other_st.st_size or (compare == 'mtime' and st.st_mtime != other_st.st_mtime):
+                changed.append(name)
+            elif compare == 'hash':
+                candidates.append(name)
+
+        if candidates:
+            paths = [os.path.join(root, name) for name in candidates for root in (self.val, other)]
+            if ThreadPoolExecutor is None or workers == 1 or len(candidates) == 1:
+                digests = [_hash_file(p) for p in paths]
+            else:
+                with ThreadPoolExecutor(max_workers=workers or _cpu_count()) as executor:
+                    digests = list(executor.map(_hash_file, paths))
+            changed.extend(name for i, name in enumerate(candidates) if digests[2*i] != digests[2*i+1])
+            changed.sort()
+
+        if added or removed or changed:
+            diffs = []
+            for label, names in (('added', added), ('removed', removed), ('changed', changed)):
+                if names:
+                    diffs.append('%s %s' % (label, self._fmt_items(names)))
+            return self.error('Expected <%s> to have same tree as <%s>, but %s.' % (
+                self._fmt_val(self.val), other, ', '.join(diffs)))
+        return self
+
+    def _file_regex(self, pattern):
+        """Helper to compile the given str or bytes regex pattern as a bytes pattern."""
+        if not isinstance(pattern, (bytes,) + str_types):
+            raise TypeError('given pattern arg must be a string or bytes')
+        if len(pattern) == 0:
+            raise ValueError('given pattern arg must not be empty')
+        return re.compile(_to_bytes(pattern, 'pattern'))
@@ -27,29 +27,198 @@
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import sys
+import array
 import numbers
 import datetime
+import operator
+import itertools
 import collections
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 if sys.version_info[0] == 3:
+    str_types = (str,)
     Iterable = collections.abc.Iterable
 else:
+    str_types = (basestring,)
     Iterable = collections.Iterable
 
 __tracebackhide__ = True
 
 
+def _is_column(val):
+    """Helper to check if the given val is a numeric column, either an ``array.array`` or a numeric numpy ``ndarray``."""
+    if isinstance(val, array.array):
+        return val.typecode not in ('u', 'w')
+    return numpy is not None and isinstance(val, numpy.ndarray) and val.ndim == 1 and val.dtype.kind in 'iuf'
+
+
+def _column_values(val):
+    """Helper to get the given column (or tuple of columns) as a list (or tuple of lists), so it compares equal
+    to the same values in a list, or val as-is if not a column."""
+    if _is_column(val):
+        return val.tolist()
+    if type(val) is tuple and any(_is_column(v) for v in val):
+        return tuple(v.tolist() if _is_column(v) else v for v in val)
+    return val
+
+
+def _to_column(values):
+    """Helper to convert the given list of values to a compact numeric column, either a numpy ``ndarray`` (if
+    numpy is installed) or an ``array.array``.  Returns the list as-is if any value is not an int or float."""
+    kinds = set(type(v) for v in values)
+    if not kinds or not kinds <= set([int, float]):
+        # bools are ints, but not numbers here
+        return values
+    if numpy is not None:
+        try:
+            return numpy.array(values, dtype=numpy.int64 if kinds == set([int]) else numpy.float64)
+        except OverflowError:
+            return values
+    try:
+        return array.array('q' if kinds == set([int]) else 'd', values)
+    except OverflowError:
+        return values
+
+
+def _column_bounds(val):
+    """Helper to get the ``(min, max)`` of the given non-empty column, vectorized for numpy."""
+    if numpy is not None and isinstance(val, numpy.ndarray):
+        return val.min().item(), val.max().item()
+    return min(val), max(val)
+
+
+def _column_unsorted(val, reverse=False):
+    """Helper to get the index of the first out of order item in the given column, or ``None`` if sorted."""
+    if numpy is not None and isinstance(val, numpy.ndarray):
+        bad = numpy.flatnonzero(val[1:] > val[:-1] if reverse else val[1:] < val[:-1])
+        return int(bad[0]) if bad.size else None
+    pairs = map(operator.lt if reverse else operator.gt, val, itertools.islice(val, 1, None))
+    return next(itertools.compress(itertools.count(), pairs), None)
+
+
+class _Formatter(object):
+    """Bounded formatter for values in failure messages, in the style of ``reprlib``.
+
+    Small values are formatted exactly like ``str()``, but huge values are abbreviated with
+    ``...`` so a failing assertion on a huge string or collection never builds a huge message.
+    See :meth:`~assertpy.assertpy.set_message_limits`.
+    """
+
+    _EMPTY = {set: 'set()', frozenset: 'frozenset()'}
+    _BRACKETS = {list: ('[', ']'), tuple: ('(', ')'), set: ('{', '}'), frozenset: ('frozenset({', '})'), dict: ('{', '}')}
+    # collection types, and the bracket type their subclasses are formatted as
+    _BASES = ((list, list), (tuple, tuple), (dict, dict), (set, set), (frozenset, frozenset), (collections.deque, list))
+
+    def __init__(self, max_length=4096, max_items=100, max_depth=6, full=False):
+        self.max_length = max_length
+        self.max_items = max_items
+        self.max_depth = max_depth
+        self.full = full
+        self._bases = {}
+
+    def format(self, val):
+        """Format the given val like ``str()``, but bounded by the current limits."""
+        if isinstance(val, str_types):
+            return val if self.full or len(val) <= self.max_length else val[:self.max_length] + '...'
+        if self.full:
+            return str(val)
+        t = type(val)
+        if t in self._BRACKETS or t is bytes or t is bytearray or \
+                (self._base(t)[0] is not None and t.__str__ is object.__str__):
+            return self._repr(val, self.max_depth, [self.max_length], set())
+        return self._truncate(str(val))
+
+    def repr(self, val):
+        """Format the given val like ``repr()``, but bounded by the current limits."""
+        if self.full:
+            return repr(val)
+        return self._repr(val, self.max_depth, [self.max_length], set())
+
+    def _truncate(self, out):
+        return out if len(out) <= self.max_length else out[:self.max_length] + '...'
+
+    def _base(self, t):
+        """Helper to get the bracket type that the given collection subclass (or deque) is formatted as, and True if it
+        has its own repr, or ``(None, False)`` if it is not a collection."""
+        try:
+            return self._bases[t]
+        except KeyError:
+            pass
+        found = (None, False)
+        for cls, base in self._BASES:
+            if issubclass(t, cls):
+                found = (base, t.__repr__ is not cls.__repr__ or cls is not base)
+                break
+        self._bases[t] = found
+        return found
+
+    def _repr(self, val, depth, budget, seen):
+        t = base = type(val)
+        custom = False
+        if t not in self._BRACKETS:
+            base, custom = self._base(t)
+            if base is None or (custom and len(val) <= self.max_items):
+                # not a collection, or a small one with its own repr, so formatted exactly
+                if isinstance(val, str_types + (bytes, bytearray)) and len(val) > budget[0]:
+                    # slice before repr, so a huge string is never copied whole
+                    out = repr(val[:max(budget[0], 0)]) + '...'
+                else:
+                    out = self._truncate(repr(val))
+                budget[0] -= len(out)
+                return out
+
+        if len(val) == 0:
+            return self._EMPTY.get(base, ''.join(self._BRACKETS[base]))
+        start, end = self._BRACKETS[base]
+        if custom:
+            # a big collection with its own repr, so just wrapped in its type name (like deque)
+            start, end = '%s(%s' % (t.__name__, start), end + ')'
+        if depth <= 0 or id(val) in seen:
+            return start + '...' + end
+
+        seen.add(id(val))
+        parts = []
+        for x in itertools.islice(val, self.max_items):
+            if budget[0] <= 0:
+                break
+            if base is dict:
+                parts.append('%s: %s' % (self._repr(x, depth - 1, budget, seen), self._repr(val[x], depth - 1, budget, seen)))
+            else:
+                parts.append(self._repr(x, depth - 1, budget, seen))
+            budget[0] -= 2
+        seen.discard(id(val))
+
+        if len(parts) < len(val):
+            parts.append('...')
+        elif base is tuple and len(parts) == 1:
+            return start + parts[0] + ',' + end
+        return start + ', '.join(parts) + end
+
+
+_formatter = _Formatter()
+
+
 class HelpersMixin(object):
     """Helpers mixin.  For internal use only."""
 
+    __slots__ = ()
+
+    def _fmt_val(self, val):
+        """Helper to format the given val for a failure message, bounded by the current limits."""
+        return _formatter.format(val)
+
     def _fmt_items(self, i):
         """Helper to format the given items."""
         if len(i) == 0:
             return '<>'
         elif len(i) == 1 and hasattr(i, '__getitem__'):
-            return '<%s>' % (i[0],)
+            return '<%s>' % _formatter.format(i[0])
         else:
-            return '<%s>' % str(i).lstrip('([').rstrip(',])')
+            return '<%s>' % _formatter.format(i).lstrip('([').rstrip(',])')
 
     def _fmt_args_kwargs(self, *some_args, **some_kwargs):
         """Helper to convert the given args and kwargs into a string."""
@@ -141,6 +310,18 @@ class HelpersMixin(object):
         if return_as_bool:
             return True
 
+    def _hash_index(self, val, items=()):
+        """Helper to build a set index of the given list-like val (and check the given items are hashable),
+        or return ``None`` if val is not list-like or anything is not hashable."""
+        column = _is_column(val)
+        if not column and not isinstance(val, (list, tuple, collections.deque)):
+            return None
+        try:
+            frozenset(items)
+            return set(val.tolist()) if column else set(val)
+        except TypeError:
+            return None
+
     def _check_iterable(self, l, check_getitem=True, name='val'):
         """Helper to check if given val has various iterable attributes."""
         if not isinstance(l, Iterable):
@@ -222,14 +403,14 @@ class HelpersMixin(object):
             ellip = False
             for k, v in sorted(d.items()):
                 if k not in other:
-                    out += '%s%s: %s' % (', ' if len(out) > 0 else '', repr(k), repr(v))
+                    out += '%s%s: %s' % (', ' if len(out) > 0 else '', _formatter.repr(k), _formatter.repr(v))
                 elif v != other[k]:
                     out += '%s%s: %s' % (
                         ', ' if len(out) > 0 else '',
-                        repr(k),
+                        _formatter.repr(k),
                         _dict_repr(v, other[k]) if self._check_dict_like(
                             v, check_values=False, return_as_bool=True) and self._check_dict_like(
-                                other[k], check_values=False, return_as_bool=True) else repr(v)
+                                other[k], check_values=False, return_as_bool=True) else _formatter.repr(v)
                     )
                 else:
                     ellip = True
@@ -31,12 +31,25 @@ import sys
 import math
 import numbers
 import datetime
+import operator
+
+from .helpers import _is_column, _column_bounds
 
 __tracebackhide__ = True
 
 
 class NumericMixin(object):
-    """Numeric assertions mixin."""
+    """Numeric assertions mixin.
+
+    The ordering assertions (``is_greater_than()``, ``is_less_than()``, ``is_positive()``, ``is_between()``,
+    etc.) also accept a numeric column val, either an ``array.array`` or numpy ``ndarray`` (see
+    :meth:`~assertpy.extracting.ExtractingMixin.extracting` with ``columnar=True``), and assert on every
+    item, vectorized by checking just the column min and max::
+
+        assert_that(orders).extracting('total', columnar=True).is_positive().is_less_than(1000)
+    """
+
+    __slots__ = ()
 
     _NUMERIC_COMPAREABLE = set([datetime.datetime, datetime.timedelta, datetime.date, datetime.time])
     _NUMERIC_NON_COMPAREABLE = set([complex])
@@ -57,6 +70,19 @@ class NumericMixin(object):
             return
         raise TypeError('ordering is not defined for type <%s>' % self_type.__name__)
 
+    def _column_check(self, op, other, desc):
+        """Helper to assert that op(item, other) holds for every item of the numeric column val, by checking
+        just its min (or max), see :func:`~assertpy.helpers._is_column`."""
+        if not isinstance(other, numbers.Number) or type(other) is complex:
+            raise TypeError('given arg must be a number, but was <%s>' % type(other).__name__)
+        if len(self.val):
+            lo, hi = _column_bounds(self.val)
+            bound, name = (lo, 'min') if op in (operator.gt, operator.ge) else (hi, 'max')
+            if not op(bound, other):
+                return self.error('Expected all items of <%s> to be %s <%s>, but %s was <%s>.' % (
+                    self._fmt_val(self.val), desc, other, name, bound))
+        return self
+
     def _validate_number(self):
         """Raise TypeError if val is not numeric."""
         if isinstance(self.val, numbers.Number) is False:
@@ -120,7 +146,7 @@ class NumericMixin(object):
         self._validate_number()
         self._validate_real()
         if not math.isnan(self.val):
-            return self.error('Expected <%s> to be <NaN>, but was not.' % self.val)
+            return self.error('Expected <%s> to be <NaN>, but was not.' % self._fmt_val(self.val))
         return self
 
     def is_not_nan(self):
@@ -163,7 +189,7 @@ class NumericMixin(object):
         self._validate_number()
         self._validate_real()
         if not math.isinf(self.val):
-            return self.error('Expected <%s> to be <Inf>, but was not.' % self.val)
+            return self.error('Expected <%s> to be <Inf>, but was not.' % self._fmt_val(self.val))
         return self
 
     def is_not_inf(self):
@@ -215,13 +241,15 @@ class NumericMixin(object):
         Raises:
             AssertionError: if val is **not** greater than other
         """
+        if _is_column(self.val):
+            return self._column_check(operator.gt, other, 'greater than')
         self._validate_compareable(other)
         if self.val <= other:
             if type(self.val) is datetime.datetime:
                 return self.error('Expected <%s> to be greater than <%s>, but was not.' % (
                     self.val.strftime('%Y-%m-%d %H:%M:%S'), other.strftime('%Y-%m-%d %H:%M:%S')))
             else:
-                return self.error('Expected <%s> to be greater than <%s>, but was not.' % (self.val, other))
+                return self.error('Expected <%s> to be greater than <%s>, but was not.' % (self._fmt_val(self.val), other))
         return self
 
     def is_greater_than_or_equal_to(self, other):
@@ -253,13 +281,15 @@ class NumericMixin(object):
         Raises:
             AssertionError: if val is **not** greater than or equal to other
         """
+        if _is_column(self.val):
+            return self._column_check(operator.ge, other, 'greater than or equal to')
         self._validate_compareable(other)
         if self.val < other:
             if type(self.val) is datetime.datetime:
                 return self.error('Expected <%s> to be greater than or equal to <%s>, but was not.' % (
                     self.val.strftime('%Y-%m-%d %H:%M:%S'), other.strftime('%Y-%m-%d %H:%M:%S')))
             else:
-                return self.error('Expected <%s> to be greater than or equal to <%s>, but was not.' % (self.val, other))
+                return self.error('Expected <%s> to be greater than or equal to <%s>, but was not.' % (self._fmt_val(self.val), other))
         return self
 
     def is_less_than(self, other):
@@ -289,12 +319,14 @@ class NumericMixin(object):
         Raises:
             AssertionError: if val is **not** less than other
         """
+        if _is_column(self.val):
+            return self._column_check(operator.lt, other, 'less than')
         self._validate_compareable(other)
         if self.val >= other:
             if type(self.val) is datetime.datetime:
                 return self.error('Expected <%s> to be less than <%s>, but was not.' % (self.val.strftime('%Y-%m-%d %H:%M:%S'), other.strftime('%Y-%m-%d %H:%M:%S')))
             else:
-                return self.error('Expected <%s> to be less than <%s>, but was not.' % (self.val, other))
+                return self.error('Expected <%s> to be less than <%s>, but was not.' % (self._fmt_val(self.val), other))
         return self
 
     def is_less_than_or_equal_to(self, other):
@@ -326,13 +358,15 @@ class NumericMixin(object):
         Raises:
             AssertionError: if val is **not** less than or equal to other
         """
+        if _is_column(self.val):
+            return self._column_check(operator.le, other, 'less than or equal to')
         self._validate_compareable(other)
         if self.val > other:
             if type(self.val) is datetime.datetime:
                 return self.error('Expected <%s> to be less than or equal to <%s>, but was not.' % (
                     self.val.strftime('%Y-%m-%d %H:%M:%S'), other.strftime('%Y-%m-%d %H:%M:%S')))
             else:
-                return self.error('Expected <%s> to be less than or equal to <%s>, but was not.' % (self.val, other))
+                return self.error('Expected <%s> to be less than or equal to <%s>, but was not.' % (self._fmt_val(self.val), other))
         return self
 
     def is_positive(self):
@@ -398,6 +432,19 @@ class NumericMixin(object):
         Raises:
             AssertionError: if val is **not** between low and high
         """
+        if _is_column(self.val):
+            for arg, name in ((low, 'low'), (high, 'high')):
+                if not isinstance(arg, numbers.Number) or type(arg) is complex:
+                    raise TypeError('given %s arg must be numeric, but was <%s>' % (name, type(arg).__name__))
+            if low > high:
+                raise ValueError('given low arg must be less than given high arg')
+            if len(self.val):
+                lo, hi = _column_bounds(self.val)
+                if lo < low or hi > high:
+                    return self.error('Expected all items of <%s> to be between <%s> and <%s>, but min was <%s> and max was <%s>.' % (
+                        self._fmt_val(self.val), low, high, lo, hi))
+            return self
+
         val_type = type(self.val)
         self._validate_between_args(val_type, low, high)
 
@@ -406,7 +453,7 @@ class NumericMixin(object):
                 return self.error('Expected <%s> to be between <%s> and <%s>, but was not.' % (
                     self.val.strftime('%Y-%m-%d %H:%M:%S'), low.strftime('%Y-%m-%d %H:%M:%S'), high.strftime('%Y-%m-%d %H:%M:%S')))
             else:
-                return self.error('Expected <%s> to be between <%s> and <%s>, but was not.' % (self.val, low, high))
+                return self.error('Expected <%s> to be between <%s> and <%s>, but was not.' % (self._fmt_val(self.val), low, high))
         return self
 
     def is_not_between(self, low, high):
@@ -436,7 +483,7 @@ class NumericMixin(object):
                 return self.error('Expected <%s> to not be between <%s> and <%s>, but was.' % (
                     self.val.strftime('%Y-%m-%d %H:%M:%S'), low.strftime('%Y-%m-%d %H:%M:%S'), high.strftime('%Y-%m-%d %H:%M:%S')))
             else:
-                return self.error('Expected <%s> to not be between <%s> and <%s>, but was.' % (self.val, low, high))
+                return self.error('Expected <%s> to not be between <%s> and <%s>, but was.' % (self._fmt_val(self.val), low, high))
         return self
 
     def is_close_to(self, other, tolerance):
@@ -477,7 +524,7 @@ class NumericMixin(object):
                 return self.error('Expected <%s> to be close to <%s> within tolerance <%d:%02d:%02d>, but was not.' % (
                     self.val.strftime('%Y-%m-%d %H:%M:%S'), other.strftime('%Y-%m-%d %H:%M:%S'), h, m, s))
             else:
-                return self.error('Expected <%s> to be close to <%s> within tolerance <%s>, but was not.' % (self.val, other, tolerance))
+                return self.error('Expected <%s> to be close to <%s> within tolerance <%s>, but was not.' % (self._fmt_val(self.val), other, tolerance))
         return self
 
     def is_not_close_to(self, other, tolerance):
@@ -509,5 +556,5 @@ class NumericMixin(object):
                 return self.error('Expected <%s> to not be close to <%s> within tolerance <%d:%02d:%02d>, but was.' % (
                     self.val.strftime('%Y-%m-%d %H:%M:%S'), other.strftime('%Y-%m-%d %H:%M:%S'), h, m, s))
             else:
-                return self.error('Expected <%s> to not be close to <%s> within tolerance <%s>, but was.' % (self.val, other, tolerance))
+                return self.error('Expected <%s> to not be close to <%s> within tolerance <%s>, but was.' % (self._fmt_val(self.val), other, tolerance))
         return self
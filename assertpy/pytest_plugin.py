@@ -0,0 +1,82 @@
+# Copyright (c) 2015-2019, Activision Publishing, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+# may be used to endorse or promote products derived from this software without
+# specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON
+# ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Optional pytest plugin for assertpy.
+
+The plugin is not registered automatically, so enable it with ``-p assertpy.pytest_plugin`` on the
+command line, or in a ``conftest.py`` with::
+
+    pytest_plugins = ['assertpy.pytest_plugin']
+
+Without the plugin, snapshots are still written, but only at interpreter exit.
+
+The plugin adds the ``--snapshot-update`` option (that doesn't exist unless the plugin is enabled), to
+rewrite the snapshots that differ instead of failing, and a summary of the snapshots no test used, and the
+snapshot bytes read and written.
+"""
+
+from .snapshot import _store, flush_snapshots
+
+
+def _size(n):
+    """Helper to format the given number of bytes."""
+    for unit in ('bytes', 'KB', 'MB'):
+        if n < 1024 or unit == 'MB':
+            return ('%d %s' if unit == 'bytes' else '%.1f %s') % (n, unit)
+        n /= 1024.0
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('assertpy')
+    group.addoption('--snapshot-update', action='store_true', default=False,
+                    help='rewrite the snapshots that differ, instead of failing')
+
+
+def pytest_configure(config):
+    if config.getoption('snapshot_update'):
+        _store.update = True
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Write all new and updated snapshots, once, at the end of the session."""
+    flush_snapshots()
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Report the snapshots no test used, and the snapshot bytes read and written."""
+    if not _store.files:
+        return
+    stats = _store.stats
+    terminalreporter.write_sep('-', 'assertpy snapshots')
+    terminalreporter.write_line('read %s from %d files, wrote %s to %d files, updated %d snapshots' % (
+        _size(stats['read']), stats['files_read'], _size(stats['written']), stats['files_written'], stats['updated']))
+    unused = _store.unused()
+    if unused:
+        terminalreporter.write_line('%d unused snapshots (from tests that were not run, or no longer exist):' % len(unused))
+        for path, key in unused:
+            terminalreporter.write_line('  %s' % path if key is None else '  %s line %s' % (path, key))
@@ -26,14 +26,776 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import io
 import os
 import sys
-import datetime
-import inspect
+import gzip
 import json
+import math
+import pickle
+import hashlib
+import atexit
+import uuid
+import decimal
+import inspect
+import datetime
+import tempfile
+import threading
+import contextlib
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
 
 __tracebackhide__ = True
 
+# marks a snapshot file that is not on disk (yet)
+_NOT_FOUND = object()
+
+# marks a snapshot file that is on disk, but not loaded (yet)
+_UNLOADED = object()
+
+# the environment variable that sets the assertpy cache directory, where snapshot indexes are kept (outside
+# the snapshot directories, that are committed to source control)
+_CACHE_ENV = 'ASSERTPY_CACHE_DIR'
+
+# hashing a val costs several times more than decoding the same bytes of snapshot file, so stop hashing
+# (and just load the file) after hashing this fraction of its size
+_HASH_BUDGET = 0.02
+
+# the environment variable that turns on update mode (like the --snapshot-update pytest option)
+_UPDATE_ENV = 'ASSERTPY_SNAPSHOT_UPDATE'
+
+
+# snapshot types: encoders by exact type, decoders by tag, encoders resolved by MRO, and imported classes
+_encoders = {}
+_decoders = {}
+_resolved = {}
+_classes = {}
+
+
+def add_snapshot_type(cls, tag, encode, decode):
+    """Add a custom type to snapshots, so its instances can be stored in (and loaded from) JSON snapshots.
+
+    A registered type is stored as ``{"__type__": tag, "__data__": encode(obj)}``, where the data can be
+    anything a snapshot can store (including other registered types), and loaded with ``decode(data)``.
+    Subclasses of a registered type use its encoder, unless they are registered too.
+
+    Built in, snapshots support sets, complex numbers, datetimes, decimals, and UUIDs, plus any object
+    with a ``__dict__`` or ``__slots__`` (including dataclasses), stored as its attributes.
+
+    Args:
+        cls: the type to add
+        tag: the name of the type in snapshot files
+        encode: the function to convert an instance of the type to storable data
+        decode: the function to convert the stored data back to an instance of the type
+
+    Examples:
+        Usage::
+
+            from assertpy import add_snapshot_type
+
+            add_snapshot_type(Point, 'point', lambda p: [p.x, p.y], lambda d: Point(d[0], d[1]))
+
+            assert_that(Point(1, 2)).snapshot()
+
+    Raises:
+        TypeError: if cls is not a type, tag is not a string, or encode or decode is not callable
+        ValueError: if tag is ``instance`` (reserved for objects stored as their attributes)
+    """
+    if not isinstance(cls, type):
+        raise TypeError('given cls arg must be a type')
+    if not isinstance(tag, str):
+        raise TypeError('given tag arg must be a string')
+    if tag == 'instance':
+        raise ValueError('given tag arg must not be <instance>')
+    if not callable(encode) or not callable(decode):
+        raise TypeError('encode and decode must be callable')
+    _encoders[cls] = (tag, encode)
+    _decoders[tag] = decode
+    _resolved.clear()
+
+
+def remove_snapshot_type(cls):
+    """Remove a custom type from snapshots.
+
+    Args:
+        cls: the type to remove
+
+    Examples:
+        Usage::
+
+            from assertpy import remove_snapshot_type
+
+            remove_snapshot_type(Point)
+
+    Raises:
+        TypeError: if cls is not a type
+    """
+    if not isinstance(cls, type):
+        raise TypeError('given cls arg must be a type')
+    if cls in _encoders:
+        tag = _encoders.pop(cls)[0]
+        if tag not in [t for t, _ in _encoders.values()]:
+            _decoders.pop(tag, None)
+        _resolved.clear()
+
+
+def flush_snapshots():
+    """Write all new and updated snapshots to disk now.
+
+    Snapshots are collected in memory, and written at the end of the pytest session by the assertpy
+    pytest plugin, or else at interpreter exit.  A process that exits without running its exit hooks
+    (like a forked worker, or ``os._exit()``) loses every snapshot it recorded, unless it calls this
+    function first.
+
+    Examples:
+        Usage::
+
+            from assertpy import flush_snapshots
+
+            assert_that({'a': 1}).snapshot()
+            flush_snapshots()
+            os._exit(0)
+    """
+    _store.flush()
+
+
+def _slots(cls):
+    """Helper to get the names of all the slots of the given class, or an empty tuple if none."""
+    names = []
+    for c in reversed(cls.__mro__):
+        slots = c.__dict__.get('__slots__', ())
+        for name in ((slots,) if isinstance(slots, str) else slots):
+            if name not in ('__dict__', '__weakref__') and name not in names:
+                names.append(name)
+    return tuple(names)
+
+
+def _instance_encoder(slots):
+    """Helper to make the encoder for objects of a class with the given slots, that gets their attributes
+    (from their ``__dict__``, and their ``__slots__`` if any)."""
+    if not slots:
+        return lambda o: o.__dict__
+
+    def encode(o):
+        data = dict((name, getattr(o, name)) for name in slots if hasattr(o, name))
+        data.update(getattr(o, '__dict__', {}))
+        return data
+    return encode
+
+
+def _resolve(cls):
+    """Helper to find the encoder for the given type: registered for the type, or for its nearest
+    registered base class, or the instance encoder for objects with attributes, or None."""
+    try:
+        return _resolved[cls]
+    except KeyError:
+        pass
+    found = None
+    for c in cls.__mro__:
+        if c in _encoders:
+            found = _encoders[c]
+            break
+    else:
+        if not issubclass(cls, type):
+            slots = _slots(cls)
+            if slots or '__dict__' in dir(cls):
+                found = ('instance', _instance_encoder(slots))
+    _resolved[cls] = found
+    return found
+
+
+def _import_class(module, name):
+    """Helper to import the given class (and find its slots), just once."""
+    key = (module, name)
+    try:
+        return _classes[key]
+    except KeyError:
+        mod = __import__(module, fromlist=[name])
+        klass = getattr(mod, name)
+        found = _classes[key] = (klass, _slots(klass))
+        return found
+
+
+def _decode_instance(d):
+    klass, slots = _import_class(d['__module__'], d['__class__'])
+    inst = klass.__new__(klass)
+    if not slots:
+        inst.__dict__ = d['__data__']
+    else:
+        for name, val in d['__data__'].items():
+            object.__setattr__(inst, name, val)
+    return inst
+
+
+def _encode_datetime(o):
+    # without microseconds or timezone, this is the same as the original seconds only format
+    return o.isoformat(' ')
+
+
+def _decode_datetime(data):
+    if hasattr(datetime.datetime, 'fromisoformat'):
+        return datetime.datetime.fromisoformat(data)
+    return datetime.datetime.strptime(data, '%Y-%m-%d %H:%M:%S.%f' if '.' in data else '%Y-%m-%d %H:%M:%S')
+
+
+class _Encoder(json.JSONEncoder):
+    """JSON encoder for snapshots, that encodes the registered snapshot types and instances."""
+
+    def default(self, o):
+        found = _resolve(type(o))
+        if found is None:
+            return json.JSONEncoder.default(self, o)
+        tag, encode = found
+        if tag == 'instance':
+            return {
+                '__type__': 'instance',
+                '__class__': o.__class__.__name__,
+                '__module__': o.__class__.__module__,
+                '__data__': encode(o)
+            }
+        return {'__type__': tag, '__data__': encode(o)}
+
+
+class _Decoder(json.JSONDecoder):
+    """JSON decoder for snapshots, the inverse of :class:`_Encoder`."""
+
+    def __init__(self):
+        json.JSONDecoder.__init__(self, object_hook=self.object_hook)
+
+    def object_hook(self, d):
+        if '__type__' in d and '__data__' in d:
+            if d['__type__'] == 'instance':
+                return _decode_instance(d)
+            decode = _decoders.get(d['__type__'])
+            if decode is not None:
+                return decode(d['__data__'])
+        return d
+
+
+add_snapshot_type(set, 'set', list, set)
+add_snapshot_type(complex, 'complex', lambda o: [o.real, o.imag], lambda d: complex(d[0], d[1]))
+add_snapshot_type(datetime.datetime, 'datetime', _encode_datetime, _decode_datetime)
+add_snapshot_type(decimal.Decimal, 'decimal', str, decimal.Decimal)
+add_snapshot_type(uuid.UUID, 'uuid', str, uuid.UUID)
+
+
+def _dump_json(val, fp):
+    json.dump(val, fp, indent=2, separators=(',', ': '), sort_keys=True, cls=_Encoder)
+
+
+def _dump_compact(val, fp):
+    json.dump(val, fp, separators=(',', ':'), sort_keys=True, cls=_Encoder)
+
+
+def _load_json(fp):
+    return json.load(fp, cls=_Decoder)
+
+
+def _dump_gzip(val, fp):
+    # mtime=0 keeps the compressed output identical for identical snapshots
+    with gzip.GzipFile(fileobj=fp, mode='wb', mtime=0) as gz:
+        with io.TextIOWrapper(gz, encoding='utf-8') as text:
+            _dump_compact(val, text)
+
+
+def _load_gzip(fp):
+    with gzip.GzipFile(fileobj=fp, mode='rb') as gz:
+        with io.TextIOWrapper(gz, encoding='utf-8') as text:
+            return _load_json(text)
+
+
+def _dump_pickle(val, fp):
+    pickle.dump(val, fp, protocol=min(4, pickle.HIGHEST_PROTOCOL))
+
+
+def _load_pickle(fp):
+    return pickle.load(fp)
+
+
+class _Format(object):
+    """A snapshot file format: its file extension, and functions to dump to and load from a file object."""
+
+    __slots__ = ('ext', 'dump', 'load', 'binary')
+
+    def __init__(self, ext, dump, load, binary):
+        self.ext = ext
+        self.dump = dump
+        self.load = load
+        self.binary = binary
+
+
+# registry of snapshot formats, by name
+_FORMATS = {
+    'json': _Format('.json', _dump_json, _load_json, False),
+    'json.gz': _Format('.json.gz', _dump_gzip, _load_gzip, True),
+    'pickle': _Format('.pickle', _dump_pickle, _load_pickle, True),
+    'compact': _Format('.min.json', _dump_compact, _load_json, False),
+}
+
+
+def _format(name):
+    """Helper to get the registered snapshot format with the given name."""
+    try:
+        return _FORMATS[name]
+    except (KeyError, TypeError):
+        raise ValueError('given format arg must be one of %s, or %s' % (
+            ', '.join(sorted(_FORMATS)[:-1]), sorted(_FORMATS)[-1]))
+
+
+def _replace(name, write, binary=False):
+    """Helper to write the given file atomically, by calling write with a temp file in the same directory
+    and renaming it over the given file, so readers never see a torn file."""
+    tmp = os.path.join(os.path.dirname(name), '.snap-%s.tmp' % uuid.uuid4().hex)
+    # created like open() does (not mkstemp's 0600), so the kernel applies the umask
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        with os.fdopen(fd, 'wb' if binary else 'w') as fp:
+            write(fp)
+        os.replace(tmp, name)
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+
+def _save(name, val, fmt='json'):
+    """Helper to write the given val to the given snapshot file atomically."""
+    f = _format(fmt)
+    _replace(name, lambda fp: f.dump(val, fp), f.binary)
+
+
+def _load(name, fmt='json'):
+    """Helper to read the given snapshot file."""
+    f = _format(fmt)
+    with open(name, 'rb' if f.binary else 'r') as fp:
+        return f.load(fp)
+
+
+def _makedirs(path):
+    """Helper to create the given directory, if another process hasn't already."""
+    try:
+        os.makedirs(path)
+    except OSError:
+        if not os.path.isdir(path):
+            raise
+
+
+def _cache_dir(kind):
+    """Helper to get the given subdirectory of the assertpy cache directory: ``$ASSERTPY_CACHE_DIR``, or
+    ``assertpy`` in ``$XDG_CACHE_HOME`` or ``~/.cache``."""
+    root = os.environ.get(_CACHE_ENV)
+    if not root:
+        root = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'), 'assertpy')
+    return os.path.join(root, kind)
+
+
+def _lock_path(name):
+    """Helper to get the path of the lock file of the given file, in the cache directory (or the temp directory if
+    that can't be written), or None if neither can be written."""
+    key = hashlib.sha1(os.path.abspath(name).encode('utf-8', 'surrogatepass')).hexdigest()
+    for d in (_cache_dir('locks'), os.path.join(tempfile.gettempdir(), 'assertpy-locks')):
+        try:
+            if not os.path.isdir(d):
+                _makedirs(d)
+            return os.path.join(d, key + '.lock')
+        except OSError:
+            continue
+    return None
+
+
+@contextlib.contextmanager
+def _locked(name):
+    """Helper to hold an exclusive advisory lock on the given file (via a lock file in the cache directory, so
+    nothing is left next to it, removed again on release), so concurrent test workers update it one at a time.
+    No-op where ``fcntl`` is not available, or no lock file can be written."""
+    lock = _lock_path(name) if fcntl is not None else None
+    while lock is not None:
+        try:
+            fp = open(lock, 'a')
+        except (IOError, OSError):
+            break
+        fcntl.flock(fp.fileno(), fcntl.LOCK_EX)
+        try:
+            same = os.path.samestat(os.fstat(fp.fileno()), os.stat(lock))
+        except OSError:
+            same = False
+        if not same:
+            # the holder removed the lock file while we waited, so lock the new one
+            fp.close()
+            continue
+        try:
+            yield
+        finally:
+            # removed while still held, so the lock files don't pile up in the cache directory
+            try:
+                os.remove(lock)
+            except OSError:
+                pass
+            fcntl.flock(fp.fileno(), fcntl.LOCK_UN)
+            fp.close()
+        return
+    yield
+
+
+def _roundtrip(val, fmt='json'):
+    """Helper to encode and decode the given val, so a new in-memory snapshot compares exactly like it
+    will once loaded from disk (for example, tuples become lists in JSON)."""
+    if fmt == 'pickle':
+        return pickle.loads(pickle.dumps(val, protocol=min(4, pickle.HIGHEST_PROTOCOL)))
+    return json.loads(json.dumps(val, cls=_Encoder), cls=_Decoder)
+
+
+class _NoDigest(Exception):
+    """Raised when a val has no canonical encoding, so it must be compared the slow way."""
+
+
+def _canonical(o, out):
+    """Helper to append the canonical encoding of the given val to the out list of tokens.
+
+    Only exact built-in types are encoded, each tagged with its type, with dict keys and set items
+    sorted, so two vals with the same encoding are always equal.  Anything else (like instances that
+    may define their own ``__eq__``, or NaN that never equals itself) raises :class:`_NoDigest`.
+    """
+    t = type(o)
+    if t is str:
+        # repr() escapes NUL, so the NUL separated tokens can't be ambiguous
+        out.append(repr(o))
+    elif o is None or t is bool:
+        out.append(repr(o))
+    elif t is int:
+        out.append('i%d' % o)
+    elif t is float:
+        if math.isnan(o) or math.isinf(o):
+            raise _NoDigest()
+        out.append('f' + repr(o))
+    elif t is complex:
+        if math.isnan(o.real) or math.isnan(o.imag):
+            raise _NoDigest()
+        out.append('c' + repr(o))
+    elif t is list or t is tuple:
+        out.append('[' if t is list else '(')
+        for x in o:
+            _canonical(x, out)
+        out.append(']')
+    elif t is dict:
+        out.append('{')
+        items = []
+        for k, v in o.items():
+            key = []
+            _canonical(k, key)
+            items.append(('\0'.join(key), v))
+        items.sort(key=lambda kv: kv[0])
+        for k, v in items:
+            out.append(k)
+            _canonical(v, out)
+        out.append('}')
+    elif t is set:
+        items = []
+        for x in o:
+            item = []
+            _canonical(x, item)
+            items.append('\0'.join(item))
+        out.append('<')
+        out.extend(sorted(items))
+        out.append('>')
+    elif t is datetime.datetime:
+        out.append('d' + o.isoformat())
+    else:
+        raise _NoDigest()
+
+
+def _encode(val):
+    """Helper to get the canonical encoding of the given val as bytes, or None if it has none."""
+    out = []
+    try:
+        _canonical(val, out)
+    except (_NoDigest, RuntimeError):
+        # RuntimeError is the base of RecursionError (3.5+), raised for too deeply nested vals
+        return None
+    return '\0'.join(out).encode('utf-8', 'surrogatepass')
+
+
+def _digest(val):
+    """Helper to hash the canonical encoding of the given val, or None if it has none."""
+    enc = _encode(val)
+    return None if enc is None else hashlib.sha256(enc).hexdigest()
+
+
+def _digests(data):
+    """Helper to hash each entry of a line-keyed snapshot file, or None if it's not line-keyed."""
+    if not isinstance(data, dict):
+        return None
+    return dict((k, _digest(v)) for k, v in data.items())
+
+
+def _stat_key(name):
+    """Helper to get the mtime and size of the given file, that an index entry is valid for."""
+    st = os.stat(name)
+    return [st.st_mtime_ns, st.st_size]
+
+
+class _SnapshotFile(object):
+    """A snapshot file held in memory by the :class:`_SnapshotStore`.
+
+    Its data is loaded lazily.  For a line-keyed snapshot file with a valid snapshot index entry (with
+    the same mtime and size as the file), the content hash of each entry is known without loading it,
+    so a few entries can be checked without decoding the whole file.
+    """
+
+    __slots__ = ('path', 'fmt', 'keyed', 'stats', '_data', 'hashes', 'hashed', 'stat', 'dirty', 'changed',
+                 'reindex', 'touched')
+
+    def __init__(self, path, fmt='json', keyed=True, entry=None, stats=None):
+        self.path = path
+        self.fmt = fmt
+        self.keyed = keyed
+        # the store's counters of bytes and files read and written
+        self.stats = stats if stats is not None else _stats()
+        self.dirty = False
+        # keys used by this process
+        self.touched = set()
+        # keys set by this process, or None if not a line-keyed snapshot
+        self.changed = None
+        # True if the hashes should be written to the snapshot index
+        self.reindex = False
+        # bytes of canonical encoding hashed instead of loading the file
+        self.hashed = 0
+        self._data, self.hashes, self.stat = _UNLOADED, None, None
+        if not os.path.isfile(path):
+            self._data = _NOT_FOUND
+        elif keyed and entry is not None and entry.get('stat') == _stat_key(path):
+            self.hashes, self.stat = dict(entry['hashes']), entry['stat']
+
+    @property
+    def data(self):
+        if self._data is _UNLOADED:
+            # stat before loading, so a concurrent replace can only make the index entry stale, not wrong
+            stat = _stat_key(self.path)
+            self._data = _load(self.path, self.fmt)
+            self.stats['read'] += stat[1]
+            self.stats['files_read'] += 1
+            if self.keyed and self.hashes is None:
+                self.hashes, self.stat = _digests(self._data), stat
+                self.reindex = self.hashes is not None
+        return self._data
+
+    @data.setter
+    def data(self, val):
+        self._data = val
+
+    def has(self, key):
+        """Return True if the snapshot with the given key (or the empty key for the whole file) exists."""
+        if self._data is _UNLOADED and self.hashes is not None:
+            return key in self.hashes
+        data = self.data
+        if data is _NOT_FOUND:
+            return False
+        return key == '' or key in data
+
+    def get(self, key):
+        """Get the snapshot with the given key (or the empty key for the whole file)."""
+        return self.data if key == '' else self.data[key]
+
+    def keys(self):
+        """Get the keys of a line-keyed snapshot file, without loading it if they are in the index."""
+        if self._data is _UNLOADED and self.hashes is not None:
+            return set(self.hashes)
+        data = self.data
+        return set(data) if isinstance(data, dict) else set()
+
+    def matches(self, key, val):
+        """Return True if the given val is known to be equal to the entry with the given key, because it
+        has the same content hash.  False means unknown, so the entry must be compared the slow way.
+
+        Hashing is only faster than loading the file for a few entries, so once a fraction of the file
+        size has been hashed (see ``_HASH_BUDGET``), or once the file is loaded anyway, entries are just
+        compared.
+        """
+        if self._data is not _UNLOADED or self.hashes is None or self.hashed >= self.stat[1] * _HASH_BUDGET:
+            return False
+        expected = self.hashes.get(key)
+        if expected is None:
+            return False
+        enc = _encode(val)
+        if enc is None:
+            return False
+        self.hashed += len(enc)
+        return hashlib.sha256(enc).hexdigest() == expected
+
+    def set(self, val, key=''):
+        """Set the whole snapshot to val, or the given key of a line-keyed snapshot, and mark it dirty."""
+        if key == '':
+            self._data = val
+        else:
+            if self.data is _NOT_FOUND:
+                self._data = {}
+            self._data[key] = val
+            if self.changed is None:
+                self.changed = set()
+            self.changed.add(key)
+        # no longer valid, until rehashed when written
+        self.hashes = None
+        self.dirty = True
+
+    def write(self):
+        """Write this snapshot file under its lock.  A line-keyed snapshot is first merged with the file on
+        disk, so the entries written by concurrent workers since it was loaded are kept."""
+        if not os.path.isdir(os.path.dirname(self.path)):
+            _makedirs(os.path.dirname(self.path))
+        with _locked(self.path):
+            if self.changed is not None and os.path.isfile(self.path):
+                self.stats['read'] += os.path.getsize(self.path)
+                self.stats['files_read'] += 1
+                merged = _load(self.path, self.fmt)
+                if isinstance(merged, dict):
+                    for key in self.changed:
+                        merged[key] = self._data[key]
+                    self._data = merged
+            _save(self.path, self._data, self.fmt)
+            self.stat = _stat_key(self.path)
+        self.stats['written'] += self.stat[1]
+        self.stats['files_written'] += 1
+        if self.keyed:
+            self.hashes = _digests(self._data)
+            self.reindex = self.hashes is not None
+        self.dirty = False
+        self.changed = None
+
+    def entry(self):
+        """Get the snapshot index entry for this file."""
+        return {'stat': self.stat, 'hashes': self.hashes}
+
+
+def _stats():
+    """Helper to make zeroed snapshot counters: bytes and files read and written, and entries updated."""
+    return dict.fromkeys(('read', 'files_read', 'written', 'files_written', 'updated'), 0)
+
+
+def _index_path(d):
+    """Helper to get the path of the snapshot index of the given snapshot directory, in the cache directory."""
+    key = hashlib.sha1(os.path.abspath(d).encode('utf-8', 'surrogatepass')).hexdigest()
+    return os.path.join(_cache_dir('snapshot-index'), key + '.json')
+
+
+def _load_index(name):
+    """Helper to read the given snapshot index, or an empty index if it is missing or unreadable."""
+    try:
+        with open(name, 'r') as fp:
+            index = json.load(fp)
+        return index if isinstance(index, dict) else {}
+    except (IOError, OSError, ValueError):
+        return {}
+
+
+def _save_index(name, index):
+    """Helper to write the given snapshot index atomically."""
+    _replace(name, lambda fp: json.dump(index, fp, indent=2, separators=(',', ': '), sort_keys=True))
+
+
+class _SnapshotStore(object):
+    """Process-wide in-memory store of snapshot files.
+
+    Each snapshot file is loaded at most once, all lookups are served from memory, and new snapshots
+    are collected in memory until :meth:`flush` writes each dirty file just once, either at the end of
+    the pytest session (see :mod:`assertpy.pytest_plugin`) or at interpreter exit.
+
+    Each snapshot directory has an index (see :func:`_index_path`, kept in the cache directory) of the content
+    hash of every entry of its line-keyed snapshot files, so unchanged entries are checked by hash, without
+    loading the file.
+
+    In update mode (see :meth:`updating`), snapshots that differ are rewritten instead of failing.  The
+    store keeps counters of the snapshot bytes and files read and written, and the entries updated, for
+    the session (in :attr:`stats`), and finds the snapshots no test used (with :meth:`unused`).
+    """
+
+    def __init__(self):
+        self.files = {}
+        self.indexes = {}
+        self.stats = _stats()
+        # update mode, set by the pytest plugin
+        self.update = False
+        self.lock = threading.RLock()
+        self._atexit = False
+
+    def updating(self):
+        """Return True in update mode: turned on by the pytest plugin's ``--snapshot-update`` option, or by
+        setting the ``ASSERTPY_SNAPSHOT_UPDATE`` environment variable to ``1``, ``true``, ``yes``, or ``on``."""
+        return self.update or os.environ.get(_UPDATE_ENV, '').lower() in ('1', 'true', 'yes', 'on')
+
+    def get(self, name, fmt='json', keyed=True):
+        """Get the snapshot file with the given name (in the given format), loading it on first use."""
+        path = os.path.abspath(name)
+        snap = self.files.get(path)
+        if snap is None:
+            d, base = os.path.split(path)
+            index = self.indexes.get(d)
+            if index is None:
+                index = self.indexes[d] = _load_index(_index_path(d))
+            snap = _SnapshotFile(path, fmt, keyed, index.get(base), self.stats)
+            self.files[path] = snap
+            if not self._atexit:
+                atexit.register(self.flush)
+                self._atexit = True
+        return snap
+
+    def flush(self):
+        """Write every dirty snapshot file to disk, then update the snapshot index of each directory."""
+        with self.lock:
+            entries = {}
+            for snap in self.files.values():
+                if snap.dirty:
+                    snap.write()
+                if snap.reindex:
+                    d, base = os.path.split(snap.path)
+                    entries.setdefault(d, {})[base] = snap.entry()
+                    snap.reindex = False
+            for d, updates in entries.items():
+                name = _index_path(d)
+                try:
+                    if not os.path.isdir(os.path.dirname(name)):
+                        _makedirs(os.path.dirname(name))
+                    with _locked(name):
+                        # merge with the entries written by concurrent workers
+                        index = _load_index(name)
+                        index.update(updates)
+                        _save_index(name, index)
+                except (IOError, OSError):
+                    # the index is just a cache, so skip it if it can't be written
+                    continue
+                self.indexes[d] = index
+
+    def unused(self):
+        """Find the snapshots no test used, in every snapshot directory used: a list of tuples of the
+        snapshot file path, and the unused key of a line-keyed snapshot file, or None for a whole file."""
+        found = []
+        with self.lock:
+            for d in sorted(set(os.path.dirname(path) for path in self.files)):
+                if not os.path.isdir(d):
+                    continue
+                for name in sorted(os.listdir(d)):
+                    if not name.startswith('snap-'):
+                        continue
+                    path = os.path.join(d, name)
+                    snap = self.files.get(path)
+                    if snap is None or not snap.touched:
+                        found.append((path, None))
+                    elif snap.keyed:
+                        for key in sorted(snap.keys() - snap.touched, key=lambda k: (len(k), k)):
+                            found.append((path, key))
+        return found
+
+    def clear(self):
+        """Flush, then forget all loaded snapshot files, so they are loaded from disk again on next use."""
+        with self.lock:
+            self.flush()
+            self.files.clear()
+            self.indexes.clear()
+
+
+_store = _SnapshotStore()
+
 
 class SnapshotMixin(object):
     """Snapshot mixin.
@@ -65,15 +827,52 @@ class SnapshotMixin(object):
     The JSON formatting support most python data structures (dict, list, object, etc), but not custom
     binary data.
 
+    Custom types can be added with :func:`add_snapshot_type`.
+
+    Large snapshots can be stored in a smaller or faster format with the ``format`` arg: ``json.gz``
+    (gzipped minified JSON, in a ``.json.gz`` file), ``compact`` (minified JSON, in a ``.min.json``
+    file), or ``pickle`` (Python's own binary format, in a ``.pickle`` file, which is the fastest and
+    keeps tuples as tuples, but is not human readable or diffable).  Snapshot files are written
+    as streams, so no in-memory copy of the encoded snapshot is built, but JSON snapshots are read
+    whole (the ``json`` module can't decode incrementally), with ``json.gz`` decompressed as it is read.
+
+    **Storage**
+
+    Each snapshot file is loaded just once per test session, and all lookups are served from memory.
+    New snapshots are collected in memory and each changed snapshot file is written just once, at the
+    end of the pytest session if the ``assertpy.pytest_plugin`` is enabled (with
+    ``-p assertpy.pytest_plugin``), otherwise at interpreter exit.
+
+    Snapshot files are safe to share between parallel test workers (like ``pytest-xdist``).  Each file
+    is written atomically (to a temp file that is renamed over it) while holding an advisory lock (where
+    ``fcntl`` is available), and line-keyed snapshot files are merged with the entries written by other
+    workers.
+
+    Only the ``snap-*`` files belong in source control.  Lock files and snapshot indexes are kept in
+    the assertpy cache directory, never in the snapshot directory.
+
+    Each snapshot directory also has an index with the content hash of each entry of its line-keyed
+    snapshot files, valid while each file has the same mtime and size.  So when only a few tests are
+    run, their unchanged snapshots are checked by hash without loading the file.  The assertpy cache
+    directory is ``$ASSERTPY_CACHE_DIR``, or ``assertpy`` in ``$XDG_CACHE_HOME`` or ``~/.cache``, and
+    indexes are skipped if it can't be written.
+
     **Updating**
 
-    It's easy to update your snapshots...just delete them all and re-run the test suite to regenerate all snapshots.
+    To update your snapshots, re-run the test suite in update mode, either with the ``--snapshot-update``
+    option of the ``assertpy.pytest_plugin``, or with the ``ASSERTPY_SNAPSHOT_UPDATE=1`` environment
+    variable.  Only the snapshots that differ are rewritten, and the tests pass.
+
+    With the plugin, the pytest summary also lists the snapshots no test used in the session (so they
+    can be deleted, after running the whole suite), and the snapshot bytes read and written.
 
     Note:
         Snapshots require Python 3.x
     """
 
-    def snapshot(self, id=None, path='__snapshots'):
+    __slots__ = ()
+
+    def snapshot(self, id=None, path='__snapshots', format='json'):
         """Asserts that val is identical to the on-disk snapshot stored previously.
 
         On the first run of a test before the snapshot file has been saved, a snapshot is created,
@@ -85,9 +884,14 @@ class SnapshotMixin(object):
 
         Snapshots are identified by test filename plus line number by default.
 
+        New and updated snapshots are written at the end of the pytest session (with the assertpy
+        pytest plugin), or else at interpreter exit.  So a process that exits without running its exit
+        hooks (like a forked worker, or ``os._exit()``) must call :func:`flush_snapshots` first.
+
         Args:
             id: the item or items expected to be contained
             path: the item or items expected to be contained
+            format: the on-disk format, one of ``json`` (the default), ``json.gz``, ``pickle``, or ``compact``
 
         Examples:
             Usage::
@@ -112,63 +916,25 @@ class SnapshotMixin(object):
 
                 assert_that({'a': 1, 'b': 2, 'c': 3}).snapshot(path='my-custom-folder')
 
+            By default, snapshots are stored as pretty-printed JSON.  Alternately, you can specify a smaller or faster format using the ``format`` arg::
+
+                assert_that(big_response).snapshot(format='json.gz')
+
         Returns:
             AssertionBuilder: returns this instance to chain to the next assertion
 
         Raises:
             AssertionError: if val does **not** equal to on-disk snapshot
+            ValueError: if format is not a known snapshot format
         """
         if sys.version_info[0] < 3:
             raise NotImplementedError('snapshot testing requires Python 3')
 
-        class _Encoder(json.JSONEncoder):
-            def default(self, o):
-                if isinstance(o, set):
-                    return {'__type__': 'set', '__data__': list(o)}
-                elif isinstance(o, complex):
-                    return {'__type__': 'complex', '__data__': [o.real, o.imag]}
-                elif isinstance(o, datetime.datetime):
-                    return {'__type__': 'datetime', '__data__': o.strftime('%Y-%m-%d %H:%M:%S')}
-                elif '__dict__' in dir(o) and type(o) is not type:
-                    return {
-                        '__type__': 'instance',
-                        '__class__': o.__class__.__name__,
-                        '__module__': o.__class__.__module__,
-                        '__data__': o.__dict__
-                    }
-                return json.JSONEncoder.default(self, o)
-
-        class _Decoder(json.JSONDecoder):
-            def __init__(self):
-                json.JSONDecoder.__init__(self, object_hook=self.object_hook)
-
-            def object_hook(self, d):
-                if '__type__' in d and '__data__' in d:
-                    if d['__type__'] == 'set':
-                        return set(d['__data__'])
-                    elif d['__type__'] == 'complex':
-                        return complex(d['__data__'][0], d['__data__'][1])
-                    elif d['__type__'] == 'datetime':
-                        return datetime.datetime.strptime(d['__data__'], '%Y-%m-%d %H:%M:%S')
-                    elif d['__type__'] == 'instance':
-                        mod = __import__(d['__module__'], fromlist=[d['__class__']])
-                        klass = getattr(mod, d['__class__'])
-                        inst = klass.__new__(klass)
-                        inst.__dict__ = d['__data__']
-                        return inst
-                return d
-
-        def _save(name, val):
-            with open(name, 'w') as fp:
-                json.dump(val, fp, indent=2, separators=(',', ': '), sort_keys=True, cls=_Encoder)
-
-        def _load(name):
-            with open(name, 'r') as fp:
-                return json.load(fp, cls=_Decoder)
+        ext = _format(format).ext
 
         def _name(path, name):
             try:
-                return os.path.join(path, 'snap-%s.json' % name.replace(' ', '_').lower())
+                return os.path.join(path, 'snap-%s%s' % (name.replace(' ', '_').lower(), ext))
             except Exception:
                 raise ValueError('failed to create snapshot filename, either bad path or bad name')
 
@@ -183,26 +949,26 @@ class SnapshotMixin(object):
             lineno = str(f.f_back.f_lineno)
             snapname = _name(path, fname)
 
-        if not os.path.exists(path):
-            os.makedirs(path)
-
-        if os.path.isfile(snapname):
-            # snap exists, so load
-            snap = _load(snapname)
-
-            if id:
-                # custom id, so test
-                return self.is_equal_to(snap)
-            else:
-                if lineno in snap:
-                    # found sub-snap, so test
-                    return self.is_equal_to(snap[lineno])
-                else:
-                    # lineno not in snap, so create sub-snap and pass
-                    snap[lineno] = self.val
-                    _save(snapname, snap)
-        else:
-            # no snap, so create and pass
-            _save(snapname, self.val if id else {lineno: self.val})
-
-        return self
+        if not os.path.isdir(path):
+            _makedirs(path)
+
+        key = '' if id else lineno
+        with _store.lock:
+            snap = _store.get(snapname, format, keyed=not id)
+            snap.touched.add(key)
+            if not snap.has(key):
+                # no snap, so create and pass
+                snap.set(_roundtrip(self.val, format), key)
+                return self
+            if snap.matches(key, self.val):
+                # same content hash, so pass without loading or comparing
+                return self
+            expected = snap.get(key)
+            if _store.updating():
+                # update mode, so rewrite the snap if it differs and pass
+                val = _roundtrip(self.val, format)
+                if val != expected:
+                    snap.set(val, key)
+                    _store.stats['updated'] += 1
+                return self
+        return self.is_equal_to(expected)
@@ -0,0 +1,135 @@
+# Copyright (c) 2015-2019, Activision Publishing, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+# may be used to endorse or promote products derived from this software without
+# specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON
+# ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import collections
+
+from .helpers import _formatter
+
+__tracebackhide__ = True
+
+
+def stream(iterable, window=10):
+    """Wrap the given iterable (typically a generator or iterator) for assertions in *stream mode*.
+
+    Most assertions assume val has a ``len()`` and can be iterated more than once, so asserting on a
+    huge generator means materializing it with ``list()`` first.  Instead, in stream mode each
+    assertion consumes the iterable exactly once, in constant (or bounded) memory, keeping only a
+    small window of the most recent items for the failure message.
+
+    Assertions that stream:
+
+    * :meth:`~assertpy.base.BaseMixin.is_length`
+    * :meth:`~assertpy.contains.ContainsMixin.is_empty`, :meth:`~assertpy.contains.ContainsMixin.is_not_empty`
+    * :meth:`~assertpy.contains.ContainsMixin.contains`, :meth:`~assertpy.contains.ContainsMixin.does_not_contain` (stop early when possible)
+    * :meth:`~assertpy.contains.ContainsMixin.contains_sequence`
+    * :meth:`~assertpy.contains.ContainsMixin.contains_duplicates`, :meth:`~assertpy.contains.ContainsMixin.does_not_contain_duplicates`
+      (memory bounded by the number of distinct items)
+    * :meth:`~assertpy.collection.CollectionMixin.is_sorted`
+    * :meth:`~assertpy.string.StringMixin.starts_with`, :meth:`~assertpy.string.StringMixin.ends_with`
+    * :meth:`~assertpy.collection.CollectionMixin.is_iterable`
+    * :meth:`~assertpy.extracting.ExtractingMixin.extracting` (the extracted list is materialized, or use ``lazy=True`` to extract into a new stream)
+
+    Since a stream can only be consumed once, only a single consuming assertion can be made on it.
+    A second one raises ``ValueError``.
+
+    Args:
+        iterable: the iterable to wrap
+        window (int): the number of most recent items kept for failure messages.  Defaults to ``10``
+
+    Examples:
+        Usage::
+
+            from assertpy import assert_that, stream
+
+            assert_that(stream(read_events())).is_length(1000000)
+            assert_that(stream(x * x for x in range(1000000))).is_sorted()
+
+            assert_that(stream(iter([1, 2, 3, 4, 5, 0, 6]))).is_sorted()  # fails
+            # Expected <stream([..., 3, 4, 5, 0, ...])> to be sorted, but subset <5, 0> at index 4 is not.
+
+    Returns:
+        Stream: the wrapped iterable, to pass to :meth:`~assertpy.assertpy.assert_that`
+    """
+    if type(window) is not int:
+        raise TypeError('given window arg must be an int')
+    if window < 1:
+        raise ValueError('given window arg must be a positive int')
+    return Stream(iter(iterable), window)
+
+
+class Stream(object):
+    """Single-pass iterable wrapper for assertions in stream mode, see :meth:`stream`."""
+
+    __slots__ = ('_it', '_recent', 'count', 'consumed', 'exhausted', '_more')
+
+    def __init__(self, it, window):
+        self._it = it
+        self._recent = collections.deque(maxlen=window)
+        self.count = 0
+        self.consumed = False
+        self.exhausted = False
+        self._more = None
+
+    def __iter__(self):
+        if self.consumed:
+            raise ValueError('stream already consumed, only one assertion can consume a stream')
+        self.consumed = True
+        return self._iter()
+
+    def _iter(self):
+        recent = self._recent
+        for x in self._it:
+            recent.append(x)
+            self.count += 1
+            yield x
+        self.exhausted = True
+
+    def __str__(self):
+        out = _formatter.format(list(self._recent))[1:-1]
+        if self.count > len(self._recent):
+            out = '..., ' + out if out else '...'
+        if self._has_more():
+            out = out + ', ...' if out else '...'
+        return 'stream([%s])' % out
+
+    __repr__ = __str__
+
+    def _has_more(self):
+        """Helper to check if items may remain after the ones consumed.  Once consumed (so no assertion
+        needs the rest), an assertion that stopped early peeks a single item to know for sure."""
+        if self.exhausted:
+            return False
+        if self.consumed and self._more is None:
+            try:
+                next(self._it)
+                self._more = True
+            except StopIteration:
+                self.exhausted = True
+                self._more = False
+        return self._more is not False
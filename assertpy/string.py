@@ -34,17 +34,23 @@ if sys.version_info[0] == 3:
     str_types = (str,)
     unicode = str
     Iterable = collections.abc.Iterable
+    Sequence = collections.abc.Sequence
 else:
     str_types = (basestring,)
     unicode = unicode
     Iterable = collections.Iterable
+    Sequence = collections.Sequence
 
 __tracebackhide__ = True
 
+_EMPTY = object()
+
 
 class StringMixin(object):
     """String assertions mixin."""
 
+    __slots__ = ()
+
     def is_equal_to_ignoring_case(self, other):
         """Asserts that val is a string and is case-insensitive equal to other.
 
@@ -71,7 +77,7 @@ class StringMixin(object):
         if not isinstance(other, str_types):
             raise TypeError('given arg must be a string')
         if self.val.lower() != other.lower():
-            return self.error('Expected <%s> to be case-insensitive equal to <%s>, but was not.' % (self.val, other))
+            return self.error('Expected <%s> to be case-insensitive equal to <%s>, but was not.' % (self._fmt_val(self.val), self._fmt_val(other)))
         return self
 
     def contains_ignoring_case(self, *items):
@@ -103,7 +109,7 @@ class StringMixin(object):
                 if not isinstance(items[0], str_types):
                     raise TypeError('given arg must be a string')
                 if items[0].lower() not in self.val.lower():
-                    return self.error('Expected <%s> to case-insensitive contain item <%s>, but did not.' % (self.val, items[0]))
+                    return self.error('Expected <%s> to case-insensitive contain item <%s>, but did not.' % (self._fmt_val(self.val), self._fmt_val(items[0])))
             else:
                 missing = []
                 for i in items:
@@ -113,7 +119,7 @@ class StringMixin(object):
                         missing.append(i)
                 if missing:
                     return self.error('Expected <%s> to case-insensitive contain items %s, but did not contain %s.' % (
-                        self.val, self._fmt_items(items), self._fmt_items(missing)))
+                        self._fmt_val(self.val), self._fmt_items(items), self._fmt_items(missing)))
         elif isinstance(self.val, Iterable):
             missing = []
             for i in items:
@@ -130,7 +136,7 @@ class StringMixin(object):
                     missing.append(i)
             if missing:
                 return self.error('Expected <%s> to case-insensitive contain items %s, but did not contain %s.' % (
-                    self.val, self._fmt_items(items), self._fmt_items(missing)))
+                    self._fmt_val(self.val), self._fmt_items(items), self._fmt_items(missing)))
         else:
             raise TypeError('val is not a string or iterable')
         return self
@@ -163,13 +169,13 @@ class StringMixin(object):
             if len(prefix) == 0:
                 raise ValueError('given prefix arg must not be empty')
             if not self.val.startswith(prefix):
-                return self.error('Expected <%s> to start with <%s>, but did not.' % (self.val, prefix))
+                return self.error('Expected <%s> to start with <%s>, but did not.' % (self._fmt_val(self.val), prefix))
         elif isinstance(self.val, Iterable):
-            if len(self.val) == 0:
+            first = next(iter(self.val), _EMPTY)
+            if first is _EMPTY:
                 raise ValueError('val must not be empty')
-            first = next(iter(self.val))
             if first != prefix:
-                return self.error('Expected %s to start with <%s>, but did not.' % (self.val, prefix))
+                return self.error('Expected %s to start with <%s>, but did not.' % (self._fmt_val(self.val), prefix))
         else:
             raise TypeError('val is not a string or iterable')
         return self
@@ -202,15 +208,18 @@ class StringMixin(object):
             if len(suffix) == 0:
                 raise ValueError('given suffix arg must not be empty')
             if not self.val.endswith(suffix):
-                return self.error('Expected <%s> to end with <%s>, but did not.' % (self.val, suffix))
+                return self.error('Expected <%s> to end with <%s>, but did not.' % (self._fmt_val(self.val), suffix))
         elif isinstance(self.val, Iterable):
-            if len(self.val) == 0:
+            if isinstance(self.val, Sequence):
+                last = self.val[-1] if len(self.val) > 0 else _EMPTY
+            else:
+                last = _EMPTY
+                for last in self.val:
+                    pass
+            if last is _EMPTY:
                 raise ValueError('val must not be empty')
-            last = None
-            for last in self.val:
-                pass
             if last != suffix:
-                return self.error('Expected %s to end with <%s>, but did not.' % (self.val, suffix))
+                return self.error('Expected %s to end with <%s>, but did not.' % (self._fmt_val(self.val), suffix))
         else:
             raise TypeError('val is not a string or iterable')
         return self
@@ -271,7 +280,7 @@ class StringMixin(object):
         if len(pattern) == 0:
             raise ValueError('given pattern arg must not be empty')
         if re.search(pattern, self.val) is None:
-            return self.error('Expected <%s> to match pattern <%s>, but did not.' % (self.val, pattern))
+            return self.error('Expected <%s> to match pattern <%s>, but did not.' % (self._fmt_val(self.val), pattern))
         return self
 
     def does_not_match(self, pattern):
@@ -302,7 +311,7 @@ class StringMixin(object):
         if len(pattern) == 0:
             raise ValueError('given pattern arg must not be empty')
         if re.search(pattern, self.val) is not None:
-            return self.error('Expected <%s> to not match pattern <%s>, but did.' % (self.val, pattern))
+            return self.error('Expected <%s> to not match pattern <%s>, but did.' % (self._fmt_val(self.val), pattern))
         return self
 
     def is_alpha(self):
@@ -324,7 +333,7 @@ class StringMixin(object):
         if len(self.val) == 0:
             raise ValueError('val is empty')
         if not self.val.isalpha():
-            return self.error('Expected <%s> to contain only alphabetic chars, but did not.' % self.val)
+            return self.error('Expected <%s> to contain only alphabetic chars, but did not.' % self._fmt_val(self.val))
         return self
 
     def is_digit(self):
@@ -346,7 +355,7 @@ class StringMixin(object):
         if len(self.val) == 0:
             raise ValueError('val is empty')
         if not self.val.isdigit():
-            return self.error('Expected <%s> to contain only digits, but did not.' % self.val)
+            return self.error('Expected <%s> to contain only digits, but did not.' % self._fmt_val(self.val))
         return self
 
     def is_lower(self):
@@ -368,7 +377,7 @@ class StringMixin(object):
         if len(self.val) == 0:
             raise ValueError('val is empty')
         if self.val != self.val.lower():
-            return self.error('Expected <%s> to contain only lowercase chars, but did not.' % self.val)
+            return self.error('Expected <%s> to contain only lowercase chars, but did not.' % self._fmt_val(self.val))
         return self
 
     def is_upper(self):
@@ -390,7 +399,7 @@ class StringMixin(object):
         if len(self.val) == 0:
             raise ValueError('val is empty')
         if self.val != self.val.upper():
-            return self.error('Expected <%s> to contain only uppercase chars, but did not.' % self.val)
+            return self.error('Expected <%s> to contain only uppercase chars, but did not.' % self._fmt_val(self.val))
         return self
 
     def is_unicode(self):
@@ -409,5 +418,5 @@ class StringMixin(object):
             AssertionError: if val is **not** a unicode string
         """
         if type(self.val) is not unicode:
-            return self.error('Expected <%s> to be unicode, but was <%s>.' % (self.val, type(self.val).__name__))
+            return self.error('Expected <%s> to be unicode, but was <%s>.' % (self._fmt_val(self.val), type(self.val).__name__))
         return self
@@ -0,0 +1,87 @@
+# Copyright (c) 2015-2019, Activision Publishing, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+# may be used to endorse or promote products derived from this software without
+# specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON
+# ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+"""Memory benchmark of AssertionBuilder construction using tracemalloc.
+
+Compares the bytes allocated per builder when calling assert_that() for every record, against
+re-pointing a single builder at each record with reset().
+
+Usage::
+
+    python benchmarks/bench_builder_memory.py
+"""
+
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from assertpy import assert_that  # noqa: E402
+
+N = 100000
+
+
+def _measure(func):
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    keep = func()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del keep
+    return current - before, peak - before
+
+
+def retained_builders():
+    records = list(range(N))
+    return records, [assert_that(r) for r in records]
+
+
+def fresh_builder_per_record():
+    for r in range(N):
+        assert_that(r).is_not_none()
+
+
+def reused_builder():
+    ab = assert_that(None)
+    for r in range(N):
+        ab.reset(r).is_not_none()
+
+
+def main():
+    retained, _ = _measure(retained_builders)
+    print('retained builders:          %8.1f bytes/builder (incl. records and list)' % (retained / float(N)))
+    for name, func in [('assert_that() per record', fresh_builder_per_record), ('reset() per record', reused_builder)]:
+        _, peak = _measure(func)
+        print('%-27s peak %8d bytes over %d records' % (name + ':', peak, N))
+
+
+if __name__ == '__main__':
+    main()
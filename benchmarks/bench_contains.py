@@ -0,0 +1,68 @@
+# Copyright (c) 2015-2019, Activision Publishing, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+# may be used to endorse or promote products derived from this software without
+# specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON
+# ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+"""Benchmark of multi-item contains(), does_not_contain() and contains_only() on lists of 10^3 to 10^6
+elements, checking 1,000 expected items each.
+
+Usage::
+
+    python benchmarks/bench_contains.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from assertpy import assert_that  # noqa: E402
+
+M = 1000
+
+
+def main():
+    print('%10s %16s %16s %16s %16s' % ('n', 'contains', 'not_contain', 'contains_only', 'linear scan'))
+    for n in [10**3, 10**4, 10**5, 10**6]:
+        val = list(range(n))
+        items = val[-M:] if n >= M else val
+        absent = list(range(-M, 0))
+        only = val[:]
+        t1 = min(timeit.repeat(lambda: assert_that(val).contains(*items), number=1, repeat=3))
+        t2 = min(timeit.repeat(lambda: assert_that(val).does_not_contain(*absent), number=1, repeat=3))
+        t3 = min(timeit.repeat(lambda: assert_that(val).contains_only(*only), number=1, repeat=3))
+        # the old O(n*m) behavior, for comparison (only run on the small sizes)
+        if n <= 10**5:
+            t4 = '%15.4fs' % min(timeit.repeat(lambda: [i in val for i in items], number=1, repeat=3))
+        else:
+            t4 = '%16s' % '(skipped)'
+        print('%10d %15.4fs %15.4fs %15.4fs %s' % (n, t1, t2, t3, t4))
+
+
+if __name__ == '__main__':
+    main()
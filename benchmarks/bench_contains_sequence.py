@@ -0,0 +1,77 @@
+# Copyright (c) 2015-2019, Activision Publishing, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+# may be used to endorse or promote products derived from this software without
+# specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON
+# ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+"""Benchmark of contains_sequence() searching for a 50-event sequence in streams of events.
+
+Usage::
+
+    python benchmarks/bench_contains_sequence.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from assertpy import assert_that  # noqa: E402
+
+M = 50
+
+
+def _nested_loop(val, items):
+    # the old O(n*m) implementation, for comparison
+    for i in range(len(val) - len(items) + 1):
+        for j in range(len(items)):
+            if val[i+j] != items[j]:
+                break
+        else:
+            return True
+    return False
+
+
+def main():
+    print('%10s %14s %14s %14s %14s' % ('n', 'list', 'generator', 'str', 'nested loop'))
+    for n in [10**4, 10**5, 10**6]:
+        # worst case for the nested loop: long runs of partial matches
+        events = ([0] * (M - 1) + [2]) * (n // M)
+        events[-1] = 1
+        items = [0] * (M - 1) + [1]
+        text = ''.join('a' if e == 0 else 'b' if e == 2 else 'c' for e in events)
+        chars = ['a'] * (M - 1) + ['c']
+
+        t1 = min(timeit.repeat(lambda: assert_that(events).contains_sequence(*items), number=1, repeat=3))
+        t2 = min(timeit.repeat(lambda: assert_that(e for e in events).contains_sequence(*items), number=1, repeat=3))
+        t3 = min(timeit.repeat(lambda: assert_that(text).contains_sequence(*chars), number=1, repeat=3))
+        t4 = min(timeit.repeat(lambda: _nested_loop(events, items), number=1, repeat=1))
+        print('%10d %13.4fs %13.4fs %13.4fs %13.4fs' % (n, t1, t2, t3, t4))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+# Copyright (c) 2015-2019, Activision Publishing, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+# may be used to endorse or promote products derived from this software without
+# specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON
+# ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+"""Benchmark of 100,000 dynamic ``has_<name>()`` assertions on objects and dicts: with the strategy and
+wrapper caches (the default), without them (emulated by clearing the caches before each assertion),
+and the equivalent ``extracting()`` check of all values at once.
+
+Usage::
+
+    python benchmarks/bench_dynamic.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from assertpy import assert_that  # noqa: E402
+from assertpy import dynamic  # noqa: E402
+
+N = 100000
+
+
+class Person(object):
+    def __init__(self, i):
+        self.id = i
+        self.name = 'user%d' % i
+
+
+def uncached(val, expected):
+    dynamic._strategies.clear()
+    dynamic._wrappers.clear()
+    assert_that(val).has_name(expected)
+
+
+def cached(val, expected):
+    assert_that(val).has_name(expected)
+
+
+def main():
+    for label, vals in [('object', [Person(i) for i in range(N)]), ('dict', [{'id': i, 'name': 'user%d' % i} for i in range(N)])]:
+        names = ['user%d' % i for i in range(N)]
+        print('%s vals:' % label)
+        print('%12s %10s' % ('check', 'time'))
+        for check, func in [('uncached', uncached), ('cached', cached)]:
+            t = min(timeit.repeat(lambda: [func(v, n) for v, n in zip(vals, names)], number=1, repeat=3))
+            print('%12s %9.4fs' % (check, t))
+        t = min(timeit.repeat(lambda: assert_that(vals).extracting('name').is_equal_to(names), number=1, repeat=3))
+        print('%12s %9.4fs' % ('extracting', t))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+# Copyright (c) 2015-2019, Activision Publishing, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+# may be used to endorse or promote products derived from this software without
+# specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON
+# ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+"""Micro-benchmark of the per-builder cost of assert_that() against the number of registered extensions.
+
+Usage::
+
+    python benchmarks/bench_extensions.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from assertpy import assert_that, add_extension, remove_extension  # noqa: E402
+
+N = 200000
+
+
+def _make_extension(i):
+    def ext(self):
+        return self
+    ext.__name__ = 'is_ext_%d' % i
+    return ext
+
+
+def main():
+    print('%12s %14s' % ('extensions', 'usec/builder'))
+    extensions = []
+    for count in [0, 1, 10, 40, 100, 400]:
+        while len(extensions) < count:
+            ext = _make_extension(len(extensions))
+            add_extension(ext)
+            extensions.append(ext)
+        secs = min(timeit.repeat(lambda: assert_that(1), number=N, repeat=3))
+        print('%12d %14.3f' % (count, secs / N * 1e6))
+    for ext in extensions:
+        remove_extension(ext)
+
+
+if __name__ == '__main__':
+    main()
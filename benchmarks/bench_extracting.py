@@ -0,0 +1,97 @@
+# Copyright (c) 2015-2019, Activision Publishing, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+# may be used to endorse or promote products derived from this software without
+# specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON
+# ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+"""Benchmark of extracting() on 1,000,000 dict records: the default eager list, the old always-sort
+behavior (emulated with a constant sort key), and the lazy stream where contains() stops at the first match.
+Then, extracting 5 columns from 1,000,000 homogeneous dicts, namedtuples, and objects, compared to a raw
+``operator.itemgetter`` (or ``attrgetter``) list comprehension.
+
+Usage::
+
+    python benchmarks/bench_extracting.py
+"""
+
+import os
+import sys
+import timeit
+import operator
+import collections
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from assertpy import assert_that  # noqa: E402
+
+N = 10**6
+COLUMNS = ('a', 'b', 'c', 'd', 'e')
+
+Row = collections.namedtuple('Row', COLUMNS)
+
+
+class Obj(object):
+    __slots__ = COLUMNS
+
+    def __init__(self, *values):
+        for name, v in zip(COLUMNS, values):
+            setattr(self, name, v)
+
+
+def main():
+    records = [{'id': i, 'name': 'user%d' % i, 'active': i % 2 == 0} for i in range(N)]
+    cases = [
+        ('old (always sorted)', lambda: assert_that(records).extracting('id', sort=lambda x: 0).contains(10)),
+        ('eager', lambda: assert_that(records).extracting('id').contains(10)),
+        ('eager + filter', lambda: assert_that(records).extracting('id', filter='active').contains(10)),
+        ('eager + filter dict', lambda: assert_that(records).extracting('id', filter={'active': True, 'id': range(0, N, 3)}).contains(12)),
+        ('lazy', lambda: assert_that(records).extracting('id', lazy=True).contains(10)),
+        ('lazy + filter', lambda: assert_that(records).extracting('id', filter='active', lazy=True).contains(10)),
+    ]
+    print('%22s %12s' % ('extracting', 'time'))
+    for label, case in cases:
+        t = min(timeit.repeat(case, number=1, repeat=3))
+        print('%22s %11.4fs' % (label, t))
+
+    dicts = [dict(zip(COLUMNS, (i, i, i, i, i))) for i in range(N)]
+    tuples = [Row(i, i, i, i, i) for i in range(N)]
+    objs = [Obj(i, i, i, i, i) for i in range(N)]
+    item, attr = operator.itemgetter(*COLUMNS), operator.attrgetter(*COLUMNS)
+    cases = [
+        ('dicts', lambda: [item(x) for x in dicts], lambda: assert_that(dicts).extracting(*COLUMNS)),
+        ('namedtuples', lambda: [attr(x) for x in tuples], lambda: assert_that(tuples).extracting(*COLUMNS)),
+        ('objects', lambda: [attr(x) for x in objs], lambda: assert_that(objs).extracting(*COLUMNS)),
+    ]
+    print()
+    print('%22s %12s %12s' % ('5 columns', 'raw getter', 'extracting'))
+    for label, raw, case in cases:
+        t1 = min(timeit.repeat(raw, number=1, repeat=3))
+        t2 = min(timeit.repeat(case, number=1, repeat=3))
+        print('%22s %11.4fs %11.4fs' % (label, t1, t2))
+
+
+if __name__ == '__main__':
+    main()
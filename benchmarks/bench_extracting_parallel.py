@@ -0,0 +1,78 @@
+# Copyright (c) 2015-2019, Activision Publishing, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+# may be used to endorse or promote products derived from this software without
+# specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON
+# ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+"""Benchmark of extracting() with workers on an expensive zero-arg method, serial vs thread vs process
+executors, for 10 to 10,000 items, to show where parallelism starts to pay off.  The method either
+burns cpu (only a process executor helps) or waits on I/O (threads help too).
+
+Usage::
+
+    python benchmarks/bench_extracting_parallel.py
+"""
+
+import os
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from assertpy import assert_that  # noqa: E402
+
+WORKERS = max(4, os.cpu_count() or 1)
+
+
+class Model(object):
+    def __init__(self, n):
+        self.n = n
+
+    def cpu_total(self):
+        # ~0.1ms of pure python work
+        return sum(i * i for i in range(self.n))
+
+    def io_total(self):
+        # ~0.1ms of waiting, like a lazy-loaded relation
+        time.sleep(0.0001)
+        return self.n
+
+
+def main():
+    print('workers=%d' % WORKERS)
+    print('%8s %8s %12s %12s %12s' % ('method', 'items', 'serial', 'thread', 'process'))
+    for method in ['cpu_total', 'io_total']:
+        for n in [10, 100, 1000, 10000]:
+            models = [Model(500) for _ in range(n)]
+            t1 = min(timeit.repeat(lambda: assert_that(models).extracting(method), number=1, repeat=3))
+            t2 = min(timeit.repeat(lambda: assert_that(models).extracting(method, workers=WORKERS), number=1, repeat=3))
+            t3 = min(timeit.repeat(lambda: assert_that(models).extracting(method, workers=WORKERS, executor='process'), number=1, repeat=3))
+            print('%8s %8d %11.4fs %11.4fs %11.4fs' % (method.split('_')[0], n, t1, t2, t3))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+# Copyright (c) 2015-2019, Activision Publishing, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+# may be used to endorse or promote products derived from this software without
+# specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON
+# ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+"""Benchmark of 1,000 line-keyed snapshots into one snapshot file: the in-memory snapshot store (load
+once, write once at flush) vs the old load-and-rewrite on every new snapshot (emulated by flushing
+and clearing the store after each snapshot).
+
+Usage::
+
+    python benchmarks/bench_snapshot.py
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from assertpy import assert_that  # noqa: E402
+from assertpy.snapshot import _store  # noqa: E402
+
+N = 1000
+
+
+def make_test(path, after_each):
+    # one snapshot per line, so each gets its own line-keyed entry in snap-bench_module.json
+    lines = ['def run():']
+    for i in range(N):
+        lines.append("    assert_that({'id': %d, 'name': 'user%d', 'tags': ['a', 'b']}).snapshot(path=%r); after_each()" % (i, i, path))
+    code = compile('\n'.join(lines), 'bench_module.py', 'exec')
+    scope = {'assert_that': assert_that, 'after_each': after_each}
+    exec(code, scope)
+    return scope['run']
+
+
+def main():
+    print('%12s %10s %10s' % ('store', 'create', 'check'))
+    for label, after_each in [('old', _store.clear), ('in-memory', lambda: None)]:
+        tmp = tempfile.mkdtemp()
+        try:
+            run = make_test(tmp, after_each)
+            t1 = timeit.timeit(lambda: (run(), _store.clear()), number=1)
+            t2 = timeit.timeit(lambda: (run(), _store.clear()), number=1)
+            print('%12s %9.4fs %9.4fs' % (label, t1, t2))
+        finally:
+            shutil.rmtree(tmp)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+# Copyright (c) 2015-2019, Activision Publishing, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+# may be used to endorse or promote products derived from this software without
+# specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON
+# ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+"""Benchmark of re-running a few tests against a large line-keyed snapshot file (200 snapshots of 100
+records each) in a fresh session: checking by the content hash index vs loading the whole file and
+comparing (emulated by never matching a content hash).
+
+Usage::
+
+    python benchmarks/bench_snapshot_index.py
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from assertpy import assert_that  # noqa: E402
+from assertpy.snapshot import _store, _SnapshotFile  # noqa: E402
+
+N = 200
+
+
+def make_tests(path, vals):
+    # one test per line, so each gets its own line-keyed entry in snap-bench_module.json
+    lines = ['tests = []']
+    for i in range(N):
+        lines.append('tests.append(lambda: assert_that(vals[%d]).snapshot(path=%r))' % (i, path))
+    code = compile('\n'.join(lines), 'bench_module.py', 'exec')
+    scope = {'assert_that': assert_that, 'vals': vals}
+    exec(code, scope)
+    return scope['tests']
+
+
+def run(tests):
+    for test in tests:
+        test()
+    _store.clear()
+
+
+def main():
+    vals = [[{'id': i, 'name': 'user%d' % i, 'tags': ['a', 'b'], 'score': i * 0.5} for i in range(100)] for _ in range(N)]
+    matches = _SnapshotFile.matches
+    print('%12s %10s %10s' % ('index', '5 tests', 'all tests'))
+    for label, with_index in [('none', False), ('hash', True)]:
+        _SnapshotFile.matches = matches if with_index else (lambda self, key, val: False)
+        tmp = tempfile.mkdtemp()
+        try:
+            tests = make_tests(tmp, vals)
+            run(tests)
+            t1 = min(timeit.repeat(lambda: run(tests[:5]), number=1, repeat=5))
+            t2 = min(timeit.repeat(lambda: run(tests), number=1, repeat=5))
+            print('%12s %9.4fs %9.4fs' % (label, t1, t2))
+        finally:
+            shutil.rmtree(tmp)
+    _SnapshotFile.matches = matches
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+# Copyright (c) 2015-2019, Activision Publishing, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+# may be used to endorse or promote products derived from this software without
+# specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON
+# ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+"""Benchmark of encoding and decoding a snapshot of 20,000 objects: the snapshot type registry (lookup by
+exact type, cached by MRO, with the imported class cached) vs the original encoder and decoder (kept
+here for comparison), that test ``isinstance`` in sequence, call ``dir()`` on every object, and
+``__import__`` every class.
+
+Usage::
+
+    python benchmarks/bench_snapshot_types.py
+"""
+
+import os
+import sys
+import json
+import datetime
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from assertpy.snapshot import _Encoder, _Decoder  # noqa: E402
+
+N = 20000
+
+
+class User(object):
+    def __init__(self, i):
+        self.id = i
+        self.name = 'user%d' % i
+        self.created = datetime.datetime(2000, 1, 1, 12, 0, 0)
+
+
+class OriginalEncoder(json.JSONEncoder):
+    def default(self, o):
+        if isinstance(o, set):
+            return {'__type__': 'set', '__data__': list(o)}
+        elif isinstance(o, complex):
+            return {'__type__': 'complex', '__data__': [o.real, o.imag]}
+        elif isinstance(o, datetime.datetime):
+            return {'__type__': 'datetime', '__data__': o.strftime('%Y-%m-%d %H:%M:%S')}
+        elif '__dict__' in dir(o) and type(o) is not type:
+            return {
+                '__type__': 'instance',
+                '__class__': o.__class__.__name__,
+                '__module__': o.__class__.__module__,
+                '__data__': o.__dict__
+            }
+        return json.JSONEncoder.default(self, o)
+
+
+class OriginalDecoder(json.JSONDecoder):
+    def __init__(self):
+        json.JSONDecoder.__init__(self, object_hook=self.object_hook)
+
+    def object_hook(self, d):
+        if '__type__' in d and '__data__' in d:
+            if d['__type__'] == 'set':
+                return set(d['__data__'])
+            elif d['__type__'] == 'complex':
+                return complex(d['__data__'][0], d['__data__'][1])
+            elif d['__type__'] == 'datetime':
+                return datetime.datetime.strptime(d['__data__'], '%Y-%m-%d %H:%M:%S')
+            elif d['__type__'] == 'instance':
+                mod = __import__(d['__module__'], fromlist=[d['__class__']])
+                klass = getattr(mod, d['__class__'])
+                inst = klass.__new__(klass)
+                inst.__dict__ = d['__data__']
+                return inst
+        return d
+
+
+def main():
+    val = [User(i) for i in range(N)]
+    print('%12s %10s %10s' % ('types', 'encode', 'decode'))
+    for label, encoder, decoder in [('original', OriginalEncoder, OriginalDecoder), ('registry', _Encoder, _Decoder)]:
+        s = json.dumps(val, cls=encoder)
+        t1 = min(timeit.repeat(lambda: json.dumps(val, cls=encoder), number=1, repeat=5))
+        t2 = min(timeit.repeat(lambda: json.loads(s, cls=decoder), number=1, repeat=5))
+        print('%12s %9.4fs %9.4fs' % (label, t1, t2))
+
+
+if __name__ == '__main__':
+    main()
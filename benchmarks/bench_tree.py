@@ -0,0 +1,84 @@
+# Copyright (c) 2015-2019, Activision Publishing, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+# may be used to endorse or promote products derived from this software without
+# specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON
+# ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+"""Benchmark of has_same_tree_as() with compare='hash' on a tree of 2,000 files of 256KB each, scaling
+the number of hashing threads from 1 up to the machine cpu count.
+
+Usage::
+
+    python benchmarks/bench_tree.py
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from assertpy import assert_that  # noqa: E402
+
+FILES = 2000
+SIZE = 256 * 1024
+
+
+def build(root):
+    for i in range(FILES):
+        d = os.path.join(root, 'd%02d' % (i % 50))
+        if not os.path.isdir(d):
+            os.makedirs(d)
+        with open(os.path.join(d, 'f%05d.bin' % i), 'wb') as fp:
+            fp.write(os.urandom(SIZE))
+
+
+def main():
+    tmp = tempfile.mkdtemp()
+    try:
+        actual, golden = os.path.join(tmp, 'actual'), os.path.join(tmp, 'golden')
+        build(actual)
+        shutil.copytree(actual, golden)
+
+        t = min(timeit.repeat(lambda: assert_that(actual).has_same_tree_as(golden), number=1, repeat=3))
+        print('%10s %12.4fs' % ('size', t))
+
+        cpus = os.cpu_count() or 1
+        workers = sorted(set([1, 2, 4, 8, 16, cpus]) & set(range(1, cpus + 1)))
+        base = None
+        print('%10s %12s %10s' % ('workers', 'hash', 'speedup'))
+        for w in workers:
+            t = min(timeit.repeat(lambda: assert_that(actual).has_same_tree_as(golden, compare='hash', workers=w), number=1, repeat=3))
+            base = base or t
+            print('%10d %12.4fs %9.2fx' % (w, t, base / t))
+    finally:
+        shutil.rmtree(tmp)
+
+
+if __name__ == '__main__':
+    main()
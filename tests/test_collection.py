@@ -27,6 +27,7 @@
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import sys
+import array
 import collections
 
 from assertpy import assert_that, fail
@@ -227,3 +228,23 @@ def test_is_sorted_failure_bad_val():
 
 def test_chaining():
     assert_that(['a', 'b', 'c']).is_iterable().is_type_of(list).is_sorted().is_length(3)
+
+
+def test_is_sorted_column():
+    assert_that(array.array('q', [1, 2, 2, 3])).is_sorted()
+    assert_that(array.array('d', [3.0, 2.5, 1.0])).is_sorted(reverse=True)
+    assert_that(array.array('q')).is_sorted()
+    assert_that(array.array('q', [3, 1])).is_sorted(key=lambda x: -x)
+
+
+def test_is_sorted_column_failure():
+    try:
+        assert_that(array.array('q', [1, 2, 3, 4, -5, 6])).is_sorted()
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).is_equal_to("Expected <array('q', [1, 2, 3, 4, -5, 6])> to be sorted, but subset <4, -5> at index 3 is not.")
+    try:
+        assert_that(array.array('q', [3, 2, 5])).is_sorted(reverse=True)
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).ends_with('to be sorted reverse, but subset <2, 5> at index 1 is not.')
@@ -26,7 +26,9 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from assertpy import assert_that
+import collections
+
+from assertpy import assert_that, set_message_limits, fail
 
 
 def test_fmt_items_empty():
@@ -104,3 +106,97 @@ def test_check_dict_like_bool():
     assert_that(ab._check_dict_like({}, return_as_bool=True)).is_true()
     assert_that(ab._check_dict_like(123, return_as_bool=True)).is_false()
     assert_that(ab._check_dict_like('foo', return_as_bool=True)).is_false()
+
+
+def test_builder_has_no_instance_dict():
+    ab = assert_that(None)
+    assert_that(hasattr(ab, '__dict__')).is_false()
+    try:
+        ab.foo = 'bar'
+        fail('should have raised error')
+    except AttributeError:
+        pass
+
+
+def test_reset():
+    ab = assert_that(None, 'desc')
+    assert_that(ab.reset('foo')).is_same_as(ab)
+    assert_that(ab.val).is_equal_to('foo')
+    assert_that(ab.description).is_equal_to('desc')
+    ab.reset([1, 2, 3]).is_length(3).contains(2)
+    ab.reset({'a': 1}).has_a(1)
+
+
+def test_reset_failure():
+    ab = assert_that(None, 'desc')
+    try:
+        ab.reset('foo').is_equal_to('bar')
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).is_equal_to('[desc] Expected <foo> to be equal to <bar>, but was not.')
+
+
+def test_fmt_val_small_values_like_str():
+    ab = assert_that(None)
+    for val in [1, 'foo', [1, 'a', (2,)], (1, 2), {'a': [1, {2}]}, set(), frozenset([1]), {}, (), None, 1.5]:
+        assert_that(ab._fmt_val(val)).is_equal_to(str(val))
+
+
+def test_fmt_val_bounded():
+    ab = assert_that(None)
+    assert_that(ab._fmt_val(list(range(1000)))).starts_with('[0, 1, 2, ').ends_with(', 99, ...]')
+    assert_that(ab._fmt_val('x' * 10000)).is_length(4096 + 3).ends_with('x...')
+    assert_that(ab._fmt_val([[[[[[[[1]]]]]]]])).is_equal_to('[[[[[[[...]]]]]]]')
+    assert_that(ab._fmt_val(['x' * 10000, 'y'])).is_length(1 + 4098 + 3 + 6).ends_with("x'..., ...]")
+
+
+class _List(list):
+    pass
+
+
+def test_fmt_val_subclasses_like_str():
+    ab = assert_that(None)
+    Point = collections.namedtuple('Point', 'x y')
+    for val in [b'foo', bytearray(b'foo'), _List([1, 2]), collections.deque([1, 2]), collections.OrderedDict(a=1),
+                collections.Counter('aab'), collections.defaultdict(int, a=1), Point(1, 2), _List(), collections.deque()]:
+        assert_that(ab._fmt_val(val)).is_equal_to(str(val))
+
+
+def test_fmt_val_subclasses_bounded():
+    ab = assert_that(None)
+    assert_that(ab._fmt_val(b'x' * 10000)).is_length(4099 + 3).starts_with("b'xx").ends_with("x'...")
+    assert_that(ab._fmt_val(bytearray(10000))).is_length(4096 * 4 + 14 + 3).starts_with("bytearray(b'\\x00").ends_with('...')
+    assert_that(ab._fmt_val(_List(range(1000)))).starts_with('[0, 1, 2, ').ends_with(', 99, ...]')
+    assert_that(ab._fmt_val(collections.deque(range(1000)))).starts_with('deque([0, 1, ').ends_with(', 99, ...])')
+    assert_that(ab._fmt_val(collections.Counter(range(1000)))).starts_with('Counter({0: 1, ').ends_with(', 99: 1, ...})')
+
+
+def test_set_message_limits():
+    try:
+        set_message_limits(max_length=10, max_items=2, max_depth=1)
+        ab = assert_that(None)
+        assert_that(ab._fmt_val([1, 2, 3])).is_equal_to('[1, 2, ...]')
+        assert_that(ab._fmt_val([[1], 2])).is_equal_to('[[...], 2]')
+        assert_that(ab._fmt_val('abcdefghijklmnop')).is_equal_to('abcdefghij...')
+        assert_that(ab._fmt_items([1, 2, 3])).is_equal_to('<1, 2, ...>')
+
+        set_message_limits(full=True)
+        assert_that(ab._fmt_val([1, 2, 3])).is_equal_to('[1, 2, 3]')
+        assert_that(ab._fmt_val('abcdefghijklmnop')).is_equal_to('abcdefghijklmnop')
+    finally:
+        set_message_limits(max_length=4096, max_items=100, max_depth=6, full=False)
+
+
+def test_set_message_limits_bad_args():
+    assert_that(set_message_limits).raises(TypeError).when_called_with(max_items='foo')\
+        .is_equal_to('given max_items arg must be an int')
+    assert_that(set_message_limits).raises(ValueError).when_called_with(max_length=-1)\
+        .is_equal_to('given max_length arg must be a positive int')
+
+
+def test_failure_message_bounded():
+    try:
+        assert_that(list(range(1000000))).contains(-1)
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).starts_with('Expected <[0, 1, 2, ').ends_with(', 99, ...]> to contain item <-1>, but did not.')
@@ -122,3 +122,29 @@ def test_dynamic_assertion_on_method_failure():
 
 def test_chaining():
     assert_that(fred).has_first_name('Fred').has_last_name('Smith').has_shoe_size(12)
+
+
+def test_dynamic_assertion_wrapper_is_cached():
+    from assertpy import dynamic
+    a = assert_that(fred).has_first_name
+    b = assert_that(fred).has_first_name
+    assert_that(a.__func__).is_same_as(b.__func__)
+    assert_that(a.__name__).is_equal_to('has_first_name')
+    assert_that(dynamic._strategies).contains_entry({(Person, 'first_name'): (False, False)})
+
+
+def test_dynamic_assertion_same_name_on_different_types():
+    # one cached wrapper, but the strategy of each val type
+    for _ in range(2):
+        assert_that(fred).has_shoe_size(12)
+        assert_that({'shoe_size': 12}).has_shoe_size(12)
+        try:
+            assert_that({'shoe_size': 12}).has_shoe_size(13)
+            fail('should have raised error')
+        except AssertionError as ex:
+            assert_that(str(ex)).is_equal_to('Expected <12> to be equal to <13> on key <shoe_size>, but was not.')
+        try:
+            assert_that(Person('Joe', 'Smith', 9)).has_shoe_size(13)
+            fail('should have raised error')
+        except AssertionError as ex:
+            assert_that(str(ex)).is_equal_to('Expected <9> to be equal to <13> on attribute <shoe_size>, but was not.')
@@ -228,3 +228,43 @@ def test_dupe_extensions():
     dupe1()
     dupe2()
     dupe1()
+
+
+class IsBar(object):
+    def __call__(self, builder):
+        if builder.val != 'bar':
+            return builder.error('Expected <%s> to be bar, but was not.' % (builder.val))
+        return builder
+
+    @property
+    def __name__(self):
+        return 'is_bar'
+
+
+def test_callable_object_extension():
+    is_bar = IsBar()
+    add_extension(is_bar)
+    try:
+        assert_that('bar').is_bar().is_length(3)
+        try:
+            assert_that('foo').is_bar()
+            fail('should have raised error')
+        except AssertionError as ex:
+            assert_that(str(ex)).is_equal_to('Expected <foo> to be bar, but was not.')
+    finally:
+        remove_extension(is_bar)
+
+
+def test_extensions_compiled_into_builder_class():
+    def is_baz(self):
+        return self
+    a = assert_that('baz')
+    assert_that(hasattr(type(a), 'is_baz')).is_false()
+
+    add_extension(is_baz)
+    b = assert_that('baz')
+    assert_that(type(b).__dict__).contains_key('is_baz')
+    assert_that(type(assert_that('baz'))).is_same_as(type(b))
+
+    remove_extension(is_baz)
+    assert_that(hasattr(type(assert_that('baz')), 'is_baz')).is_false()
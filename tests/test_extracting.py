@@ -26,7 +26,10 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import re
 import sys
+import collections
+import pytest
 from assertpy import assert_that, fail
 
 
@@ -64,6 +67,14 @@ def test_extracting_property_and_method():
     assert_that(people).extracting('first_name', 'full_name').contains(('Fred', 'Fred Smith'), ('John', 'John Jones'))
 
 
+def test_extracting_method_shadowed_by_instance_attribute():
+    shadowed = Person('Bob', 'Brown', 10)
+    shadowed.full_name = 'shadowed'
+    assert_that([fred, shadowed]).extracting('full_name').is_equal_to(['Fred Smith', 'shadowed'])
+    assert_that([shadowed, fred]).extracting('full_name').is_equal_to(['shadowed', 'Fred Smith'])
+    assert_that([fred, shadowed]).extracting('first_name', 'full_name').is_equal_to([('Fred', 'Fred Smith'), ('Bob', 'shadowed')])
+
+
 def test_extracting_dict():
     people_as_dicts = [{'first_name': p.first_name, 'last_name': p.last_name} for p in people]
     assert_that(people_as_dicts).extracting('first_name').contains('Fred', 'John')
@@ -358,3 +369,293 @@ def test_extracting_iterable_failure_index_is_not_int():
         fail('should have raised error')
     except TypeError as ex:
         assert_that(str(ex)).contains('list indices must be integers')
+
+
+def test_extracting_lazy():
+    assert_that(people).extracting('first_name', lazy=True).contains('John')
+    assert_that(people).extracting('first_name', 'last_name', lazy=True).contains(('Fred', 'Smith'), ('John', 'Jones'))
+    assert_that(people).extracting('first_name', lazy=True, sort='shoe_size').starts_with('John')
+
+
+def test_extracting_lazy_short_circuits():
+    calls = []
+
+    def users():
+        for i in range(1000):
+            calls.append(i)
+            yield {'id': i, 'active': i % 2 == 0}
+
+    assert_that(users()).extracting('id', filter='active', lazy=True).contains(10)
+    assert_that(calls).is_length(11)
+
+
+def test_extracting_lazy_failure():
+    try:
+        assert_that(people).extracting('first_name', lazy=True).contains('Bob')
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).is_equal_to("Expected <stream(['Fred', 'John'])> to contain item <Bob>, but did not.")
+
+
+def test_extracting_filter_before_sort():
+    users = [{'user': 'Alice', 'age': 36}, {'user': 'Bob'}, {'user': 'Charlie', 'age': 13}]
+    assert_that(users).extracting('user', filter=lambda x: 'age' in x, sort='age').is_equal_to(['Charlie', 'Alice'])
+
+
+def test_extracting_accessor_cached():
+    from assertpy import extracting
+    extracting._accessors.clear()
+    rows = [{'a': i, 'b': -i} for i in range(100)]
+    assert_that(rows).extracting('a', 'b').contains((1, -1))
+    assert_that(rows).extracting('a').is_length(100)
+    assert_that(extracting._accessors).is_length(2)
+    assert_that(people).extracting('first_name', 'full_name').contains(('Fred', 'Fred Smith'))
+    assert_that(extracting._accessors).is_length(3)
+
+
+def test_extracting_mixed_types():
+    Person = collections.namedtuple('Person', ['first_name', 'last_name'])
+    rows = [{'first_name': 'Alice'}, fred, Person('Bob', 'Bravo'), {'first_name': 'Carol'}]
+    assert_that(rows).extracting('first_name').is_equal_to(['Alice', 'Fred', 'Bob', 'Carol'])
+
+
+def test_extracting_dict_missing_key_in_later_item():
+    rows = [{'a': 1, 'b': 2}, {'a': 3}]
+    try:
+        assert_that(rows).extracting('a', 'b')
+        fail('should have raised error')
+    except ValueError as ex:
+        assert_that(str(ex)).is_equal_to("item keys ['a'] did not contain key <b>")
+
+
+def test_extracting_defaultdict_missing_key():
+    rows = [collections.defaultdict(int, a=1)]
+    try:
+        assert_that(rows).extracting('b')
+        fail('should have raised error')
+    except ValueError as ex:
+        assert_that(str(ex)).is_equal_to("item keys ['a'] did not contain key <b>")
+
+
+def test_extracting_instance_attribute_on_some_items():
+    class Foo(object):
+        pass
+
+    foo, bar = Foo(), Foo()
+    foo.x = 1
+    try:
+        assert_that([foo, bar]).extracting('x')
+        fail('should have raised error')
+    except ValueError as ex:
+        assert_that(str(ex)).is_equal_to('item does not have property or zero-arg method <x>')
+
+
+orders = [
+    {'id': 1, 'user': {'name': 'Alice', 'address': {'city': 'Austin'}}, 'items': [{'sku': 'A1'}, {'sku': 'A2'}]},
+    {'id': 2, 'user': {'name': 'Bob', 'address': {'city': 'Boston'}}, 'items': [{'sku': 'B1'}]},
+    {'id': 3, 'user': {'name': 'Carol'}, 'items': []},
+]
+
+
+def test_extracting_dotted_path():
+    assert_that(orders[:2]).extracting('user.address.city').is_equal_to(['Austin', 'Boston'])
+    assert_that(orders).extracting('id', 'user.name', 'items.0.sku', missing='skip')\
+        .is_equal_to([(1, 'Alice', 'A1'), (2, 'Bob', 'B1')])
+    assert_that(orders[:1]).extracting('items.-1.sku').is_equal_to(['A2'])
+
+
+def test_extracting_tuple_path():
+    assert_that(orders[:2]).extracting(('user', 'address', 'city')).is_equal_to(['Austin', 'Boston'])
+    assert_that([{'a.b': 1}, {'a.b': 2}]).extracting(('a.b',)).is_equal_to([1, 2])
+
+
+def test_extracting_dotted_literal_key_wins():
+    assert_that([{'a.b': 1, 'a': {'b': 2}}]).extracting('a.b').is_equal_to([1])
+    assert_that([{'a': {'b': 2}}]).extracting('a.b').is_equal_to([2])
+
+
+def test_extracting_dotted_path_objects():
+    Address = collections.namedtuple('Address', ['city'])
+
+    class User(object):
+        def __init__(self, address):
+            self.address = address
+
+        def home(self):
+            return self.address
+
+    users = [User(Address('Austin')), User({'city': 'Boston'})]
+    assert_that(users).extracting('address.city').is_equal_to(['Austin', 'Boston'])
+    assert_that(users).extracting('home.city').is_equal_to(['Austin', 'Boston'])
+
+
+def test_extracting_dotted_path_missing_raise():
+    try:
+        assert_that(orders).extracting('user.address.city')
+        fail('should have raised error')
+    except ValueError as ex:
+        assert_that(str(ex)).is_equal_to("item keys ['name'] did not contain key <address>")
+
+
+def test_extracting_missing_none():
+    assert_that(orders).extracting('user.address.city', missing='none').is_equal_to(['Austin', 'Boston', None])
+    assert_that(orders).extracting('id', 'items.1.sku', missing='none').is_equal_to([(1, 'A2'), (2, None), (3, None)])
+    assert_that(people).extracting('first_name', 'middle_name', missing='none').contains(('Fred', None))
+
+
+def test_extracting_missing_skip():
+    assert_that(orders).extracting('user.address.city', missing='skip').is_equal_to(['Austin', 'Boston'])
+    assert_that(orders).extracting('id', 'items.1.sku', missing='skip').is_equal_to([(1, 'A2')])
+    assert_that(people).extracting('middle_name', missing='skip').is_empty()
+
+
+def test_extracting_missing_bad_arg():
+    assert_that(assert_that(orders).extracting).raises(ValueError).when_called_with('id', missing='foo')\
+        .is_equal_to('missing arg must be one of raise, skip, or none')
+
+
+def test_extracting_workers_thread():
+    many = [Person('first%d' % i, 'last%d' % i, i) for i in range(1000)]
+    assert_that(many).extracting('full_name', workers=4).is_equal_to(['first%d last%d' % (i, i) for i in range(1000)])
+    assert_that(many).extracting('first_name', 'shoe_size', workers=4, filter=lambda p: p.shoe_size % 2, sort='last_name')\
+        .is_length(500).contains(('first1', 1))
+
+
+def test_extracting_workers_process():
+    many = [Person('first%d' % i, 'last%d' % i, i) for i in range(500)]
+    assert_that(many).extracting('full_name', workers=2, executor='process')\
+        .is_equal_to(['first%d last%d' % (i, i) for i in range(500)])
+
+
+def test_extracting_workers_serial_fallback():
+    assert_that(people).extracting('first_name', workers=4).is_equal_to(['Fred', 'John'])
+
+
+def test_extracting_workers_failure_has_index():
+    rows = [{'a': i} for i in range(1000)]
+    rows[737] = {'b': 1}
+    try:
+        assert_that(rows).extracting('a', workers=4)
+        fail('should have raised error')
+    except ValueError as ex:
+        assert_that(str(ex)).is_equal_to("item keys ['b'] did not contain key <a> (at item index <737>)")
+    try:
+        assert_that(rows[730:]).extracting('a', workers=4)
+        fail('should have raised error')
+    except ValueError as ex:
+        assert_that(str(ex)).ends_with('(at item index <7>)')
+
+
+def test_extracting_workers_bad_args():
+    assert_that(assert_that(people).extracting).raises(TypeError).when_called_with('first_name', workers='4')\
+        .is_equal_to('given workers arg must be an int')
+    assert_that(assert_that(people).extracting).raises(ValueError).when_called_with('first_name', workers=0)\
+        .is_equal_to('given workers arg must be a positive int')
+    assert_that(assert_that(people).extracting).raises(ValueError).when_called_with('first_name', workers=2, executor='foo')\
+        .is_equal_to('executor arg must be one of thread or process')
+
+
+def test_extracting_columnar():
+    from assertpy.helpers import _is_column
+    col = assert_that(people).extracting('shoe_size', columnar=True).is_sorted(reverse=True).is_positive().val
+    assert_that(_is_column(col)).is_true()
+    assert_that(list(col)).is_equal_to([12, 9.5])
+
+    cols = assert_that(people).extracting('first_name', 'shoe_size', columnar=True).is_length(2).val
+    assert_that(cols[0]).is_equal_to(['Fred', 'John'])
+    assert_that(_is_column(cols[1])).is_true()
+
+
+def test_extracting_columnar_equality():
+    assert_that(people).extracting('shoe_size', columnar=True).is_equal_to([12, 9.5]).is_not_equal_to([12, 9])
+    assert_that(people).extracting('first_name', 'shoe_size', columnar=True).is_equal_to((['Fred', 'John'], [12, 9.5]))
+    try:
+        assert_that(people).extracting('shoe_size', columnar=True).is_equal_to([12, 9])
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).ends_with('to be equal to <[12, 9]>, but was not.')
+
+
+def test_extracting_columnar_numpy():
+    numpy = pytest.importorskip('numpy')
+    from assertpy.helpers import _to_column, _column_bounds, _column_unsorted
+
+    col = _to_column([3, 1, 2])
+    assert_that(col).is_instance_of(numpy.ndarray)
+    assert_that(col.dtype).is_equal_to(numpy.int64)
+    assert_that(_to_column([1, 2.5]).dtype).is_equal_to(numpy.float64)
+    assert_that(_to_column([1, True])).is_equal_to([1, True]).is_type_of(list)
+    assert_that(_to_column([2**70])).is_type_of(list)
+
+    assert_that(_column_bounds(col)).is_equal_to((1, 3))
+    assert_that(_column_unsorted(col)).is_equal_to(0)
+    assert_that(_column_unsorted(_to_column([1, 2, 2, 3]))).is_none()
+    assert_that(_column_unsorted(_to_column([3, 2, 3]), reverse=True)).is_equal_to(1)
+
+    assert_that(people).extracting('shoe_size', columnar=True).is_equal_to([12, 9.5]).is_not_equal_to([12, 9])\
+        .is_sorted(reverse=True).is_greater_than(9).is_between(9, 12)
+
+
+def test_extracting_columnar_non_numeric():
+    assert_that(people).extracting('first_name', columnar=True).is_equal_to(['Fred', 'John'])
+    assert_that([{'a': True}, {'a': False}]).extracting('a', columnar=True).is_equal_to([True, False])
+    assert_that([{'a': 2**70}]).extracting('a', columnar=True).is_equal_to([2**70])
+    assert_that([]).extracting('a', 'b', columnar=True).is_equal_to(([], []))
+
+
+def test_extracting_columnar_lazy_bad_args():
+    assert_that(assert_that(people).extracting).raises(ValueError).when_called_with('first_name', lazy=True, columnar=True)\
+        .is_equal_to('lazy and columnar args cannot both be given')
+
+
+accounts = [
+    {'user': 'Alice', 'age': 36, 'active': True, 'tags': {'admin'}},
+    {'user': 'Bob', 'age': 40, 'active': False, 'tags': {'dev', 'ops'}},
+    {'user': 'Charlie', 'age': 13, 'active': True, 'tags': set()},
+]
+
+
+def test_extracting_filter_set():
+    assert_that(accounts).extracting('user', filter={'user': {'Alice', 'Bob'}}).is_equal_to(['Alice', 'Bob'])
+    assert_that(accounts).extracting('user', filter={'user': frozenset(['Bob']), 'active': False}).is_equal_to(['Bob'])
+    # a set-valued item still matches an equal set
+    assert_that(accounts).extracting('user', filter={'tags': {'dev', 'ops'}}).is_equal_to(['Bob'])
+    assert_that([{'a': [1]}, {'a': [2]}]).extracting('a', filter={'a': {1}}).is_equal_to([])
+
+
+def test_extracting_filter_range():
+    assert_that(accounts).extracting('user', filter={'age': range(18, 65)}).is_equal_to(['Alice', 'Bob'])
+    assert_that(accounts).extracting('user', filter={'age': range(0, 100, 2), 'active': True}).is_equal_to(['Alice'])
+
+
+def test_extracting_filter_range_floats():
+    rows = [{'age': 36.0}, {'age': 36.5}, {'age': 65.0}, {'age': 17.9}, {'age': '36'}, {'age': None}]
+    assert_that(rows).extracting('age', filter={'age': range(18, 65)}).is_equal_to([36.0])
+    assert_that(rows).extracting('age', filter={'age': range(64, 17, -2)}).is_equal_to([36.0])
+    assert_that(rows).extracting('age', filter={'age': range(0, 100, 5)}).is_equal_to([65.0])
+
+
+def test_extracting_filter_regex():
+    assert_that(accounts).extracting('user', filter={'user': re.compile('^[AB]')}).is_equal_to(['Alice', 'Bob'])
+    assert_that(accounts).extracting('user', filter={'user': re.compile('li')}).is_equal_to(['Alice', 'Charlie'])
+    assert_that(accounts).extracting('user', filter={'age': re.compile('3')}).is_empty()
+
+
+def test_extracting_filter_dict_equality():
+    assert_that(accounts).extracting('user', filter={'age': 36, 'active': True}).is_equal_to(['Alice'])
+    assert_that(accounts).extracting('user', filter={}).is_length(3)
+    assert_that(accounts).extracting('user', filter={1: 'foo', 'active': True}).is_equal_to(['Alice', 'Charlie'])
+
+
+def test_extracting_filter_missing_key_after_mismatch():
+    rows = [{'active': False}, {'active': True, 'age': 1}]
+    assert_that(rows).extracting('active', filter={'active': True, 'age': 1}).is_equal_to([True])
+    try:
+        assert_that(rows).extracting('active', filter={'age': 1, 'active': True})
+        fail('should have raised error')
+    except ValueError as ex:
+        assert_that(str(ex)).is_equal_to("item keys ['active'] did not contain key <age>")
+
+
+def test_extracting_filter_dotted_path():
+    assert_that(orders).extracting('id', filter={'user.name': {'Alice', 'Carol'}}).is_equal_to([1, 3])
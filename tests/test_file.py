@@ -28,6 +28,8 @@
 
 import sys
 import os
+import hashlib
+import datetime
 import pytest
 from assertpy import assert_that, contents_of, fail
 
@@ -217,3 +219,477 @@ def test_is_child_of_bad_arg_type_failure(tmpfile):
         fail('should have raised error')
     except TypeError as ex:
         assert_that(str(ex)).matches('given parent directory arg must be a path')
+
+
+@pytest.fixture()
+def logfile(tmpdir):
+    tmp = tmpdir.join('server.log')
+    tmp.write_binary(b'started\nINFO 1 all good\nERROR 42 bad thing\nINFO 2 caf\xc3\xa9\nstopped')
+    return str(tmp)
+
+
+def test_file_contains(logfile):
+    assert_that(logfile).file_contains('ERROR 42')
+    assert_that(logfile).file_contains('started', 'stopped', b'INFO 2', u'caf\u00e9')
+
+
+def test_file_contains_empty_file(tmpdir):
+    tmp = tmpdir.join('empty.log')
+    tmp.write_binary(b'')
+    assert_that(str(tmp)).file_does_not_contain('foo').file_line_count(0)
+
+
+def test_file_contains_failure(logfile):
+    try:
+        assert_that(logfile).file_contains('ERROR 43')
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).matches('Expected file <.*server.log> to contain item <ERROR 43>, but did not.')
+
+
+def test_file_contains_multi_failure(logfile):
+    try:
+        assert_that(logfile).file_contains('ERROR 42', 'foo', 'bar')
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).matches("Expected file <.*server.log> to contain items <'ERROR 42', 'foo', 'bar'>, but did not contain <'foo', 'bar'>.")
+
+
+def test_file_contains_bad_args(logfile):
+    assert_that(assert_that(logfile).file_contains).raises(ValueError).when_called_with()\
+        .is_equal_to('one or more args must be given')
+    assert_that(assert_that(logfile).file_contains).raises(TypeError).when_called_with(123)\
+        .is_equal_to('given item arg must be a string or bytes')
+    assert_that(assert_that(123).file_contains).raises(TypeError).when_called_with('foo')\
+        .is_equal_to('val is not a path')
+
+
+def test_file_contains_missing_file():
+    try:
+        assert_that('missing.txt').file_contains('foo')
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).is_equal_to('Expected <missing.txt> to exist, but was not found.')
+
+
+def test_file_does_not_contain(logfile):
+    assert_that(logfile).file_does_not_contain('ERROR 43', 'Traceback')
+
+
+def test_file_does_not_contain_failure(logfile):
+    try:
+        assert_that(logfile).file_does_not_contain('Traceback', 'ERROR')
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).matches('Expected file <.*server.log> to not contain item <ERROR>, but did at offset <24> in <ERROR 42 bad thing>.')
+
+
+def test_file_matches(logfile):
+    assert_that(logfile).file_matches(r'ERROR \d+').file_matches(r'(?m)^stopped$').file_matches(b'INFO [0-9]')
+
+
+def test_file_matches_failure(logfile):
+    try:
+        assert_that(logfile).file_matches(r'ERROR \d{3}')
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).matches(r'Expected file <.*server.log> to match pattern <ERROR \\d\{3\}>, but did not.')
+
+
+def test_file_matches_bad_args(logfile):
+    assert_that(assert_that(logfile).file_matches).raises(TypeError).when_called_with(123)\
+        .is_equal_to('given pattern arg must be a string or bytes')
+    assert_that(assert_that(logfile).file_matches).raises(ValueError).when_called_with('')\
+        .is_equal_to('given pattern arg must not be empty')
+
+
+def test_file_does_not_match(logfile):
+    assert_that(logfile).file_does_not_match(r'ERROR \d{3}')
+
+
+def test_file_does_not_match_failure(logfile):
+    try:
+        assert_that(logfile).file_does_not_match(r'caf.+')
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).ends_with(u'to not match pattern <caf.+>, but did at offset <50> in <INFO 2 caf\u00e9>.')
+
+
+def test_file_line_count(logfile, tmpdir):
+    assert_that(logfile).file_line_count(5)
+    tmp = tmpdir.join('lines.txt')
+    tmp.write_binary(b'a\nb\n')
+    assert_that(str(tmp)).file_line_count(2)
+
+
+def test_file_line_count_failure(logfile):
+    try:
+        assert_that(logfile).file_line_count(4)
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).matches('Expected file <.*server.log> to have <4> lines, but had <5>.')
+
+
+def test_file_line_count_bad_args(logfile):
+    assert_that(assert_that(logfile).file_line_count).raises(TypeError).when_called_with('5')\
+        .is_equal_to('given arg must be an int')
+    assert_that(assert_that(logfile).file_line_count).raises(ValueError).when_called_with(-1)\
+        .is_equal_to('given arg must be a positive int')
+
+
+def test_has_size(logfile):
+    assert_that(logfile).has_size(63)
+
+
+def test_has_size_failure(logfile):
+    try:
+        assert_that(logfile).has_size(10)
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).matches('Expected file <.*server.log> to have size <10>, but was <63>.')
+
+
+def test_has_size_falls_back_to_dynamic():
+    assert_that({'size': 3}).has_size(3)
+
+
+def test_has_digest(logfile):
+    assert_that(logfile).has_digest('md5', hashlib.md5(open(logfile, 'rb').read()).hexdigest())
+    assert_that(logfile).has_digest('sha256', hashlib.sha256(open(logfile, 'rb').read()).hexdigest().upper())
+
+
+def test_has_digest_failure(logfile):
+    try:
+        assert_that(logfile).has_digest('sha1', 'abc')
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).matches('Expected file <.*server.log> to have sha1 digest <abc>, but was <[0-9a-f]{40}>.')
+
+
+def test_has_digest_bad_args(logfile):
+    assert_that(assert_that(logfile).has_digest).raises(ValueError).when_called_with('foo', 'abc')\
+        .is_equal_to('given algorithm arg <foo> is not supported')
+    assert_that(assert_that(logfile).has_digest).raises(TypeError).when_called_with('md5', 123)\
+        .is_equal_to('given hexdigest arg must be a string')
+
+
+def test_has_same_content_as(logfile, tmpdir):
+    other = tmpdir.join('copy.log')
+    other.write_binary(open(logfile, 'rb').read())
+    assert_that(logfile).has_same_content_as(str(other))
+
+
+def test_has_same_content_as_size_failure(logfile, tmpdir):
+    other = tmpdir.join('short.log')
+    other.write_binary(b'started')
+    try:
+        assert_that(logfile).has_same_content_as(str(other))
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).matches('Expected file <.*server.log> to have same content as <.*short.log>, but size <63> was not equal to <7>.')
+
+
+def test_has_same_content_as_offset_failure(logfile, tmpdir):
+    other = tmpdir.join('changed.log')
+    other.write_binary(open(logfile, 'rb').read().replace(b'ERROR 42', b'ERROR 43'))
+    try:
+        assert_that(logfile).has_same_content_as(str(other))
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).ends_with('but first differed at byte offset <31>.')
+
+
+def test_has_same_content_as_bad_args(logfile, tmpdir):
+    assert_that(assert_that(logfile).has_same_content_as).raises(TypeError).when_called_with(123)\
+        .is_equal_to('given other arg must be a path')
+    assert_that(assert_that(logfile).has_same_content_as).raises(ValueError).when_called_with(str(tmpdir))\
+        .is_equal_to('given other arg <%s> is not a file' % tmpdir)
+
+
+@pytest.fixture()
+def trees(tmpdir):
+    for name in ('actual', 'golden'):
+        root = tmpdir.mkdir(name)
+        root.join('a.txt').write_binary(b'aaa')
+        root.mkdir('sub').join('b.txt').write_binary(b'bbb')
+        root.join('sub').mkdir('deep').join('c.txt').write_binary(b'ccc')
+    return str(tmpdir.join('actual')), str(tmpdir.join('golden'))
+
+
+def test_has_same_tree_as(trees):
+    actual, golden = trees
+    assert_that(actual).has_same_tree_as(golden)
+    assert_that(actual).has_same_tree_as(golden, compare='hash')
+    assert_that(actual).has_same_tree_as(golden, compare='hash', workers=1)
+
+
+def test_has_same_tree_as_mtime(trees):
+    actual, golden = trees
+    for root in trees:
+        for name in ('a.txt', 'sub/b.txt', 'sub/deep/c.txt'):
+            os.utime(os.path.join(root, name), (1000000000, 1000000000))
+    assert_that(actual).has_same_tree_as(golden, compare='mtime')
+    os.utime(os.path.join(actual, 'sub/b.txt'), (1000000000, 1000000001))
+    try:
+        assert_that(actual).has_same_tree_as(golden, compare='mtime')
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).ends_with('but changed <sub/b.txt>.')
+
+
+def test_has_same_tree_as_failure(trees):
+    actual, golden = trees
+    with open(os.path.join(actual, 'new.txt'), 'wb') as fp:
+        fp.write(b'new')
+    os.remove(os.path.join(actual, 'sub', 'deep', 'c.txt'))
+    with open(os.path.join(actual, 'a.txt'), 'wb') as fp:
+        fp.write(b'aaaa')
+    with open(os.path.join(actual, 'sub', 'b.txt'), 'wb') as fp:
+        fp.write(b'bbx')
+
+    try:
+        assert_that(actual).has_same_tree_as(golden, compare='hash')
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).matches(
+            "Expected <.*actual> to have same tree as <.*golden>, but added <new.txt>, removed <sub/deep/c.txt>, changed <'a.txt', 'sub/b.txt'>.")
+    try:
+        assert_that(actual).has_same_tree_as(golden)
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).ends_with("removed <sub/deep/c.txt>, changed <a.txt>.")
+
+
+@pytest.mark.skipif(not hasattr(os, 'symlink') or sys.platform == 'win32', reason='requires symlinks')
+def test_has_same_tree_as_symlinks(trees):
+    actual, golden = trees
+    for root in trees:
+        # dangling, looping, and to a dir (whose contents are not walked twice)
+        os.symlink('missing.txt', os.path.join(root, 'dangling'))
+        os.symlink('..', os.path.join(root, 'sub', 'up'))
+        os.symlink('sub', os.path.join(root, 'linked'))
+    assert_that(actual).has_same_tree_as(golden)
+    assert_that(actual).has_same_tree_as(golden, compare='hash')
+
+    os.remove(os.path.join(actual, 'dangling'))
+    os.symlink('other.txt', os.path.join(actual, 'dangling'))
+    os.remove(os.path.join(actual, 'linked'))
+    os.mkdir(os.path.join(actual, 'linked'))
+    try:
+        assert_that(actual).has_same_tree_as(golden, compare='hash')
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).ends_with("removed <linked>, changed <dangling>.")
+
+
+def test_has_same_tree_as_bad_args(trees, logfile):
+    actual, golden = trees
+    assert_that(assert_that(actual).has_same_tree_as).raises(TypeError).when_called_with(123)\
+        .is_equal_to('given other arg must be a path')
+    assert_that(assert_that(actual).has_same_tree_as).raises(ValueError).when_called_with(golden, compare='foo')\
+        .is_equal_to('given compare arg must be one of size, mtime, or hash')
+    assert_that(assert_that(actual).has_same_tree_as).raises(ValueError).when_called_with(golden, workers=0)\
+        .is_equal_to('given workers arg must be a positive int')
+    assert_that(assert_that(actual).has_same_tree_as).raises(ValueError).when_called_with(logfile)\
+        .is_equal_to('given other arg <%s> is not a directory' % logfile)
+
+
+def test_stat_cached(logfile, monkeypatch):
+    calls = []
+    real_stat = os.stat
+
+    def counting_stat(path, *args, **kwargs):
+        calls.append(path)
+        return real_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(os, 'stat', counting_stat)
+    ab = assert_that(logfile).exists().is_file().is_named('server.log').is_child_of(os.path.dirname(logfile)).has_size(63)
+    assert_that(calls).is_length(1)
+
+    ab.refresh_stat().is_file()
+    assert_that(calls).is_length(2)
+
+    ab.reset(os.path.dirname(logfile)).is_directory()
+    assert_that(calls).is_length(3)
+
+
+def test_refresh_stat(tmpdir):
+    tmp = tmpdir.join('grow.log')
+    tmp.write_binary(b'')
+    ab = assert_that(str(tmp)).has_size(0)
+    tmp.write_binary(b'abc')
+    ab.has_size(0)
+    ab.refresh_stat().has_size(3)
+
+
+def test_is_older_than_is_newer_than(tmpdir):
+    old, new = tmpdir.join('old.txt'), tmpdir.join('new.txt')
+    old.write('old')
+    new.write('new')
+    os.utime(str(old), (1000000000, 1000000000))
+    os.utime(str(new), (1500000000, 1500000000))
+
+    assert_that(str(old)).is_older_than(str(new)).is_older_than(1200000000)
+    assert_that(str(new)).is_newer_than(str(old)).is_newer_than(datetime.datetime(2001, 9, 9))
+    assert_that(str(old)).is_older_than(datetime.datetime.now())
+    if sys.version_info[0] == 3:
+        utc = datetime.timezone.utc
+        assert_that(str(new)).is_newer_than(datetime.datetime(2017, 7, 14, 2, 39, 59, tzinfo=utc))\
+            .is_older_than(datetime.datetime(2017, 7, 14, 2, 40, 1, tzinfo=utc))
+
+
+def test_is_older_than_failure(tmpdir):
+    old, new = tmpdir.join('old.txt'), tmpdir.join('new.txt')
+    old.write('old')
+    new.write('new')
+    os.utime(str(old), (1000000000, 1000000000))
+    os.utime(str(new), (1500000000, 1500000000))
+    try:
+        assert_that(str(new)).is_older_than(str(old))
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).matches('Expected <.*new.txt> to be older than <.*old.txt>, but was not.')
+    try:
+        assert_that(str(old)).is_newer_than(1000000000)
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).matches('Expected <.*old.txt> to be newer than <1000000000>, but was not.')
+
+
+def test_is_older_than_bad_args(logfile):
+    assert_that(assert_that(logfile).is_older_than).raises(TypeError).when_called_with(None)\
+        .is_equal_to('given other arg must be a path, datetime, or epoch seconds')
+    assert_that(assert_that(logfile).is_newer_than).raises(ValueError).when_called_with('missing.txt')\
+        .is_equal_to('given other arg <missing.txt> was not found')
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='posix permissions')
+def test_has_mode_is_executable(tmpdir):
+    tmp = tmpdir.join('deploy.sh')
+    tmp.write('#!/bin/sh')
+    os.chmod(str(tmp), 0o644)
+    assert_that(str(tmp)).has_mode(0o644)
+    try:
+        assert_that(str(tmp)).is_executable()
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).matches('Expected <.*deploy.sh> to be executable, but was not.')
+
+    os.chmod(str(tmp), 0o750)
+    assert_that(str(tmp)).has_mode(0o750).is_executable()
+    try:
+        assert_that(str(tmp)).has_mode(0o755)
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).matches('Expected <.*deploy.sh> to have mode <0o755>, but was <0o750>.')
+
+
+def test_has_mode_falls_back_to_dynamic():
+    assert_that({'mode': 'r'}).has_mode('r')
+
+
+@pytest.mark.skipif(not hasattr(os, 'symlink') or sys.platform == 'win32', reason='symlinks')
+def test_is_symlink(logfile, tmpdir):
+    link = tmpdir.join('link.log')
+    os.symlink(logfile, str(link))
+    assert_that(str(link)).is_symlink().is_file()
+    dangling = tmpdir.join('dangling.log')
+    os.symlink(str(tmpdir.join('missing.log')), str(dangling))
+    assert_that(str(dangling)).is_symlink().does_not_exist()
+
+
+def test_is_symlink_failure(logfile):
+    try:
+        assert_that(logfile).is_symlink()
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).matches('Expected <.*server.log> to be a symlink, but was not.')
+    try:
+        assert_that('missing.log').is_symlink()
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).is_equal_to('Expected <missing.log> to be a symlink, but was not found.')
+
+
+@pytest.fixture()
+def many(tmpdir):
+    paths = []
+    for i in range(10):
+        tmp = tmpdir.join('f%d.txt' % i)
+        tmp.write('x')
+        paths.append(str(tmp))
+    tmpdir.mkdir('sub')
+    return paths, str(tmpdir.join('sub'))
+
+
+def test_all_exist(many):
+    paths, sub = many
+    assert_that(paths).all_exist().all_are_files()
+    assert_that(paths + [sub]).all_exist()
+    assert_that(iter(paths)).all_exist()
+    assert_that([]).all_exist().all_are_files().none_exist()
+
+
+def test_all_exist_scans_parent_once(many, monkeypatch):
+    paths, _ = many
+    calls = []
+    real_stat, real_scandir = os.stat, os.scandir
+    monkeypatch.setattr(os, 'stat', lambda p, *a, **kw: calls.append(('stat', p)) or real_stat(p, *a, **kw))
+    monkeypatch.setattr(os, 'scandir', lambda p: calls.append(('scandir', p)) or real_scandir(p))
+    assert_that(paths).all_exist().all_are_files()
+    assert_that(calls).is_length(2)
+    assert_that([c[0] for c in calls]).contains_only('scandir')
+
+
+def test_all_exist_failure(many):
+    paths, _ = many
+    missing = [os.path.join(os.path.dirname(paths[0]), 'missing%d.txt' % i) for i in range(3)]
+    try:
+        assert_that(paths + missing + ['missing_dir/foo.txt']).all_exist()
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).starts_with('Expected all <14> paths to exist, but <4> were not found <')
+        assert_that(str(ex)).contains('missing0.txt', 'missing2.txt', 'missing_dir/foo.txt')
+        assert_that(str(ex)).does_not_contain('f0.txt')
+
+
+def test_all_are_files_failure(many):
+    paths, sub = many
+    try:
+        assert_that(paths + [sub]).all_are_files()
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).matches('Expected all <11> paths to be files, but <1> were not <.*sub>.')
+
+
+def test_none_exist(many):
+    paths, _ = many
+    missing = [p.replace('.txt', '.bak') for p in paths]
+    assert_that(missing).none_exist()
+    assert_that(['missing_dir/a', 'missing_dir/b', 'missing_dir/c', 'missing_dir/d']).none_exist()
+    try:
+        assert_that(missing + paths[:2]).none_exist()
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).matches("Expected none of <12> paths to exist, but <2> were found <'.*f0.txt', '.*f1.txt'>.")
+
+
+@pytest.mark.skipif(not hasattr(os, 'symlink') or sys.platform == 'win32', reason='symlinks')
+def test_all_exist_dangling_symlink(many, tmpdir):
+    paths, _ = many
+    dangling = tmpdir.join('dangling.txt')
+    os.symlink(str(tmpdir.join('nowhere.txt')), str(dangling))
+    try:
+        assert_that(paths + [str(dangling)]).all_exist()
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).matches('but <1> were not found <.*dangling.txt>.')
+
+
+def test_all_exist_bad_val():
+    assert_that(assert_that('foo.txt').all_exist).raises(TypeError).when_called_with()\
+        .is_equal_to('val is not an iterable of paths')
+    assert_that(assert_that(123).none_exist).raises(TypeError).when_called_with()\
+        .is_equal_to('val is not an iterable of paths')
+    assert_that(assert_that(['foo.txt', 123]).all_are_files).raises(TypeError).when_called_with()\
+        .is_equal_to('val must contain only paths, but found <int>')
@@ -27,6 +27,7 @@
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import sys
+import array
 import collections
 
 from assertpy import assert_that, fail
@@ -187,6 +188,36 @@ def test_contains_only_superlist_failure():
         assert_that(str(ex)).is_equal_to('Expected <[1, 2, 3]> to contain only <1, 2, 3, 4>, but did not contain <4>.')
 
 
+def test_contains_unhashable_items():
+    assert_that([[1], [2], {'a': 1}]).contains([1], {'a': 1})
+    assert_that([1, 2, 3]).does_not_contain([1], [2])
+    assert_that([[1], [2], [1]]).contains_only([1], [2])
+    assert_that([1, [2], 3]).contains(1, 3).does_not_contain(4, [5]).contains_only(1, [2], 3)
+
+
+def test_contains_unhashable_items_failure():
+    try:
+        assert_that([{'a': 1}, [2]]).contains({'a': 1}, {'b': 2})
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).is_equal_to("Expected <[{'a': 1}, [2]]> to contain items <{'a': 1}, {'b': 2}>, but did not contain <{'b': 2}>.")
+
+
+def test_contains_large():
+    big = list(range(100000))
+    assert_that(big).contains(*range(0, 100000, 7)).does_not_contain(*range(-10000, 0))
+    assert_that(big + big).contains_only(*big)
+    assert_that(tuple(big)).contains(99999, 0, 1.0, True)
+
+
+def test_contains_large_failure():
+    try:
+        assert_that(list(range(1000))).contains_only(*range(1, 1001))
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).ends_with('but did contain <0>.')
+
+
 def test_contains_sequence():
     assert_that(['a', 'b', 'c']).contains_sequence('a')
     assert_that(['a', 'b', 'c']).contains_sequence('b')
@@ -212,6 +243,51 @@ def test_contains_sequence():
     assert_that([fred, joe, bob]).contains_sequence(fred, joe)
 
 
+def test_contains_sequence_overlapping():
+    assert_that([1, 1, 1, 2]).contains_sequence(1, 1, 2)
+    assert_that([1, 2, 1, 2, 1, 3]).contains_sequence(1, 2, 1, 3)
+    assert_that('aaab').contains_sequence('a', 'a', 'b')
+    assert_that('abababc').contains_sequence('a', 'b', 'a', 'b', 'c')
+
+
+def test_contains_sequence_iterator():
+    assert_that(iter([1, 2, 3, 4])).contains_sequence(2, 3)
+    assert_that(x for x in range(1000000)).contains_sequence(999998, 999999)
+    assert_that(collections.deque([1, 2, 3])).contains_sequence(1, 2)
+
+
+def test_contains_sequence_bytes():
+    assert_that(b'foobar').contains_sequence(ord('o'), ord('b'))
+    assert_that(bytearray(b'foobar')).contains_sequence(ord('b'), ord('a'), ord('r'))
+    assert_that(memoryview(b'foobar')).contains_sequence(ord('o'), ord('o'))
+
+
+def test_contains_sequence_memoryview_not_bytes():
+    assert_that(memoryview(array.array('i', [1, 2, 3]))).contains_sequence(1, 2)
+    assert_that(memoryview(array.array('b', [-1, 2, 3]))).contains_sequence(-1, 2)
+    try:
+        assert_that(memoryview(array.array('i', [257, 2]))).contains_sequence(1, 1)
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).ends_with('to contain sequence <1, 1>, but did not.')
+
+
+def test_contains_sequence_string_items_not_joined():
+    try:
+        assert_that('foo').contains_sequence('fo')
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).is_equal_to('Expected <foo> to contain sequence <fo>, but did not.')
+
+
+def test_contains_sequence_iterator_failure():
+    try:
+        assert_that(x for x in [1, 2, 3]).contains_sequence(3, 2)
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).contains('to contain sequence <3, 2>, but did not.')
+
+
 def test_contains_sequence_failure():
     try:
         assert_that([1, 2, 3]).contains_sequence(4, 5)
@@ -26,6 +26,7 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 import math
+import array
 
 from assertpy import assert_that, fail
 
@@ -594,3 +595,45 @@ def test_is_not_close_to_negative_tolerance_failure():
 
 def test_chaining():
     assert_that(123).is_greater_than(100).is_less_than(1000).is_between(120, 125).is_close_to(100, 25)
+
+
+def test_column_greater_less_than():
+    col = array.array('q', [3, 1, 2])
+    assert_that(col).is_greater_than(0).is_greater_than_or_equal_to(1).is_less_than(4).is_less_than_or_equal_to(3)
+    assert_that(col).is_positive().is_between(1, 3)
+    assert_that(array.array('d', [-1.5, -0.5])).is_negative()
+    assert_that(array.array('q')).is_positive().is_negative().is_between(0, 0)
+
+
+def test_column_failure():
+    col = array.array('q', [3, 1, 2])
+    try:
+        assert_that(col).is_greater_than(1)
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).is_equal_to("Expected all items of <array('q', [3, 1, 2])> to be greater than <1>, but min was <1>.")
+    try:
+        assert_that(col).is_less_than_or_equal_to(2)
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).ends_with('to be less than or equal to <2>, but max was <3>.')
+    try:
+        assert_that(col).is_between(2, 5)
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).ends_with('to be between <2> and <5>, but min was <1> and max was <3>.')
+
+
+def test_column_bad_args():
+    col = array.array('q', [1])
+    assert_that(assert_that(col).is_greater_than).raises(TypeError).when_called_with('a')\
+        .is_equal_to('given arg must be a number, but was <str>')
+    assert_that(assert_that(col).is_between).raises(TypeError).when_called_with(0, 'b')\
+        .is_equal_to('given high arg must be numeric, but was <str>')
+    assert_that(assert_that(col).is_between).raises(ValueError).when_called_with(2, 1)\
+        .is_equal_to('given low arg must be less than given high arg')
+
+
+def test_column_unicode_array_is_not_a_column():
+    assert_that(assert_that(array.array('u', 'ab')).is_positive).raises(TypeError).when_called_with()\
+        .is_equal_to('ordering is not defined for type <array>')
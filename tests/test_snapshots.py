@@ -29,6 +29,7 @@
 import os
 import sys
 import shutil
+import subprocess
 import datetime
 import collections
 
@@ -190,3 +191,405 @@ if sys.version_info[0] == 3:
     class Bar(Foo):
         def __eq__(self, other):
             return NotImplemented
+
+
+if sys.version_info[0] == 3:
+    import uuid
+    import decimal
+    import dataclasses
+    from assertpy import snapshot as snapshot_module, add_snapshot_type, remove_snapshot_type
+
+    class Slotted(object):
+        __slots__ = ('x', 'y')
+
+        def __init__(self, x, y):
+            self.x = x
+            self.y = y
+
+        def __eq__(self, other):
+            return type(other) is Slotted and (self.x, self.y) == (other.x, other.y)
+
+    class Point(object):
+        def __init__(self, x, y):
+            self.x = x
+            self.y = y
+
+        def __eq__(self, other):
+            return isinstance(other, Point) and (self.x, self.y) == (other.x, other.y)
+
+    class Point3(Point):
+        pass
+
+    Data = dataclasses.make_dataclass('Data', [('a', int), ('b', list)], namespace={'__module__': __name__})
+
+    def test_snapshot_store_writes_once_on_flush(tmpdir, monkeypatch):
+        snapshot_module._store.flush()
+        loads, saves = [], []
+        real_load, real_save = snapshot_module._load, snapshot_module._save
+        monkeypatch.setattr(snapshot_module, '_load', lambda name, fmt='json': loads.append(name) or real_load(name, fmt))
+        monkeypatch.setattr(snapshot_module, '_save', lambda name, val, fmt='json': saves.append(name) or real_save(name, val, fmt))
+        path = str(tmpdir.join('snaps'))
+        snapname = os.path.join(path, 'snap-test_snapshots.json')
+
+        assert_that(1).snapshot(path=path)
+        assert_that(2).snapshot(path=path)
+        assert_that({'a': (1, 2)}).snapshot(id='tuple', path=path)
+        assert_that(snapname).does_not_exist()
+        assert_that(saves).is_empty()
+
+        snapshot_module._store.flush()
+        assert_that(snapname).is_file()
+        assert_that(saves).is_length(2)
+        snapshot_module._store.flush()
+        assert_that(saves).is_length(2)
+
+        # served from memory, and compared as it will be once loaded (so tuples are lists)
+        assert_that({'a': [1, 2]}).snapshot(id='tuple', path=path)
+        assert_that(loads).is_empty()
+
+        snapshot_module._store.clear()
+        assert_that({'a': [1, 2]}).snapshot(id='tuple', path=path)
+        assert_that(loads).is_length(1)
+
+    def test_snapshot_store_not_serializable(tmpdir):
+        try:
+            assert_that(range(5)).snapshot(id='range', path=str(tmpdir))
+            fail('should have raised error')
+        except TypeError as ex:
+            assert_that(str(ex)).ends_with('is not JSON serializable')
+        assert_that(str(tmpdir.join('snap-range.json'))).does_not_exist()
+
+    def test_snapshot_store_merges_concurrent_writes(tmpdir):
+        path = str(tmpdir)
+        snapname = os.path.join(path, 'snap-test_snapshots.json')
+        assert_that('mine').snapshot(path=path)
+        snapshot_module._store.flush()
+
+        # another worker adds an entry after we loaded the file
+        with open(snapname, 'w') as fp:
+            fp.write('{"1": "theirs", "%s": "mine"}' % list(snapshot_module._store.get(snapname).data)[0])
+        assert_that('mine again').snapshot(path=path)
+        snapshot_module._store.flush()
+
+        data = snapshot_module._load(snapname)
+        assert_that(data).contains_entry({'1': 'theirs'}).contains_value('mine', 'mine again').is_length(3)
+        assert_that(os.listdir(path)).contains_only('snap-test_snapshots.json')
+
+    @pytest.mark.skipif(snapshot_module.fcntl is None, reason='requires fcntl')
+    def test_snapshot_lock_files_removed(tmpdir, monkeypatch):
+        monkeypatch.setenv('ASSERTPY_CACHE_DIR', str(tmpdir.join('cache')))
+        name = str(tmpdir.join('snap-locked.json'))
+        with snapshot_module._locked(name):
+            assert_that(snapshot_module._lock_path(name)).is_file()
+        assert_that(snapshot_module._lock_path(name)).does_not_exist()
+
+    def test_flush_snapshots_before_os_exit(tmpdir):
+        script = '\n'.join([
+            'import os, sys',
+            'sys.path.insert(0, %r)' % os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            'from assertpy import assert_that, flush_snapshots',
+            'assert_that(1).snapshot(id="kept", path=sys.argv[1])',
+            'flush_snapshots()',
+            'assert_that(2).snapshot(id="lost", path=sys.argv[1])',
+            'os._exit(0)',
+        ])
+        assert_that(subprocess.call([sys.executable, '-c', script, str(tmpdir)])).is_equal_to(0)
+        assert_that(os.listdir(str(tmpdir))).is_equal_to(['snap-kept.json'])
+
+    def test_snapshot_store_parallel_workers(tmpdir):
+        script = '\n'.join([
+            'import sys',
+            'sys.path.insert(0, %r)' % os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            'from assertpy import assert_that',
+            'offset = int(sys.argv[1])',
+            'code = "\\n" * offset + "\\n".join("assert_that(%d).snapshot(path=%r)" % (i, sys.argv[2]) for i in range(50))',
+            'exec(compile(code, "test_workers.py", "exec"))',
+        ])
+        procs = [subprocess.Popen([sys.executable, '-c', script, str(i * 50), str(tmpdir)]) for i in range(4)]
+        assert_that([p.wait() for p in procs]).contains_only(0)
+
+        data = snapshot_module._load(str(tmpdir.join('snap-test_workers.json')))
+        assert_that(data).is_length(200)
+
+    def test_snapshot_formats(tmpdir):
+        path = str(tmpdir)
+        val = {'a': [1, 2, 3], 'b': {'x', 'y'}, 'c': 1 + 2j, 'd': datetime.datetime(2000, 11, 22, 3, 44, 55)}
+        for fmt, ext in [('json', '.json'), ('json.gz', '.json.gz'), ('pickle', '.pickle'), ('compact', '.min.json')]:
+            assert_that(val).snapshot(id='fmt', path=path, format=fmt)
+            snapshot_module._store.clear()
+            assert_that(str(tmpdir.join('snap-fmt' + ext))).is_file()
+            assert_that(val).snapshot(id='fmt', path=path, format=fmt)
+            try:
+                assert_that(dict(val, a=[1])).snapshot(id='fmt', path=path, format=fmt)
+                fail('should have raised error')
+            except AssertionError as ex:
+                assert_that(str(ex)).contains('to be equal to')
+
+    def test_snapshot_formats_line_keyed(tmpdir):
+        path = str(tmpdir)
+        assert_that((1, 2)).snapshot(path=path, format='pickle')
+        assert_that([1, 2]).snapshot(path=path, format='json.gz')
+        snapshot_module._store.clear()
+
+        data = snapshot_module._load(str(tmpdir.join('snap-test_snapshots.pickle')), 'pickle')
+        assert_that(list(data.values())).is_equal_to([(1, 2)])
+        data = snapshot_module._load(str(tmpdir.join('snap-test_snapshots.json.gz')), 'json.gz')
+        assert_that(list(data.values())).is_equal_to([[1, 2]])
+
+    def test_snapshot_format_compact_is_minified(tmpdir):
+        assert_that({'a': [1, 2], 'b': None}).snapshot(id='min', path=str(tmpdir), format='compact')
+        snapshot_module._store.flush()
+        assert_that(str(tmpdir.join('snap-min.min.json'))).file_contains('{"a":[1,2],"b":null}')
+
+    def test_snapshot_file_mode_follows_umask(tmpdir):
+        umask = os.umask(0o027)
+        try:
+            assert_that({'a': 1}).snapshot(id='mode', path=str(tmpdir))
+            snapshot_module._store.flush()
+        finally:
+            os.umask(umask)
+        assert_that(os.stat(str(tmpdir.join('snap-mode.json'))).st_mode & 0o777).is_equal_to(0o640)
+        assert_that(os.listdir(str(tmpdir))).is_equal_to(['snap-mode.json'])
+
+    def test_snapshot_format_bad_format(tmpdir):
+        try:
+            assert_that(1).snapshot(path=str(tmpdir), format='xml')
+            fail('should have raised error')
+        except ValueError as ex:
+            assert_that(str(ex)).is_equal_to('given format arg must be one of compact, json, json.gz, or pickle')
+
+    def test_snapshot_index(tmpdir, monkeypatch):
+        path = str(tmpdir)
+        snapname = str(tmpdir.join('snap-test_snapshots.json'))
+
+        def snap(val):
+            assert_that(val).snapshot(path=path)
+
+        val = {'a': [1, 2], 'b': {'x', 'y'}, 'c': 1 + 2j, 'd': datetime.datetime(2000, 11, 22, 3, 44, 55)}
+        snap(val)
+        assert_that('x' * 1000).snapshot(path=path)
+        assert_that(val).snapshot(id='idx', path=path)
+        snapshot_module._store.clear()
+
+        index = snapshot_module._load_index(snapshot_module._index_path(path))
+        assert_that(index).contains_key('snap-test_snapshots.json').does_not_contain_key('snap-idx.json')
+        assert_that(index['snap-test_snapshots.json']['hashes']).is_length(2)
+        assert_that(os.listdir(path)).contains_only('snap-test_snapshots.json', 'snap-idx.json')
+
+        loads = []
+        real_load = snapshot_module._load
+        monkeypatch.setattr(snapshot_module, '_load', lambda name, fmt='json': loads.append(name) or real_load(name, fmt))
+
+        # unchanged, so checked by content hash without loading
+        snap(dict(val, b={'y', 'x'}))
+        assert_that(loads).is_empty()
+
+        # a tuple hashes differently, so the file is loaded and it's compared (and not equal) to the stored list
+        try:
+            snap(dict(val, a=(1, 2)))
+            fail('should have raised error')
+        except AssertionError as ex:
+            assert_that(str(ex)).contains('to be equal to')
+        assert_that(loads).is_equal_to([snapname])
+
+        # loaded, so just compared
+        snap(val)
+        assert_that(loads).is_length(1)
+
+    def test_snapshot_index_stale(tmpdir):
+        path = str(tmpdir)
+        snapname = str(tmpdir.join('snap-test_snapshots.json'))
+
+        def snap(val):
+            assert_that(val).snapshot(path=path)
+
+        snap([1, 2, 3])
+        snapshot_module._store.clear()
+
+        # edited by hand, so the index entry no longer matches the file and is ignored
+        data = snapshot_module._load(snapname)
+        for key in data:
+            data[key] = [1, 2, 3, 4]
+        snapshot_module._save(snapname, data)
+        try:
+            snap([1, 2, 3])
+            fail('should have raised error')
+        except AssertionError as ex:
+            assert_that(str(ex)).contains('to be equal to')
+        snap([1, 2, 3, 4])
+
+        # and is rewritten at the next flush
+        snapshot_module._store.clear()
+        index = snapshot_module._load_index(snapshot_module._index_path(path))
+        assert_that(index['snap-test_snapshots.json']['stat']).is_equal_to(snapshot_module._stat_key(snapname))
+
+    def test_snapshot_digest():
+        digest = snapshot_module._digest
+        assert_that(digest({'a': 1, 'b': [1, 2]})).is_equal_to(digest({'b': [1, 2], 'a': 1}))
+        assert_that(digest({1, 2, 3})).is_equal_to(digest({3, 2, 1}))
+        assert_that(digest([1, 2])).is_not_equal_to(digest((1, 2)))
+        assert_that(digest(1)).is_not_equal_to(digest(1.0)).is_not_equal_to(digest(True)).is_not_equal_to(digest('1'))
+        assert_that(digest({'1': 1})).is_not_equal_to(digest({1: 1}))
+        assert_that(digest(['a', 'b'])).is_not_equal_to(digest(['a\x00', 'b']))
+        assert_that(digest(float('nan'))).is_none()
+        assert_that(digest([Foo()])).is_none()
+
+    def test_snapshot_types(tmpdir):
+        path = str(tmpdir)
+        val = {
+            'decimal': decimal.Decimal('1.10'),
+            'uuid': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            'slotted': Slotted(1, [Slotted(2, 'a')]),
+            'data': Data(1, [2, 3]),
+            'datetime': datetime.datetime(2000, 11, 22, 3, 44, 55, 123456),
+            'seconds': datetime.datetime(2000, 11, 22, 3, 44, 55),
+            'tz': datetime.datetime(2000, 11, 22, 3, 44, 55, tzinfo=datetime.timezone.utc),
+        }
+        assert_that(val).snapshot(id='types', path=path)
+        snapshot_module._store.clear()
+
+        data = snapshot_module._load(str(tmpdir.join('snap-types.json')))
+        assert_that(data).is_equal_to(val)
+        assert_that(data['decimal']).is_instance_of(decimal.Decimal)
+        assert_that(data['datetime'].microsecond).is_equal_to(123456)
+        assert_that(val).snapshot(id='types', path=path)
+
+        # seconds only datetimes are stored in the original format
+        assert_that(str(tmpdir.join('snap-types.json'))).file_contains('"2000-11-22 03:44:55"', '"2000-11-22 03:44:55.123456"')
+
+    def test_snapshot_add_type(tmpdir):
+        path = str(tmpdir)
+        add_snapshot_type(Point, 'point', lambda p: [p.x, p.y], lambda d: Point(d[0], d[1]))
+        try:
+            assert_that([Point(1, 2), Point3(3, 4)]).snapshot(id='point', path=path)
+            snapshot_module._store.clear()
+            assert_that(str(tmpdir.join('snap-point.json'))).file_contains('"__type__": "point"').file_does_not_contain('"instance"')
+
+            # subclasses use the base encoder, so load as the base
+            assert_that([Point(1, 2), Point(3, 4)]).snapshot(id='point', path=path)
+        finally:
+            remove_snapshot_type(Point)
+        assert_that(snapshot_module._resolve(Point)[0]).is_equal_to('instance')
+
+    def test_snapshot_add_type_bad_args():
+        assert_that(add_snapshot_type).raises(TypeError).when_called_with('foo', 'foo', str, str)\
+            .is_equal_to('given cls arg must be a type')
+        assert_that(add_snapshot_type).raises(TypeError).when_called_with(Point, 1, str, str)\
+            .is_equal_to('given tag arg must be a string')
+        assert_that(add_snapshot_type).raises(ValueError).when_called_with(Point, 'instance', str, str)\
+            .is_equal_to('given tag arg must not be <instance>')
+        assert_that(add_snapshot_type).raises(TypeError).when_called_with(Point, 'point', 'foo', str)\
+            .is_equal_to('encode and decode must be callable')
+        assert_that(remove_snapshot_type).raises(TypeError).when_called_with('foo')\
+            .is_equal_to('given cls arg must be a type')
+
+    def test_snapshot_update(tmpdir, monkeypatch):
+        path = str(tmpdir)
+
+        def snap(val, other):
+            assert_that(val).snapshot(path=path)
+            assert_that(other).snapshot(path=path)
+            assert_that(val).snapshot(id='whole', path=path)
+
+        snap([1, 2], 'foo')
+        snapshot_module._store.clear()
+        try:
+            snap([1, 2, 3], 'foo')
+            fail('should have raised error')
+        except AssertionError as ex:
+            assert_that(str(ex)).contains('to be equal to')
+
+        snapshot_module._store.clear()
+        saves = []
+        real_save = snapshot_module._save
+        monkeypatch.setattr(snapshot_module, '_save', lambda name, val, fmt='json': saves.append(name) or real_save(name, val, fmt))
+        monkeypatch.setenv('ASSERTPY_SNAPSHOT_UPDATE', '1')
+        updated = snapshot_module._store.stats['updated']
+        snap([1, 2, 3], 'foo')
+        assert_that(snapshot_module._store.stats['updated'] - updated).is_equal_to(2)
+        snapshot_module._store.clear()
+        assert_that(saves).is_length(2)
+
+        # unchanged, so nothing is rewritten
+        snap([1, 2, 3], 'foo')
+        snapshot_module._store.clear()
+        assert_that(saves).is_length(2)
+
+        monkeypatch.delenv('ASSERTPY_SNAPSHOT_UPDATE')
+        snap([1, 2, 3], 'foo')
+        data = snapshot_module._load(str(tmpdir.join('snap-test_snapshots.json')))
+        assert_that(sorted(data.values(), key=str)).is_equal_to([[1, 2, 3], 'foo'])
+
+    def test_snapshot_unused(tmpdir):
+        path = str(tmpdir)
+
+        def first():
+            assert_that(1).snapshot(path=path)
+
+        def second():
+            assert_that(2).snapshot(path=path)
+
+        first()
+        second()
+        assert_that(1).snapshot(id='used', path=path)
+        assert_that(2).snapshot(id='unused', path=path)
+        snapshot_module._store.clear()
+
+        first()
+        assert_that(1).snapshot(id='used', path=path)
+        unused = [(os.path.basename(p), k) for p, k in snapshot_module._store.unused() if os.path.dirname(p) == path]
+        assert_that(unused).is_equal_to([
+            ('snap-test_snapshots.json', str(second.__code__.co_firstlineno + 1)),
+            ('snap-unused.json', None)])
+
+    def test_snapshot_stats(tmpdir):
+        path = str(tmpdir)
+        before = dict(snapshot_module._store.stats)
+        assert_that([1, 2, 3]).snapshot(id='stats', path=path)
+        snapshot_module._store.clear()
+        assert_that([1, 2, 3]).snapshot(id='stats', path=path)
+        size = os.path.getsize(str(tmpdir.join('snap-stats.json')))
+
+        stats = snapshot_module._store.stats
+        assert_that(stats['written'] - before['written']).is_equal_to(size)
+        assert_that(stats['files_written'] - before['files_written']).is_equal_to(1)
+        assert_that(stats['read'] - before['read']).is_equal_to(size)
+        assert_that(stats['files_read'] - before['files_read']).is_equal_to(1)
+
+    def test_snapshot_pytest_plugin_update(tmpdir):
+        tmpdir.join('test_plugin.py').write('\n'.join([
+            'import os',
+            'from assertpy import assert_that',
+            'def test_one():',
+            '    assert_that(os.environ["VAL"]).snapshot()',
+            '',
+        ]))
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+        def run(val, *args):
+            env = dict(os.environ, VAL=val, PYTHONPATH=root)
+            env.pop('ASSERTPY_SNAPSHOT_UPDATE', None)
+            proc = subprocess.Popen([sys.executable, '-m', 'pytest', '-p', 'assertpy.pytest_plugin', '-p', 'no:cacheprovider'] + list(args),
+                                    cwd=str(tmpdir), env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+            out = proc.communicate()[0].decode('utf-8')
+            return proc.returncode, out
+
+        assert_that(run('foo')[0]).is_zero()
+        assert_that(run('bar')[0]).is_equal_to(1)
+        code, out = run('bar', '--snapshot-update')
+        assert_that(code).is_zero()
+        assert_that(out).contains('assertpy snapshots', 'updated 1 snapshots')
+        assert_that(run('bar')[0]).is_zero()
+
+    def test_snapshot_index_read_only_cache(tmpdir, monkeypatch):
+        path = str(tmpdir.mkdir('snaps'))
+        cache = tmpdir.mkdir('cache')
+        monkeypatch.setenv('ASSERTPY_CACHE_DIR', str(cache))
+        assert_that('foo').snapshot(path=path)
+        snapshot_module._store.clear()
+        assert_that(snapshot_module._index_path(path)).is_file().is_child_of(str(cache))
+
+        # can't be written, so skipped
+        monkeypatch.setenv('ASSERTPY_CACHE_DIR', str(tmpdir.join('cache', 'snapshot-index', os.path.basename(snapshot_module._index_path(path)))))
+        assert_that('bar').snapshot(path=path)
+        snapshot_module._store.clear()
@@ -26,6 +26,8 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import threading
+
 from assertpy import assert_that, soft_assertions, fail
 
 
@@ -188,6 +190,23 @@ def test_nested():
         assert_that(out).contains('5. Expected <a> to be equal to <A2>, but was not.')
 
 
+def test_nested_exits_with_caught_error():
+    try:
+        with soft_assertions():
+            try:
+                with soft_assertions():
+                    assert_that(3).is_equal_to(4)
+                    raise KeyError('foo')
+            except KeyError:
+                pass
+            assert_that(1).is_equal_to(2)
+        fail('should have raised error')
+    except AssertionError as e:
+        out = str(e)
+        assert_that(out).contains('1. Expected <3> to be equal to <4>, but was not.')
+        assert_that(out).contains('2. Expected <1> to be equal to <2>, but was not.')
+
+
 def test_recursive_nesting():
     def recurs(i):
         if i <= 0:
@@ -205,3 +224,19 @@ def test_recursive_nesting():
         assert_that(out).contains('4. Expected <4> to be equal to <7>, but was not.')
         assert_that(out).contains('5. Expected <5> to be equal to <7>, but was not.')
         assert_that(out).contains('6. Expected <6> to be equal to <7>, but was not.')
+
+
+def test_thread_outside_ctx_is_not_soft():
+    errors = []
+
+    def worker():
+        try:
+            assert_that('foo').is_equal_to('bar')
+        except AssertionError as e:
+            errors.append(str(e))
+
+    with soft_assertions():
+        t = threading.Thread(target=worker)
+        t.start()
+        t.join()
+    assert_that(errors).is_equal_to(['Expected <foo> to be equal to <bar>, but was not.'])
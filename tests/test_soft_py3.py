@@ -0,0 +1,96 @@
+# Copyright (c) 2015-2019, Activision Publishing, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+# may be used to endorse or promote products derived from this software without
+# specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON
+# ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import sys
+import threading
+
+import pytest
+from assertpy import assert_that, soft_assertions, soft_fail
+
+
+def test_threads_isolated():
+    barrier = threading.Barrier(4)
+    results = {}
+
+    def worker(n):
+        try:
+            with soft_assertions():
+                barrier.wait()
+                assert_that(n).is_equal_to(-1)
+                soft_fail('worker %d' % n)
+                barrier.wait()
+            results[n] = 'should have raised error'
+        except AssertionError as e:
+            results[n] = str(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    for n in range(4):
+        assert_that(results[n]).is_equal_to('soft assertion failures:\n1. Expected <%d> to be equal to <-1>, but was not.\n'
+                                            '2. Fail: worker %d!' % (n, n))
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason='requires contextvars')
+def test_asyncio_tasks_isolated():
+    import asyncio
+
+    async def task(n, started):
+        try:
+            async with soft_assertions():
+                assert_that(n).is_equal_to(-1)
+                started.append(n)
+                while len(started) < 3:
+                    await asyncio.sleep(0)
+            return 'should have raised error'
+        except AssertionError as e:
+            return str(e)
+
+    async def main():
+        started = []
+        return await asyncio.gather(*[task(n, started) for n in range(3)])
+
+    results = asyncio.run(main())
+    for n in range(3):
+        assert_that(results[n]).is_equal_to('soft assertion failures:\n1. Expected <%d> to be equal to <-1>, but was not.' % n)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason='requires contextvars')
+def test_async_with_success():
+    import asyncio
+
+    async def main():
+        async with soft_assertions():
+            assert_that('foo').is_length(3)
+        return 'ok'
+
+    assert_that(asyncio.run(main())).is_equal_to('ok')
@@ -0,0 +1,176 @@
+# Copyright (c) 2015-2019, Activision Publishing, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+# may be used to endorse or promote products derived from this software without
+# specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON
+# ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from assertpy import assert_that, stream, fail
+
+
+def gen(n):
+    for i in range(n):
+        yield i
+
+
+def test_stream_is_length():
+    assert_that(stream(gen(1000000))).is_length(1000000)
+    assert_that(stream([])).is_length(0)
+
+
+def test_stream_is_length_failure():
+    try:
+        assert_that(stream(gen(20))).is_length(3)
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).is_equal_to('Expected <stream([..., 10, 11, 12, 13, 14, 15, 16, 17, 18, 19])> to be of length <3>, but was <20>.')
+
+
+def test_stream_is_empty():
+    assert_that(stream(gen(0))).is_empty()
+    assert_that(stream(gen(5))).is_not_empty()
+
+
+def test_stream_is_empty_failure():
+    try:
+        assert_that(stream(gen(5))).is_empty()
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).is_equal_to('Expected <stream([0, ...])> to be empty, but was not.')
+
+
+def test_stream_is_not_empty_failure():
+    try:
+        assert_that(stream(gen(0))).is_not_empty()
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).is_equal_to('Expected not empty, but was empty.')
+
+
+def test_stream_contains():
+    assert_that(stream(gen(1000000))).contains(5)
+    assert_that(stream(gen(1000000))).contains(5, 3, 999999, 3)
+    assert_that(stream(iter([[1], 2, {'a': 1}]))).contains([1], {'a': 1})
+    assert_that(stream(gen(10))).does_not_contain(-1)
+    assert_that(stream(gen(10))).does_not_contain(-1, -2, [3])
+
+
+def test_stream_contains_stops_early():
+    s = stream(gen(1000000))
+    assert_that(s).contains(2, 1)
+    assert_that(s.count).is_equal_to(3)
+
+
+def test_stream_contains_failure():
+    try:
+        assert_that(stream(gen(3))).contains(1, 4, 5)
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).is_equal_to('Expected <stream([0, 1, 2])> to contain items <1, 4, 5>, but did not contain <4, 5>.')
+
+
+def test_stream_does_not_contain_failure():
+    try:
+        assert_that(stream(gen(3))).does_not_contain(1, 4, 2)
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).is_equal_to('Expected <stream([0, 1, 2])> to not contain items <1, 4, 2>, but did contain <1, 2>.')
+
+
+def test_stream_contains_sequence():
+    assert_that(stream(gen(1000))).contains_sequence(500, 501, 502)
+
+
+def test_stream_duplicates():
+    assert_that(stream(iter([1, 2, 1]))).contains_duplicates()
+    assert_that(stream(gen(1000))).does_not_contain_duplicates()
+
+
+def test_stream_duplicates_failure():
+    try:
+        assert_that(stream(gen(3))).contains_duplicates()
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).is_equal_to('Expected <stream([0, 1, 2])> to contain duplicates, but did not.')
+    try:
+        assert_that(stream(iter([1, 2, 1, 3]))).does_not_contain_duplicates()
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).is_equal_to('Expected <stream([1, 2, 1, ...])> to not contain duplicates, but did.')
+
+
+def test_stream_is_sorted():
+    assert_that(stream(x * x for x in range(100000))).is_sorted()
+
+
+def test_stream_is_sorted_failure():
+    try:
+        assert_that(stream(iter([1, 2, 3, 4, 5, 0, 6]), window=4)).is_sorted()
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).is_equal_to('Expected <stream([..., 3, 4, 5, 0, ...])> to be sorted, but subset <5, 0> at index 4 is not.')
+
+
+def test_stream_is_sorted_failure_at_last_item():
+    try:
+        assert_that(stream(iter([3, 1]))).is_sorted()
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).is_equal_to('Expected <stream([3, 1])> to be sorted, but subset <3, 1> at index 0 is not.')
+
+
+def test_stream_starts_ends_with():
+    assert_that(stream(gen(100))).starts_with(0)
+    assert_that(stream(gen(100))).ends_with(99)
+
+
+def test_stream_ends_with_failure():
+    try:
+        assert_that(stream(gen(100), window=2)).ends_with(0)
+        fail('should have raised error')
+    except AssertionError as ex:
+        assert_that(str(ex)).is_equal_to('Expected stream([..., 98, 99]) to end with <0>, but did not.')
+
+
+def test_stream_ends_with_empty():
+    assert_that(assert_that(stream(gen(0))).ends_with).raises(ValueError).when_called_with(1)\
+        .is_equal_to('val must not be empty')
+
+
+def test_stream_consumed_once():
+    s = stream(gen(5))
+    assert_that(s).is_length(5)
+    assert_that(assert_that(s).is_length).raises(ValueError).when_called_with(5)\
+        .is_equal_to('stream already consumed, only one assertion can consume a stream')
+
+
+def test_stream_extracting():
+    assert_that(stream({'a': i} for i in range(3))).extracting('a').is_equal_to([0, 1, 2])
+
+
+def test_stream_bad_args():
+    assert_that(stream).raises(TypeError).when_called_with(123).is_equal_to("'int' object is not iterable")
+    assert_that(stream).raises(TypeError).when_called_with([], window='foo').is_equal_to('given window arg must be an int')
+    assert_that(stream).raises(ValueError).when_called_with([], window=0).is_equal_to('given window arg must be a positive int')